@@ -4,7 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.auth.security import verify_jwt_token
 from app.common.schema.common_schema import DeleteResponse, PostResponse, PutResponse
-from app.module.asset.enum import AccountType, AssetType, InvestmentBankType
+from app.module.asset.dataclass import PortfolioSnapshot
+from app.module.asset.enum import AccountType, InvestmentBankType
 from app.module.asset.model import Asset, AssetField, Stock
 from app.module.asset.repository.asset_field_repository import AssetFieldRepository
 from app.module.asset.repository.asset_repository import AssetRepository
@@ -22,13 +23,13 @@ from app.module.asset.schema import (
 from app.module.asset.services.asset_field_service import AssetFieldService
 from app.module.asset.services.asset_service import AssetService
 from app.module.asset.services.asset_stock_service import AssetStockService
-from app.module.asset.services.dividend_service import DividendService
-from app.module.asset.services.exchange_rate_service import ExchangeRateService
-from app.module.asset.services.stock_daily_service import StockDailyService
+from app.module.asset.services.portfolio_snapshot_service import PortfolioSnapshotService
 from app.module.asset.services.stock_service import StockService
+from app.module.asset.services.valuation_service import ValuationService
 from app.module.auth.constant import DUMMY_USER_ID
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
 from app.module.auth.schema import AccessToken
+from app.module.chart.service.portfolio_history_service import PortfolioHistoryService
 from database.dependency import get_mysql_session_router, get_redis_pool
 
 asset_stock_router = APIRouter(prefix="/v1")
@@ -77,16 +78,16 @@ async def get_stock_list(session: AsyncSession = Depends(get_mysql_session_route
 async def get_sample_asset_stock(
     session: AsyncSession = Depends(get_mysql_session_router), redis_client: Redis = Depends(get_redis_pool)
 ) -> AssetStockResponse:
-    assets: list[Asset] = await AssetRepository.get_eager(session, DUMMY_USER_ID, AssetType.STOCK)
+    snapshot: PortfolioSnapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+    assets: list[Asset] = snapshot.assets
     validation_response = AssetStockResponse.validate_assets(assets)
     if validation_response:
         return validation_response
 
-    stock_daily_map = await StockDailyService.get_map_range(session, assets)
-    lastest_stock_daily_map = await StockDailyService.get_latest_map(session, assets)
-    dividend_map = await DividendService.get_recent_map(session, assets)
-    exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
-    current_stock_price_map = await StockService.get_current_stock_price(redis_client, lastest_stock_daily_map, assets)
+    stock_daily_map = snapshot.stock_daily_map
+    dividend_map = snapshot.dividend_map
+    exchange_rate_map = snapshot.exchange_rate_map
+    current_stock_price_map = snapshot.current_stock_price_map
 
     not_found_stock_codes: list[str] = StockService.check_not_found_stock(
         stock_daily_map, current_stock_price_map, assets
@@ -100,9 +101,13 @@ async def get_sample_asset_stock(
         session, DUMMY_USER_ID, assets, stock_daily_map, current_stock_price_map, dividend_map, exchange_rate_map
     )
 
-    total_asset_amount = AssetStockService.get_total_asset_amount(assets, current_stock_price_map, exchange_rate_map)
-    total_invest_amount = AssetStockService.get_total_investment_amount(assets, stock_daily_map, exchange_rate_map)
-    total_dividend_amount = DividendService.get_total_dividend(assets, dividend_map, exchange_rate_map)
+    total_asset_amount = ValuationService.get_total_asset_amount(
+        snapshot.holdings, current_stock_price_map, exchange_rate_map
+    )
+    total_invest_amount = ValuationService.get_total_investment_amount(
+        snapshot.holdings, stock_daily_map, exchange_rate_map
+    )
+    total_dividend_amount = ValuationService.get_total_dividend(snapshot.holdings, dividend_map, exchange_rate_map)
 
     return AssetStockResponse.parse(stock_assets, total_asset_amount, total_invest_amount, total_dividend_amount)
 
@@ -113,17 +118,16 @@ async def get_asset_stock(
     redis_client: Redis = Depends(get_redis_pool),
     session: AsyncSession = Depends(get_mysql_session_router),
 ) -> AssetStockResponse:
-    assets: list[Asset] = await AssetRepository.get_eager(session, token.get("user"), AssetType.STOCK)
-
+    snapshot: PortfolioSnapshot = await PortfolioSnapshotService.get(session, redis_client, token.get("user"))
+    assets: list[Asset] = snapshot.assets
     validation_response = AssetStockResponse.validate_assets(assets)
     if validation_response:
         return validation_response
 
-    stock_daily_map = await StockDailyService.get_map_range(session, assets)
-    lastest_stock_daily_map = await StockDailyService.get_latest_map(session, assets)
-    dividend_map = await DividendService.get_recent_map(session, assets)
-    exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
-    current_stock_price_map = await StockService.get_current_stock_price(redis_client, lastest_stock_daily_map, assets)
+    stock_daily_map = snapshot.stock_daily_map
+    dividend_map = snapshot.dividend_map
+    exchange_rate_map = snapshot.exchange_rate_map
+    current_stock_price_map = snapshot.current_stock_price_map
 
     not_found_stock_codes: list[str] = StockService.check_not_found_stock(
         stock_daily_map, current_stock_price_map, assets
@@ -137,9 +141,13 @@ async def get_asset_stock(
         session, token.get("user"), assets, stock_daily_map, current_stock_price_map, dividend_map, exchange_rate_map
     )
 
-    total_asset_amount = AssetStockService.get_total_asset_amount(assets, current_stock_price_map, exchange_rate_map)
-    total_invest_amount = AssetStockService.get_total_investment_amount(assets, stock_daily_map, exchange_rate_map)
-    total_dividend_amount = DividendService.get_total_dividend(assets, dividend_map, exchange_rate_map)
+    total_asset_amount = ValuationService.get_total_asset_amount(
+        snapshot.holdings, current_stock_price_map, exchange_rate_map
+    )
+    total_invest_amount = ValuationService.get_total_investment_amount(
+        snapshot.holdings, stock_daily_map, exchange_rate_map
+    )
+    total_dividend_amount = ValuationService.get_total_dividend(snapshot.holdings, dividend_map, exchange_rate_map)
 
     return AssetStockResponse.parse(stock_assets, total_asset_amount, total_invest_amount, total_dividend_amount)
 
@@ -148,6 +156,7 @@ async def get_asset_stock(
 async def create_asset_stock(
     request_data: AssetStockPostRequest,
     token: AccessToken = Depends(verify_jwt_token),
+    redis_client: Redis = Depends(get_redis_pool),
     session: AsyncSession = Depends(get_mysql_session_router),
 ) -> PostResponse:
     stock = await StockRepository.get_by_code(session, request_data.stock_code)
@@ -155,6 +164,8 @@ async def create_asset_stock(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{request_data.stock_code}를 찾지 못 했습니다.")
 
     await AssetStockService.save_asset_stock_by_post(session, request_data, stock.id, token.get("user"))
+    await PortfolioSnapshotService.invalidate(redis_client, token.get("user"))
+    await PortfolioHistoryService.invalidate(session, token.get("user"), request_data.buy_date)
     return PostResponse(status_code=status.HTTP_201_CREATED, content="주식 자산 성공적으로 등록 했습니다.")
 
 
@@ -162,6 +173,7 @@ async def create_asset_stock(
 async def update_asset_stock(
     request_data: AssetStockPutRequest,
     token: AccessToken = Depends(verify_jwt_token),
+    redis_client: Redis = Depends(get_redis_pool),
     session: AsyncSession = Depends(get_mysql_session_router),
 ) -> PutResponse:
     asset = await AssetRepository.get_asset_by_id(session, request_data.id)
@@ -172,7 +184,11 @@ async def update_asset_stock(
     if stock is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{request_data.stock_code}를 찾지 못 했습니다.")
 
+    # 매입일을 바꾼 경우 이전 매입일부터의 평가금도 달라지므로, 두 날짜 중 이른 날부터 지웁니다.
+    invalidate_from_date = min(asset.asset_stock.purchase_date, request_data.buy_date)
     await AssetService.save_asset_by_put(session, request_data, asset, stock.id)
+    await PortfolioSnapshotService.invalidate(redis_client, token.get("user"))
+    await PortfolioHistoryService.invalidate(session, token.get("user"), invalidate_from_date)
     return PutResponse(status_code=status.HTTP_200_OK, content="주식 자산을 성공적으로 수정 하였습니다.")
 
 
@@ -180,10 +196,13 @@ async def update_asset_stock(
 async def delete_asset_stock(
     asset_id: int,
     token: AccessToken = Depends(verify_jwt_token),
+    redis_client: Redis = Depends(get_redis_pool),
     session: AsyncSession = Depends(get_mysql_session_router),
 ) -> DeleteResponse:
     try:
-        await AssetRepository.delete_asset(session, asset_id)
+        asset = await AssetRepository.delete_asset(session, asset_id)
+        await PortfolioSnapshotService.invalidate(redis_client, token.get("user"))
+        await PortfolioHistoryService.invalidate(session, token.get("user"), asset.asset_stock.purchase_date)
         return DeleteResponse(status_code=status.HTTP_200_OK, content="주식 자산이 성공적으로 삭제 되었습니다.")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
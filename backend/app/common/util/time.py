@@ -9,6 +9,11 @@ def get_now_datetime():
     return datetime.now(seoul_tz).replace(second=0, microsecond=0)
 
 
+def get_bucket_datetime(target_datetime: datetime, minute: int) -> datetime | None:
+    # 분 단위 구간의 경계 시각이면 그대로, 아니면 None을 반환합니다.
+    return target_datetime if target_datetime.minute % minute == 0 else None
+
+
 def start_timestamp(year: int, month: int) -> int:
     date = datetime(year, month, 1, 0, 0)
     return int(time.mktime(date.timetuple()))
@@ -53,3 +53,7 @@ else:
     SWITZERLAND_STOCK_FILEPATH = getenv("SWITZERLAND_STOCK_FILEPATH", None)
     UK_STOCK_FILEPATH = getenv("UK_STOCK_FILEPATH", None)
     S3_BUCKET_STOCK_FILES = getenv("S3_BUCKET_STOCK_FILES", None)
+
+STOCK_UNIVERSE_CACHE_DIR = getenv("STOCK_UNIVERSE_CACHE_DIR", "/tmp/stock_universe")
+# 값이 있으면 S3 대신 해당 디렉토리를 버킷처럼 사용합니다.
+STOCK_FILE_STORAGE_DIR = getenv("STOCK_FILE_STORAGE_DIR", None)
@@ -1,4 +1,23 @@
-STOCK_CHUNK_SIZE = 2
 REALTIME_BULK_SIZE = 100
 STOCK_CACHE_SECOND = 60 * 60 * 24 * 7
 MARKET_INDEX_CACHE_SECOND = 60 * 60 * 24 * 7
+PORTFOLIO_DAILY_USER_CHUNK_SIZE = 100
+PORTFOLIO_DAILY_CHECKPOINT_KEY_PREFIX = "portfolio_daily_checkpoint"
+PORTFOLIO_DAILY_CHECKPOINT_EXPIRE_SECOND = 60 * 60 * 24 * 2
+MINUTELY_RETENTION_DAYS = 14
+MINUTELY_PARTITION_PRECREATE_DAYS = 7
+SUPERVISOR_CHECK_SECOND = 10
+SUPERVISOR_STALE_SECOND = 120
+SUPERVISOR_RESHARD_SECOND = 60 * 60
+SUPERVISOR_RESTART_BACKOFF_SECOND = 5
+SUPERVISOR_MAX_BACKOFF_SECOND = 60 * 5
+COLLECTOR_HEALTH_KEY_PREFIX = "collector_health"
+COLLECTOR_HEALTH_EXPIRE_SECOND = 60
+NAVER_STOCK_CONCURRENCY = 20
+NAVER_PARSE_WORKER_COUNT = 4
+NAVER_REQUEST_TIMEOUT_SECOND = 2
+NAVER_WORLD_REQUEST_TIMEOUT_SECOND = 5
+NAVER_BROWSER_WAIT_SECOND = 10
+NAVER_INDEX_RETRY_COUNT = 3
+NAVER_INDEX_BACKOFF_SECOND = 1
+STOCK_UNIVERSE_SNAPSHOT_VERSION = "1"
@@ -0,0 +1,22 @@
+import asyncio
+from dataclasses import dataclass
+
+
+@dataclass
+class ShardState:
+    index: int
+    stock_code_map: dict[str, str]
+    task: asyncio.Task | None = None
+    started_at: float = 0.0
+    last_success_at: float | None = None
+    restart_count: int = 0
+    failure_count: int = 0
+    next_restart_at: float = 0.0
+    last_error: str | None = None
+
+
+@dataclass
+class MarketIndexValue:
+    current_value: str
+    change_value: str
+    change_percent: str
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+
+import pandas as pd
+from icecream import ic
+
+from app.data.common.constant import STOCK_UNIVERSE_SNAPSHOT_VERSION
+from app.module.asset.schema import StockInfo
+
+STOCK_FILE_COLUMNS = ["Symbol", "Company Name", "Country", "Code"]
+SNAPSHOT_COLUMNS = ["code", "name", "country", "market_index"]
+
+
+class StockFileStorage(ABC):
+    @abstractmethod
+    def get_checksum(self, key: str) -> str:
+        pass
+
+    @abstractmethod
+    def download(self, key: str, local_path: str) -> None:
+        pass
+
+
+class S3StockFileStorage(StockFileStorage):
+    def __init__(self, s3_client, bucket: str):
+        self.s3_client = s3_client
+        self.bucket = bucket
+
+    def get_checksum(self, key: str) -> str:
+        # 파일을 받지 않고 ETag만 조회해 변경 여부를 판단합니다.
+        return self.s3_client.head_object(Bucket=self.bucket, Key=key)["ETag"].strip('"')
+
+    def download(self, key: str, local_path: str) -> None:
+        self.s3_client.download_file(self.bucket, key, local_path)
+
+
+class LocalStockFileStorage(StockFileStorage):
+    """로컬 디렉토리를 S3 버킷처럼 사용하는 저장소입니다. 개발 환경과 오프라인 테스트에서 사용합니다."""
+
+    def __init__(self, root_dir: str = ""):
+        self.root_dir = root_dir
+
+    def get_checksum(self, key: str) -> str:
+        with open(self._get_path(key), "rb") as file:
+            return hashlib.md5(file.read()).hexdigest()
+
+    def download(self, key: str, local_path: str) -> None:
+        shutil.copyfile(self._get_path(key), local_path)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.root_dir, key)
+
+
+class StockUniverseCache:
+    """종목 엑셀 파일들을 하나의 parquet 스냅샷으로 묶어 보관합니다.
+
+    스냅샷 파일명에 원본 파일들의 체크섬을 넣어, 엑셀 파일이 바뀐 경우에만 다시 만듭니다.
+    """
+
+    def __init__(self, storage: StockFileStorage, cache_dir: str):
+        self.storage = storage
+        self.cache_dir = cache_dir
+
+    def get_stock_code_list_bundle(self, keys: list[str]) -> list[list[StockInfo]]:
+        df = self._load_snapshot(keys)
+        file_indexes = df["file_index"].to_numpy()
+        stock_infos = self._get_stock_infos(df)
+        bundle: list[list[StockInfo]] = [[] for _ in keys]
+        for file_index, stock_info in zip(file_indexes, stock_infos):
+            bundle[file_index].append(stock_info)
+        return bundle
+
+    def get_stock_code_list(self, keys: list[str], selected_key: str | None = None) -> list[StockInfo]:
+        df = self._load_snapshot(keys)
+        if selected_key is not None:
+            df = df[df["file_index"] == keys.index(selected_key)]
+        return self._get_stock_infos(df)
+
+    def get_snapshot_path(self, keys: list[str]) -> str:
+        digest = hashlib.sha256(STOCK_UNIVERSE_SNAPSHOT_VERSION.encode())
+        for key in keys:
+            digest.update(f"{key}:{self.storage.get_checksum(key)}\n".encode())
+        return os.path.join(self.cache_dir, f"stock_universe_{digest.hexdigest()[:16]}.parquet")
+
+    def _load_snapshot(self, keys: list[str]) -> pd.DataFrame:
+        snapshot_path = self.get_snapshot_path(keys)
+        if os.path.exists(snapshot_path):
+            return pd.read_parquet(snapshot_path)
+
+        ic(f"[StockUniverseCache] 종목 파일이 변경되어 스냅샷을 새로 만듭니다: {snapshot_path}")
+        df = self._build_snapshot(keys)
+        self._save_snapshot(df, snapshot_path)
+        return df
+
+    def _build_snapshot(self, keys: list[str]) -> pd.DataFrame:
+        dfs = []
+        with tempfile.TemporaryDirectory() as download_dir:
+            for file_index, key in enumerate(keys):
+                local_path = os.path.join(download_dir, f"{file_index}_{os.path.basename(key)}")
+                self.storage.download(key, local_path)
+                df = self._read_stock_file(local_path)
+                df.insert(0, "file_index", file_index)
+                dfs.append(df)
+        return pd.concat(dfs, ignore_index=True)
+
+    def _save_snapshot(self, df: pd.DataFrame, snapshot_path: str) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # 여러 작업이 동시에 만들더라도 완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체합니다.
+        temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, snapshot_path)
+
+        for filename in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, filename)
+            if filename.startswith("stock_universe_") and filename.endswith(".parquet") and path != snapshot_path:
+                os.remove(path)
+
+    @staticmethod
+    def _read_stock_file(filepath: str) -> pd.DataFrame:
+        try:
+            df = pd.read_excel(filepath, usecols=STOCK_FILE_COLUMNS, header=0, dtype={"Symbol": str})
+        except Exception as e:
+            ic(f"Unexpected error: {e}")
+            raise
+
+        # 기존과 같이 모든 값을 문자열로 저장합니다. 빈 값은 "nan"이 됩니다.
+        df = df[STOCK_FILE_COLUMNS].astype(str)
+        df.columns = SNAPSHOT_COLUMNS
+        return df
+
+    @staticmethod
+    def _get_stock_infos(df: pd.DataFrame) -> list[StockInfo]:
+        # 행 단위 itertuples 대신 컬럼을 한 번에 꺼내 만듭니다.
+        return [
+            StockInfo(code=code, name=name, country=country, market_index=market_index)
+            for code, name, country, market_index in zip(*(df[column].tolist() for column in SNAPSHOT_COLUMNS))
+        ]
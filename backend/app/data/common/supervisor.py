@@ -0,0 +1,162 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+
+from icecream import ic
+from more_itertools import chunked
+from redis.asyncio import Redis
+
+from app.data.common.constant import (
+    COLLECTOR_HEALTH_EXPIRE_SECOND,
+    COLLECTOR_HEALTH_KEY_PREFIX,
+    SUPERVISOR_CHECK_SECOND,
+    SUPERVISOR_MAX_BACKOFF_SECOND,
+    SUPERVISOR_RESHARD_SECOND,
+    SUPERVISOR_RESTART_BACKOFF_SECOND,
+    SUPERVISOR_STALE_SECOND,
+)
+from app.data.common.dataclass import ShardState
+from app.module.asset.redis_repository import RedisCollectorHealthRepository
+
+LoadUniverse = Callable[[], dict[str, str]]
+RunShard = Callable[[dict[str, str], Callable[[], None]], Awaitable[None]]
+
+
+class CollectorSupervisor:
+    def __init__(
+        self,
+        name: str,
+        load_universe: LoadUniverse,
+        run_shard: RunShard,
+        redis_client: Redis,
+        shard_size: int,
+        stale_second: float = SUPERVISOR_STALE_SECOND,
+        reshard_second: float = SUPERVISOR_RESHARD_SECOND,
+        restart_backoff_second: float = SUPERVISOR_RESTART_BACKOFF_SECOND,
+    ):
+        self.name = name
+        self.load_universe = load_universe
+        self.run_shard = run_shard
+        self.redis_client = redis_client
+        self.shard_size = shard_size
+        self.stale_second = stale_second
+        self.reshard_second = reshard_second
+        self.restart_backoff_second = restart_backoff_second
+
+        self.universe: dict[str, str] = {}
+        self.shards: list[ShardState] = []
+        self.loaded_at = 0.0
+
+    async def run(self) -> None:
+        await self.reload_universe()
+        try:
+            while True:
+                await asyncio.sleep(SUPERVISOR_CHECK_SECOND)
+                await self.check()
+        finally:
+            await self.stop()
+
+    async def check(self) -> None:
+        now = self._now()
+        for shard in self.shards:
+            self._supervise_shard(shard, now)
+
+        if now - self.loaded_at >= self.reshard_second:
+            try:
+                await self.reload_universe()
+            except Exception as e:
+                # 종목 파일을 읽지 못하면 기존 샤드로 계속 수집하고, 다음 주기에 다시 시도합니다.
+                self.loaded_at = now
+                ic(f"[{self.name}] 종목 목록을 다시 읽지 못해 기존 샤드를 유지합니다: {e}")
+
+        await self.report_health()
+
+    async def reload_universe(self) -> None:
+        # 종목 파일 읽기는 블로킹 I/O이므로 스레드에서 실행합니다.
+        universe = await asyncio.to_thread(self.load_universe)
+        self.loaded_at = self._now()
+        if universe == self.universe and self.shards:
+            return
+
+        ic(f"[{self.name}] 종목 {len(self.universe)}건 -> {len(universe)}건으로 샤드를 다시 나눕니다.")
+        await self.stop()
+        self.universe = universe
+        self.shards = [
+            ShardState(index=index, stock_code_map=dict(items))
+            for index, items in enumerate(chunked(sorted(universe.items()), self.shard_size))
+        ]
+        for shard in self.shards:
+            self._start_shard(shard)
+
+    async def stop(self) -> None:
+        tasks = [shard.task for shard in self.shards if shard.task is not None and not shard.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def report_health(self) -> None:
+        now = self._now()
+        health = {
+            "universe_size": len(self.universe),
+            "shards": [
+                {
+                    "index": shard.index,
+                    "size": len(shard.stock_code_map),
+                    "alive": shard.task is not None and not shard.task.done(),
+                    "restart_count": shard.restart_count,
+                    "last_success_second_ago": (
+                        round(now - shard.last_success_at, 1) if shard.last_success_at is not None else None
+                    ),
+                    "last_error": shard.last_error,
+                }
+                for shard in self.shards
+            ],
+        }
+        try:
+            await RedisCollectorHealthRepository.save(
+                self.redis_client,
+                f"{COLLECTOR_HEALTH_KEY_PREFIX}:{self.name}",
+                json.dumps(health),
+                expire_time=COLLECTOR_HEALTH_EXPIRE_SECOND,
+            )
+        except Exception as e:
+            ic(f"[{self.name}] 상태 보고에 실패했습니다: {e}")
+
+    def _supervise_shard(self, shard: ShardState, now: float) -> None:
+        if shard.task is not None and not shard.task.done():
+            last_active_at = max(shard.started_at, shard.last_success_at or 0.0)
+            if now - last_active_at < self.stale_second:
+                return
+
+            # 예외 없이 멈춘 샤드도 일정 시간 응답이 없으면 재시작합니다.
+            shard.task.cancel()
+            shard.last_error = f"{self.stale_second}초 동안 수집에 성공하지 못했습니다."
+            shard.next_restart_at = now
+            ic(f"[{self.name}] {shard.index}번 샤드가 멈춰 재시작합니다.")
+            return
+
+        if shard.task is not None and not shard.task.cancelled() and shard.task.exception() is not None:
+            shard.last_error = repr(shard.task.exception())
+            # 연속으로 실패할수록 재시작 간격을 늘립니다.
+            backoff_second = min(self.restart_backoff_second * 2**shard.failure_count, SUPERVISOR_MAX_BACKOFF_SECOND)
+            shard.failure_count += 1
+            shard.next_restart_at = now + backoff_second
+            shard.task = None
+            ic(f"[{self.name}] {shard.index}번 샤드가 종료되었습니다({shard.last_error}). {backoff_second}초 후 재시작합니다.")
+            return
+
+        if now >= shard.next_restart_at:
+            shard.restart_count += 1
+            self._start_shard(shard)
+
+    def _start_shard(self, shard: ShardState) -> None:
+        def heartbeat() -> None:
+            shard.last_success_at = self._now()
+            shard.failure_count = 0
+
+        shard.started_at = self._now()
+        shard.task = asyncio.create_task(self.run_shard(shard.stock_code_map, heartbeat))
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
@@ -0,0 +1,43 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.config import MYSQL_URL
+
+print("[add_minutely_bucket] 분 단위 시세 테이블에 bucket 컬럼 추가를 시도 합니다.")
+
+MINUTELY_KEY_COLUMN_MAP = {"stock_minutely": "code", "market_index_minutely": "name"}
+
+
+def main():
+    if MYSQL_URL is None:
+        print(f"[add_minutely_bucket] MYSQL_URL가 정의 되어 있지 않습니다., {MYSQL_URL=}")
+        return
+
+    sync_mysql_url = MYSQL_URL.replace("mysql+aiomysql", "mysql+mysqlconnector")
+    sync_engine = create_engine(sync_mysql_url)
+
+    for table_name, key_column in MINUTELY_KEY_COLUMN_MAP.items():
+        try:
+            with sync_engine.begin() as connection:
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table_name} "
+                        "ADD COLUMN bucket_30m DATETIME NULL, ADD COLUMN bucket_1h DATETIME NULL, "
+                        f"ADD INDEX idx_{key_column}_bucket_30m ({key_column}, bucket_30m, datetime), "
+                        f"ADD INDEX idx_{key_column}_bucket_1h ({key_column}, bucket_1h, datetime)"
+                    )
+                )
+                connection.execute(
+                    text(
+                        f"UPDATE {table_name} SET "
+                        "bucket_30m = IF(MINUTE(datetime) % 30 = 0, datetime, NULL), "
+                        "bucket_1h = IF(MINUTE(datetime) = 0, datetime, NULL)"
+                    )
+                )
+            print(f"[add_minutely_bucket] {table_name} bucket 컬럼을 추가하였습니다.")
+        except SQLAlchemyError as e:
+            print(f"[add_minutely_bucket] {table_name} SQLAlchemyError: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,22 @@ from app.module.asset.model import (  # noqa > relationship purpose
     Asset,
     AssetField,
     Dividend,
+    DividendIngestionWatermark,
     MarketIndexDaily,
+    MarketIndexHalfHourly,
     MarketIndexMinutely,
     MarketIndexMonthly,
     MarketIndexWeekly,
     Stock,
     StockDaily,
+    StockHalfHourly,
+    StockIngestionWatermark,
     StockMinutely,
     StockMonthly,
     StockWeekly,
 )
 from app.module.auth.model import User  # noqa > relationship purpose
-from app.module.chart.model import InvestTip  # noqa > create table
+from app.module.chart.model import InvestTip, UserPortfolioDaily  # noqa > create table
 from database.config import MYSQL_URL, MySQLBase
 
 print("[create_tables] 테이블 생성을 시도 합니다.")
@@ -25,7 +25,7 @@ from app.module.auth.model import User
 from app.module.auth.repository import UserRepository
 from app.module.chart.constant import TIP_EXPIRE_SECOND
 from app.module.chart.redis_repository import RedisRichPortfolioRepository
-from database.dependency import get_mysql_session, get_redis_pool
+from database.dependency import close_redis_pool, get_mysql_session, get_redis_pool
 from database.enum import EnvironmentType
 
 load_dotenv()
@@ -124,6 +124,7 @@ async def main():
     async with get_mysql_session() as session:
         for person in RicePeople:
             await fetch_rich_porfolio(redis_client, session, person.value)
+    await close_redis_pool()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+from icecream import ic
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.common.constant import MINUTELY_PARTITION_PRECREATE_DAYS, MINUTELY_RETENTION_DAYS
+from app.module.asset.model import MarketIndexMinutely, StockMinutely
+from app.module.asset.repository.market_index_half_hourly_repository import MarketIndexHalfHourlyRepository
+from app.module.asset.repository.stock_half_hourly_repository import StockHalfHourlyRepository
+from database.dependency import get_mysql_session
+from database.partition import add_day_partitions, drop_day_partition, get_partition_dates, partition_by_day
+
+MINUTELY_ROLLUP_REPOSITORY_MAP = {
+    StockMinutely: StockHalfHourlyRepository,
+    MarketIndexMinutely: MarketIndexHalfHourlyRepository,
+}
+
+
+async def ensure_partitions(session: AsyncSession, model, today: date) -> list[date]:
+    table_name = model.__tablename__
+    last_date = today + timedelta(days=MINUTELY_PARTITION_PRECREATE_DAYS)
+    partition_dates = await get_partition_dates(session, table_name)
+
+    if len(partition_dates) == 0:
+        oldest_datetime = await session.scalar(select(func.min(model.datetime)))
+        start_date = oldest_datetime.date() if oldest_datetime else today
+        ic(f"[ensure_partitions] {table_name}을 {start_date}~{last_date} 일 단위 파티션으로 전환합니다.")
+        await partition_by_day(session, table_name, "datetime", start_date, last_date)
+        return await get_partition_dates(session, table_name)
+
+    new_dates = [
+        partition_dates[-1] + timedelta(days=offset) for offset in range(1, (last_date - partition_dates[-1]).days + 1)
+    ]
+    await add_day_partitions(session, table_name, new_dates)
+    return partition_dates + new_dates
+
+
+async def rotate_partitions(session: AsyncSession, model, rollup_repository, today: date) -> None:
+    table_name = model.__tablename__
+    partition_dates = await ensure_partitions(session, model, today)
+
+    cutoff_date = today - timedelta(days=MINUTELY_RETENTION_DAYS)
+    for partition_date in [partition_date for partition_date in partition_dates if partition_date < cutoff_date]:
+        try:
+            # 30분 구간으로 옮겨 담은 뒤에만 파티션을 삭제합니다.
+            await rollup_repository.rollup_minutely(
+                session,
+                (
+                    datetime.combine(partition_date, time.min),
+                    datetime.combine(partition_date + timedelta(days=1), time.min),
+                ),
+            )
+            await drop_day_partition(session, table_name, partition_date)
+        except Exception as e:
+            ic(f"[rotate_partitions] {table_name} {partition_date} 파티션 정리 중 에러가 발생했습니다: {e}")
+            break
+
+        ic(f"[rotate_partitions] {table_name} {partition_date} 파티션을 30분 단위로 요약하고 삭제했습니다.")
+
+
+async def main():
+    today = date.today()
+    print(f"{today} 분 단위 시세 파티션 정리를 시작합니다.")
+
+    async with get_mysql_session() as session:
+        for model, rollup_repository in MINUTELY_ROLLUP_REPOSITORY_MAP.items():
+            await rotate_partitions(session, model, rollup_repository, today)
+
+    print(f"{today} 분 단위 시세 파티션 정리를 완료합니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,13 +1,17 @@
 import asyncio
+from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
+from aiohttp import ClientSession, ClientTimeout
+from icecream import ic
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.util.time import get_now_datetime
-from app.data.common.constant import MARKET_INDEX_CACHE_SECOND
-from app.module.asset.enum import Country, MarketIndex
+from app.data.common.constant import MARKET_INDEX_CACHE_SECOND, NAVER_REQUEST_TIMEOUT_SECOND
+from app.data.naver.sources.parser import MARKET_INDEX_AREA_CLASS_MAP
+from app.data.naver.sources.service import fetch_market_indexes
+from app.module.asset.constant import MARKET_INDEX_STALE_SECOND, MARKET_INDEX_UPDATED_AT_KEY
+from app.module.asset.enum import Country
 from app.module.asset.model import (  # noqa: F401 > relationship 설정시 필요합니다.
     MarketIndexMinutely,
     Stock,
@@ -15,84 +19,83 @@ from app.module.asset.model import (  # noqa: F401 > relationship 설정시 필
     StockMonthly,
     StockWeekly,
 )
-from app.module.asset.redis_repository import RedisRealTimeMarketIndexRepository
+from app.module.asset.redis_repository import RedisMarketIndexUpdatedAtRepository, RedisRealTimeMarketIndexRepository
 from app.module.asset.repository.market_index_minutely_repository import MarketIndexMinutelyRepository
 from app.module.asset.schema import MarketIndexData
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
 from database.dependency import get_mysql_session, get_redis_pool
 
 
-async def fetch_market_data(redis_client: Redis, session: AsyncSession):
-    url = "https://finance.naver.com/"
+async def fetch_market_data(redis_client: Redis, session: AsyncSession, http_session: ClientSession) -> None:
     now = get_now_datetime()
-    response = requests.get(url)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.content, "html.parser")
+    market_indexes = await fetch_market_indexes(http_session)
 
     redis_bulk_data = []
     db_bulk_data = []
 
-    section_stock_market = soup.find("div", {"class": "section_stock_market"})
-
-    kospi_area = soup.find("div", {"class": "kospi_area"})
-    kospi_current_value = kospi_area.find("span", {"class": "num"}).text.strip().replace(",", "")
-    kospi_change_value = kospi_area.find("span", {"class": "num2"}).text.strip().replace(",", "")
-    num3_span = kospi_area.find("span", {"class": "num3"})
-    percent_change = (
-        num3_span.text.replace(num3_span.find("span", {"class": "blind"}).text, "").strip().replace("%", "")
+    for market_index, market_index_value in market_indexes.items():
+        db_bulk_data.append(
+            MarketIndexMinutely(name=market_index, datetime=now, current_price=market_index_value.current_value)
+        )
+
+        market_index_data = MarketIndexData(
+            country=Country.KOREA,
+            name=market_index,
+            current_value=market_index_value.current_value,
+            change_value=market_index_value.change_value,
+            change_percent=market_index_value.change_percent,
+            update_time="",
+        )
+        redis_bulk_data.append((market_index, market_index_data.model_dump_json()))
+
+    if db_bulk_data:
+        saved_count = await MarketIndexMinutelyRepository.bulk_upsert(session, db_bulk_data)
+        if saved_count != len(db_bulk_data):
+            ic(f"[realtime_index_korea] 분봉 {len(db_bulk_data)}건 중 {saved_count}건만 저장했습니다.")
+    if redis_bulk_data:
+        await RedisRealTimeMarketIndexRepository.bulk_save(
+            redis_client, redis_bulk_data, expire_time=MARKET_INDEX_CACHE_SECOND
+        )
+        # 저장에 성공한 지수만 갱신 시각을 남겨, API에서 오래된 값인지 판단할 수 있게 합니다.
+        await RedisMarketIndexUpdatedAtRepository.bulk_save(
+            redis_client,
+            MARKET_INDEX_UPDATED_AT_KEY,
+            {market_index: now.isoformat() for market_index, _ in redis_bulk_data},
+        )
+
+
+async def check_staleness(redis_client: Redis) -> None:
+    market_indexes = [str(market_index) for market_index in MARKET_INDEX_AREA_CLASS_MAP]
+    updated_ats = await RedisMarketIndexUpdatedAtRepository.bulk_get(
+        redis_client, MARKET_INDEX_UPDATED_AT_KEY, market_indexes
     )
 
-    kospi_db = MarketIndexMinutely(name=MarketIndex.KOSPI, datetime=now, current_price=kospi_current_value)
-
-    db_bulk_data.append(kospi_db)
-
-    kospi_index = MarketIndexData(
-        country=Country.KOREA,
-        name=MarketIndex.KOSPI,
-        current_value=kospi_current_value,
-        change_value=kospi_change_value,
-        change_percent=percent_change,
-        update_time="",
-    )
-
-    kospi_index_json = kospi_index.model_dump_json()
-
-    redis_bulk_data.append((MarketIndex.KOSPI, kospi_index_json))
-
-    kosdaq_area = section_stock_market.find("div", {"class": "kosdaq_area"})
-    kosdaq_current_value = kosdaq_area.find("span", {"class": "num"}).text.strip().replace(",", "")
-    kosdaq_change_value = kosdaq_area.find("span", {"class": "num2"}).text.strip().replace(",", "")
-    num3_span = kosdaq_area.find("span", {"class": "num3"})
-    percent_change = "".join(num3_span.stripped_strings).replace("%", "").strip()
-
-    kosdaq_db = MarketIndexMinutely(name=MarketIndex.KOSDAQ, datetime=now, current_price=kosdaq_current_value)
-
-    db_bulk_data.append(kosdaq_db)
-
-    kosdaq_index = MarketIndexData(
-        country=Country.KOREA,
-        name=MarketIndex.KOSDAQ,
-        current_value=kosdaq_current_value,
-        change_value=kosdaq_change_value,
-        change_percent=percent_change,
-        update_time="",
-    )
-
-    kosdaq_index_json = kosdaq_index.model_dump_json()
-    redis_bulk_data.append((MarketIndex.KOSDAQ, kosdaq_index_json))
-
-    await MarketIndexMinutelyRepository.bulk_upsert(session, db_bulk_data)
-    await RedisRealTimeMarketIndexRepository.bulk_save(
-        redis_client, redis_bulk_data, expire_time=MARKET_INDEX_CACHE_SECOND
-    )
+    now = get_now_datetime()
+    for market_index, updated_at in zip(market_indexes, updated_ats):
+        if updated_at is None:
+            ic(f"[realtime_index_korea] {market_index} 지수의 수집 기록이 없습니다.")
+        elif (now - datetime.fromisoformat(updated_at)).total_seconds() > MARKET_INDEX_STALE_SECOND:
+            ic(f"[realtime_index_korea] {market_index} 지수가 {updated_at} 이후 갱신되지 않았습니다.")
 
 
 async def main():
-    redis_client = await get_redis_pool()
-    async with get_mysql_session() as session:
+    redis_client = get_redis_pool()
+
+    # 수집 주기마다 연결을 새로 맺지 않도록 세션 하나를 재사용합니다.
+    async with ClientSession(
+        timeout=ClientTimeout(total=NAVER_REQUEST_TIMEOUT_SECOND)
+    ) as http_session, get_mysql_session() as session:
         while True:
-            await fetch_market_data(redis_client, session)
+            try:
+                await fetch_market_data(redis_client, session, http_session)
+            except Exception as e:
+                ic(f"[realtime_index_korea] 수집 중 에러가 발생했습니다: {e}")
+
+            # 수집이 실패한 주기에도 오래된 지수를 알릴 수 있도록 매 주기 확인합니다.
+            try:
+                await check_staleness(redis_client)
+            except Exception as e:
+                ic(f"[realtime_index_korea] 갱신 시각 확인 중 에러가 발생했습니다: {e}")
             await asyncio.sleep(10)
 
 
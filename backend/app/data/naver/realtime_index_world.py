@@ -1,6 +1,9 @@
 import asyncio
+import time
 from os import getenv
 
+import psutil
+from aiohttp import ClientSession, ClientTimeout
 from dotenv import load_dotenv
 from icecream import ic
 from redis.asyncio import Redis
@@ -14,8 +17,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from webdriver_manager.chrome import ChromeDriverManager
 
 from app.common.util.time import get_now_datetime
-from app.data.common.constant import MARKET_INDEX_CACHE_SECOND
-from app.module.asset.constant import COUNTRY_TRANSLATIONS, INDEX_NAME_TRANSLATIONS
+from app.data.common.constant import (
+    MARKET_INDEX_CACHE_SECOND,
+    NAVER_BROWSER_WAIT_SECOND,
+    NAVER_WORLD_REQUEST_TIMEOUT_SECOND,
+)
+from app.data.naver.sources.parser import naver_html_parser
+from app.data.naver.sources.service import NAVER_WORLD_URL, fetch_world_index_rows
+from app.module.asset.constant import COUNTRY_TRANSLATIONS, INDEX_NAME_TRANSLATIONS, MARKET_INDEX_UPDATED_AT_KEY
 from app.module.asset.model import (  # noqa: F401 > relationship 설정시 필요합니다.
     MarketIndexMinutely,
     Stock,
@@ -23,7 +32,7 @@ from app.module.asset.model import (  # noqa: F401 > relationship 설정시 필
     StockMonthly,
     StockWeekly,
 )
-from app.module.asset.redis_repository import RedisRealTimeMarketIndexRepository
+from app.module.asset.redis_repository import RedisMarketIndexUpdatedAtRepository, RedisRealTimeMarketIndexRepository
 from app.module.asset.repository.market_index_minutely_repository import MarketIndexMinutelyRepository
 from app.module.asset.schema import MarketIndexData
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
@@ -34,96 +43,135 @@ load_dotenv()
 ENVIRONMENT = getenv("ENVIRONMENT", None)
 
 
-async def fetch_market_data(redis_client: Redis, session: AsyncSession):
-    now = get_now_datetime()
+class BrowserWorldIndexSource:
+    """HTTP 응답에서 지수 표를 찾지 못할 때만 사용하는 브라우저 수집기입니다.
 
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
+    주기마다 크롬을 새로 띄우지 않도록 드라이버 하나를 만들어 계속 재사용합니다.
+    """
 
-    if ENVIRONMENT == EnvironmentType.DEV:
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-    else:
-        driver = webdriver.Chrome(service=Service("/usr/bin/chromedriver"), options=chrome_options)
+    def __init__(self):
+        self.driver: webdriver.Chrome | None = None
 
-    try:
-        driver.get("https://finance.naver.com/world/")
-        redis_bulk_data = []
-        db_bulk_data = []
-
-        america_index_table = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "americaIndex")))
-
-        tr_rows = america_index_table.find_elements(By.XPATH, ".//thead/tr")
-
-        for tr_row in tr_rows:
-            tr_row_data = []
-            tds = tr_row.find_elements(By.TAG_NAME, "td")
-
-            for td in tds:
-                if "graph" in td.get_attribute("class"):
-                    continue
-
-                span = td.find_elements(By.TAG_NAME, "span")
-                if span:
-                    tr_row_data.append(span[0].text)
-                else:
-                    a_elements = td.find_elements(By.TAG_NAME, "a")
-                    if a_elements:
-                        tr_row_data.append(a_elements[0].text)
-                    else:
-                        tr_row_data.append(td.text)
-
-            if tr_row_data:
-                country_kr = tr_row_data[0]
-                if country_kr in COUNTRY_TRANSLATIONS:
-                    country_en = COUNTRY_TRANSLATIONS[country_kr]
-                else:
-                    continue
-                name_kr = tr_row_data[1]
-                name_en = INDEX_NAME_TRANSLATIONS.get(name_kr, name_kr)
-
-                current_value = tr_row_data[2].strip().replace(",", "")
-                change_value = tr_row_data[3].strip().replace(",", "")
-                change_percent = tr_row_data[4].strip().replace("%", "")
-                change_percent = change_percent
-
-                market_index = MarketIndexData(
-                    country=country_en,
-                    name=name_en,
-                    current_value=current_value,
-                    change_value=change_value,
-                    change_percent=change_percent,
-                    update_time=tr_row_data[5],
-                )
-
-                current_index = MarketIndexMinutely(name=name_en, datetime=now, current_price=current_value)
-
-                db_bulk_data.append(current_index)
-
-                if market_index:
-                    market_index_json = market_index.model_dump_json()
-                    redis_bulk_data.append((name_en, market_index_json))
-
-        await MarketIndexMinutelyRepository.bulk_upsert(session, db_bulk_data)
+    def get_rows(self) -> list[list[str]]:
+        try:
+            driver = self._get_driver()
+            driver.get(NAVER_WORLD_URL)
+            WebDriverWait(driver, NAVER_BROWSER_WAIT_SECOND).until(
+                EC.presence_of_element_located((By.ID, "americaIndex"))
+            )
+            return naver_html_parser.parse_world_index_rows(driver.page_source)
+        except Exception:
+            # 드라이버가 비정상 상태일 수 있으므로 다음 주기에 새로 만듭니다.
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def _get_driver(self) -> webdriver.Chrome:
+        if self.driver is not None:
+            return self.driver
+
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+
+        if ENVIRONMENT == EnvironmentType.DEV:
+            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+        else:
+            self.driver = webdriver.Chrome(service=Service("/usr/bin/chromedriver"), options=chrome_options)
+        return self.driver
+
+
+async def save_market_data(redis_client: Redis, session: AsyncSession, rows: list[list[str]]) -> int:
+    now = get_now_datetime()
+    redis_bulk_data = []
+    db_bulk_data = []
+
+    for row in rows:
+        country_kr = row[0]
+        if country_kr not in COUNTRY_TRANSLATIONS:
+            continue
+        country_en = COUNTRY_TRANSLATIONS[country_kr]
+        name_kr = row[1]
+        name_en = INDEX_NAME_TRANSLATIONS.get(name_kr, name_kr)
+
+        current_value = row[2].replace(",", "")
+        change_value = row[3].replace(",", "")
+        change_percent = row[4].replace("%", "")
+
+        market_index = MarketIndexData(
+            country=country_en,
+            name=name_en,
+            current_value=current_value,
+            change_value=change_value,
+            change_percent=change_percent,
+            update_time=row[5],
+        )
+
+        db_bulk_data.append(MarketIndexMinutely(name=name_en, datetime=now, current_price=current_value))
+        redis_bulk_data.append((name_en, market_index.model_dump_json()))
+
+    if db_bulk_data:
+        saved_count = await MarketIndexMinutelyRepository.bulk_upsert(session, db_bulk_data)
+        if saved_count != len(db_bulk_data):
+            ic(f"[realtime_index_world] 분봉 {len(db_bulk_data)}건 중 {saved_count}건만 저장했습니다.")
+    if redis_bulk_data:
         await RedisRealTimeMarketIndexRepository.bulk_save(
             redis_client, redis_bulk_data, expire_time=MARKET_INDEX_CACHE_SECOND
         )
+        await RedisMarketIndexUpdatedAtRepository.bulk_save(
+            redis_client, MARKET_INDEX_UPDATED_AT_KEY, {name_en: now.isoformat() for name_en, _ in redis_bulk_data}
+        )
+    return len(db_bulk_data)
 
-    finally:
-        driver.quit()
+
+async def fetch_market_data(
+    redis_client: Redis, session: AsyncSession, http_session: ClientSession, browser_source: BrowserWorldIndexSource
+) -> None:
+    started_at = time.monotonic()
+
+    try:
+        rows = await fetch_world_index_rows(http_session)
+    except Exception as e:
+        ic(f"[realtime_index_world] HTTP 수집 중 에러가 발생했습니다: {e}")
+        rows = []
+
+    source_name = "http"
+    if not rows:
+        # 페이지 구조가 바뀌어 HTTP 응답에서 표를 찾지 못한 경우에만 브라우저를 사용합니다.
+        source_name = "browser"
+        rows = await asyncio.to_thread(browser_source.get_rows)
+
+    saved_count = await save_market_data(redis_client, session, rows)
+
+    rss_mb = psutil.Process().memory_info().rss / 1024 / 1024
+    ic(
+        f"[realtime_index_world] {source_name}로 {saved_count}건 수집, "
+        f"{time.monotonic() - started_at:.1f}초 소요, 메모리 {rss_mb:.0f}MB"
+    )
 
 
 async def main():
-    redis_client = await get_redis_pool()
-    async with get_mysql_session() as session:
-        while True:
-            try:
-                await fetch_market_data(redis_client, session)
-            except Exception as err:
-                ic(f"{err=}")
-            finally:
-                await asyncio.sleep(10)
+    redis_client = get_redis_pool()
+    browser_source = BrowserWorldIndexSource()
+
+    try:
+        async with ClientSession(
+            timeout=ClientTimeout(total=NAVER_WORLD_REQUEST_TIMEOUT_SECOND)
+        ) as http_session, get_mysql_session() as session:
+            while True:
+                try:
+                    await fetch_market_data(redis_client, session, http_session, browser_source)
+                except Exception as err:
+                    ic(f"{err=}")
+                finally:
+                    await asyncio.sleep(10)
+    finally:
+        browser_source.close()
 
 
 if __name__ == "__main__":
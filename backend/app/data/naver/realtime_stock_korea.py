@@ -1,51 +1,77 @@
 import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from icecream import ic
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.util.time import get_now_datetime
-from app.data.common.constant import STOCK_CACHE_SECOND, STOCK_CHUNK_SIZE
+from app.data.common.constant import (
+    NAVER_PARSE_WORKER_COUNT,
+    NAVER_REQUEST_TIMEOUT_SECOND,
+    NAVER_STOCK_CONCURRENCY,
+    STOCK_CACHE_SECOND,
+)
 from app.data.common.service import StockCodeFileReader
 from app.data.naver.sources.service import get_stock_prices
 from app.module.asset.model import StockMinutely
 from app.module.asset.redis_repository import RedisRealTimeStockRepository
 from app.module.asset.repository.stock_minutely_repository import StockMinutelyRepository
 from app.module.asset.schema import StockInfo
+from app.module.asset.services.portfolio_snapshot_service import PortfolioSnapshotService
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
 from database.dependency import get_mysql_session, get_redis_pool
 
 
-async def collect_stock_data(redis_client: Redis, session: AsyncSession) -> None:
-    stock_code_list: list[StockInfo] = StockCodeFileReader.get_korea_stock_code_list()
+async def collect_stock_data(
+    redis_client: Redis,
+    session: AsyncSession,
+    http_session: ClientSession,
+    semaphore: asyncio.Semaphore,
+    executor: Executor,
+    stock_code_list: list[StockInfo],
+) -> None:
+    started_at = time.monotonic()
     now = get_now_datetime()
 
-    for i in range(0, len(stock_code_list), STOCK_CHUNK_SIZE):
-        stock_info_list: list[StockInfo] = stock_code_list[i : i + STOCK_CHUNK_SIZE]
-        code_price_pairs: list[tuple[str, int | Exception]] = await get_stock_prices(stock_info_list)
-
-        db_bulk_data = []
+    code_price_pairs = await get_stock_prices(http_session, semaphore, executor, stock_code_list)
+    redis_bulk_data = [(code, price) for code, price in code_price_pairs if price]
+    db_bulk_data = [StockMinutely(code=code, datetime=now, current_price=price) for code, price in redis_bulk_data]
 
-        for code, price in code_price_pairs:
-            current_stock_data = StockMinutely(code=code, datetime=now, current_price=price)
-            db_bulk_data.append(current_stock_data)
+    if redis_bulk_data:
+        await RedisRealTimeStockRepository.bulk_save(redis_client, redis_bulk_data, expire_time=STOCK_CACHE_SECOND)
+        await PortfolioSnapshotService.invalidate_prices(redis_client)
 
-            if isinstance(price, Exception):
-                continue
-            else:
-                await RedisRealTimeStockRepository.save(redis_client, code, price, expire_time=STOCK_CACHE_SECOND)
+    if db_bulk_data:
+        saved_count = await StockMinutelyRepository.bulk_upsert(session, db_bulk_data)
+        if saved_count != len(db_bulk_data):
+            ic(f"[realtime_stock_korea] 분봉 {len(db_bulk_data)}건 중 {saved_count}건만 저장했습니다.")
 
-        await StockMinutelyRepository.bulk_upsert(session, db_bulk_data)
+    ic(
+        f"[realtime_stock_korea] {len(stock_code_list)}건 중 {len(redis_bulk_data)}건 수집, "
+        f"{time.monotonic() - started_at:.1f}초 소요"
+    )
 
 
 async def main():
     redis_client = get_redis_pool()
-    async with get_mysql_session() as session:
-        while True:
-            try:
-                await collect_stock_data(redis_client, session)
-            except Exception:
-                continue
-            await asyncio.sleep(5)
+    stock_code_list: list[StockInfo] = StockCodeFileReader.get_korea_stock_code_list()
+    semaphore = asyncio.Semaphore(NAVER_STOCK_CONCURRENCY)
+
+    # 수집 주기마다 세션을 새로 만들지 않고, 연결을 유지한 채 재사용합니다.
+    async with ClientSession(
+        connector=TCPConnector(limit=NAVER_STOCK_CONCURRENCY),
+        timeout=ClientTimeout(total=NAVER_REQUEST_TIMEOUT_SECOND),
+    ) as http_session, get_mysql_session() as session:
+        with ThreadPoolExecutor(max_workers=NAVER_PARSE_WORKER_COUNT) as executor:
+            while True:
+                try:
+                    await collect_stock_data(redis_client, session, http_session, semaphore, executor, stock_code_list)
+                except Exception as e:
+                    ic(f"[realtime_stock_korea] 수집 중 에러가 발생했습니다: {e}")
+                await asyncio.sleep(5)
 
 
 if __name__ == "__main__":
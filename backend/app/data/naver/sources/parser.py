@@ -0,0 +1,144 @@
+from abc import ABC, abstractmethod
+
+from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+
+from app.data.common.dataclass import MarketIndexValue
+from app.module.asset.enum import MarketIndex
+
+MARKET_INDEX_AREA_CLASS_MAP = {
+    MarketIndex.KOSPI: "kospi_area",
+    MarketIndex.KOSDAQ: "kosdaq_area",
+}
+
+
+def _has_class(class_name: str) -> str:
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+
+class NaverHtmlParser(ABC):
+    @abstractmethod
+    def parse_stock_price(self, html: str) -> int:
+        """종목 페이지에서 현재가를 읽고, 찾지 못하면 0을 반환합니다."""
+
+    @abstractmethod
+    def parse_market_indexes(self, html: str) -> dict[MarketIndex, MarketIndexValue]:
+        """네이버 증권 메인 페이지에서 코스피, 코스닥 지수를 읽습니다."""
+
+    @abstractmethod
+    def parse_world_index_rows(self, html: str) -> list[list[str]]:
+        """해외 증시 페이지의 미국 지수 표에서 행마다 [국가, 지수명, 현재가, 전일대비, 등락률, 기준시각]을 읽습니다."""
+
+
+class SoupNaverHtmlParser(NaverHtmlParser):
+    def parse_stock_price(self, html: str) -> int:
+        soup = BeautifulSoup(html, "html.parser")
+        today = soup.select_one("#chart_area > div.rate_info > div.today")
+        if today is None:
+            return 0
+
+        no_today = today.select_one("p.no_today")
+        if no_today:
+            price_element = no_today.select_one("em.no_up .blind") or no_today.select_one("em.no_down .blind")
+        else:
+            price_element = today.select_one(".blind")
+
+        if price_element is None:
+            return 0
+        return int(price_element.get_text().replace(",", ""))
+
+    def parse_market_indexes(self, html: str) -> dict[MarketIndex, MarketIndexValue]:
+        soup = BeautifulSoup(html, "html.parser")
+
+        market_indexes = {}
+        for market_index, area_class in MARKET_INDEX_AREA_CLASS_MAP.items():
+            area = soup.find("div", {"class": area_class})
+            num3_span = area.find("span", {"class": "num3"})
+            blind_span = num3_span.find("span", {"class": "blind"})
+            percent_text = num3_span.text.replace(blind_span.text, "") if blind_span else num3_span.text
+
+            market_indexes[market_index] = MarketIndexValue(
+                current_value=area.find("span", {"class": "num"}).text.strip().replace(",", ""),
+                change_value=area.find("span", {"class": "num2"}).text.strip().replace(",", ""),
+                change_percent=percent_text.strip().replace("%", ""),
+            )
+        return market_indexes
+
+    def parse_world_index_rows(self, html: str) -> list[list[str]]:
+        soup = BeautifulSoup(html, "html.parser")
+        america_index_table = soup.find(id="americaIndex")
+        if america_index_table is None:
+            return []
+
+        rows = []
+        for tr in america_index_table.select("thead tr"):
+            cells = [
+                (td.find("span") or td.find("a") or td).get_text().strip()
+                for td in tr.find_all("td")
+                if "graph" not in " ".join(td.get("class", []))
+            ]
+            if cells:
+                rows.append(cells)
+        return rows
+
+
+class LxmlNaverHtmlParser(NaverHtmlParser):
+    def parse_stock_price(self, html: str) -> int:
+        document = lxml_html.fromstring(html)
+        today = document.xpath(f'//*[@id="chart_area"]/div[{_has_class("rate_info")}]/div[{_has_class("today")}]')
+        if len(today) == 0:
+            return 0
+
+        no_today = today[0].xpath(f'.//p[{_has_class("no_today")}]')
+        if no_today:
+            price_elements = no_today[0].xpath(f'.//em[{_has_class("no_up")}]//*[{_has_class("blind")}]') or no_today[
+                0
+            ].xpath(f'.//em[{_has_class("no_down")}]//*[{_has_class("blind")}]')
+        else:
+            price_elements = today[0].xpath(f'.//*[{_has_class("blind")}]')
+
+        if len(price_elements) == 0:
+            return 0
+        return int(price_elements[0].text_content().replace(",", ""))
+
+    def parse_market_indexes(self, html: str) -> dict[MarketIndex, MarketIndexValue]:
+        document = lxml_html.fromstring(html)
+
+        market_indexes = {}
+        for market_index, area_class in MARKET_INDEX_AREA_CLASS_MAP.items():
+            area = document.xpath(f"//div[{_has_class(area_class)}]")[0]
+            num3_span = area.xpath(f'.//span[{_has_class("num3")}]')[0]
+            blind_text = "".join(span.text_content() for span in num3_span.xpath(f'.//span[{_has_class("blind")}]'))
+
+            market_indexes[market_index] = MarketIndexValue(
+                current_value=self._get_text(area, "num").replace(",", ""),
+                change_value=self._get_text(area, "num2").replace(",", ""),
+                change_percent=num3_span.text_content().replace(blind_text, "", 1).strip().replace("%", ""),
+            )
+        return market_indexes
+
+    def parse_world_index_rows(self, html: str) -> list[list[str]]:
+        document = lxml_html.fromstring(html)
+        america_index_tables = document.xpath('//*[@id="americaIndex"]')
+        if len(america_index_tables) == 0:
+            return []
+
+        rows = []
+        for tr in america_index_tables[0].xpath("./thead/tr"):
+            cells = []
+            for td in tr.xpath(".//td"):
+                if "graph" in td.get("class", ""):
+                    continue
+                first_element = (td.xpath(".//span[1]") or td.xpath(".//a[1]") or [td])[0]
+                cells.append(first_element.text_content().strip())
+            if cells:
+                rows.append(cells)
+        return rows
+
+    @staticmethod
+    def _get_text(element, class_name: str) -> str:
+        return element.xpath(f".//span[{_has_class(class_name)}]")[0].text_content().strip()
+
+
+# 요청마다 파싱 비용이 가장 작은 lxml 구현을 기본으로 사용합니다.
+naver_html_parser: NaverHtmlParser = LxmlNaverHtmlParser()
@@ -1,39 +1,64 @@
 import asyncio
+from concurrent.futures import Executor
 
-from aiohttp import ClientSession, ClientTimeout
-from bs4 import BeautifulSoup
+from aiohttp import ClientError, ClientSession
+from icecream import ic
 
+from app.data.common.constant import NAVER_INDEX_BACKOFF_SECOND, NAVER_INDEX_RETRY_COUNT
+from app.data.common.dataclass import MarketIndexValue
+from app.data.naver.sources.parser import naver_html_parser
+from app.module.asset.enum import MarketIndex
 from app.module.asset.schema import StockInfo
 
+NAVER_STOCK_URL = "https://finance.naver.com/item/main.nhn?code={code}"
+NAVER_WORLD_URL = "https://finance.naver.com/world/"
+NAVER_MAIN_URL = "https://finance.naver.com/"
 
-async def fetch_stock_price(session: ClientSession, code: str) -> int:
+
+async def fetch_stock_price(session: ClientSession, semaphore: asyncio.Semaphore, executor: Executor, code: str) -> int:
     try:
-        url = f"https://finance.naver.com/item/main.nhn?code={code}"
-        async with session.get(url, timeout=ClientTimeout(total=2)) as response:
-            response.raise_for_status()
-            html = await response.text()
-            soup = BeautifulSoup(html, "html.parser")
-            today = soup.select_one("#chart_area > div.rate_info > div.today")
-
-            if today is None:
-                return 0
-
-            no_today = today.select_one("p.no_today")
-            if no_today:
-                price_element = no_today.select_one("em.no_up .blind") or no_today.select_one("em.no_down .blind")
-                if price_element:
-                    price_text = price_element.get_text()
-                    return int(price_text.replace(",", ""))
-            else:
-                price_text = today.select_one(".blind").get_text()
-                return int(price_text.replace(",", ""))
+        async with semaphore:
+            async with session.get(NAVER_STOCK_URL.format(code=code)) as response:
+                response.raise_for_status()
+                html = await response.text()
+
+        # 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드 풀에서 실행합니다.
+        return await asyncio.get_running_loop().run_in_executor(executor, naver_html_parser.parse_stock_price, html)
     except Exception:
         return 0
-    return 0
 
 
-async def get_stock_prices(code_list: list[StockInfo]) -> list[tuple[str, int | Exception]]:
-    async with ClientSession() as session:
-        tasks = [fetch_stock_price(session, stockInfo.code) for stockInfo in code_list]
-        prices = await asyncio.gather(*tasks, return_exceptions=True)
-        return [(stockInfo.code, result) for stockInfo, result in zip(code_list, prices)]
+async def get_stock_prices(
+    session: ClientSession, semaphore: asyncio.Semaphore, executor: Executor, code_list: list[StockInfo]
+) -> list[tuple[str, int]]:
+    prices = await asyncio.gather(
+        *(fetch_stock_price(session, semaphore, executor, stock_info.code) for stock_info in code_list)
+    )
+    return [(stock_info.code, price) for stock_info, price in zip(code_list, prices)]
+
+
+async def fetch_world_index_rows(session: ClientSession) -> list[list[str]]:
+    async with session.get(NAVER_WORLD_URL) as response:
+        response.raise_for_status()
+        html = await response.text()
+
+    return await asyncio.to_thread(naver_html_parser.parse_world_index_rows, html)
+
+
+async def fetch_market_indexes(
+    session: ClientSession,
+    retry_count: int = NAVER_INDEX_RETRY_COUNT,
+    backoff_second: float = NAVER_INDEX_BACKOFF_SECOND,
+) -> dict[MarketIndex, MarketIndexValue]:
+    for attempt in range(1, retry_count + 1):
+        try:
+            async with session.get(NAVER_MAIN_URL) as response:
+                response.raise_for_status()
+                html = await response.text()
+            return await asyncio.to_thread(naver_html_parser.parse_market_indexes, html)
+        except (ClientError, asyncio.TimeoutError) as e:
+            ic(f"[fetch_market_indexes] {attempt}번째 요청에 실패했습니다: {e}")
+            if attempt < retry_count:
+                await asyncio.sleep(backoff_second * 2 ** (attempt - 1))
+
+    return {}
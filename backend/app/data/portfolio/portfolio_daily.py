@@ -0,0 +1,115 @@
+import asyncio
+from collections import defaultdict
+from datetime import date, timedelta
+
+from icecream import ic
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.common.constant import (
+    PORTFOLIO_DAILY_CHECKPOINT_EXPIRE_SECOND,
+    PORTFOLIO_DAILY_CHECKPOINT_KEY_PREFIX,
+    PORTFOLIO_DAILY_USER_CHUNK_SIZE,
+)
+from app.module.asset.enum import AssetType
+from app.module.asset.model import Asset, StockDaily
+from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.repository.stock_daily_repository import StockDailyRepository
+from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.asset.services.stock_daily_service import StockDailyService
+from app.module.auth.repository import UserRepository
+from app.module.chart.constant import PORTFOLIO_PRICE_LOOKBACK_DAYS
+from app.module.chart.model import UserPortfolioDaily
+from app.module.chart.redis_repository import RedisPortfolioDailyCheckpointRepository
+from app.module.chart.repository import UserPortfolioDailyRepository
+from app.module.chart.service.portfolio_history_service import PortfolioHistoryService
+from database.dependency import close_redis_pool, get_mysql_session, get_redis_pool
+
+
+async def process_user_chunk(
+    session: AsyncSession, user_ids: list[int], target_date: date, exchange_rate_map: dict[str, float]
+) -> list[UserPortfolioDaily]:
+    assets: list[Asset] = await AssetRepository.get_eager_by_user_ids(session, user_ids, AssetType.STOCK)
+    assets_by_user: dict[int, list[Asset]] = defaultdict(list)
+    for asset in assets:
+        assets_by_user[asset.user_id].append(asset)
+
+    stock_daily_map: dict[tuple[str, date], StockDaily] = {}
+    stock_dailies_by_code: dict[str, list[StockDaily]] = defaultdict(list)
+    if len(assets) > 0:
+        stock_daily_map = await StockDailyService.get_map_range(session, assets)
+        stock_dailies: list[StockDaily] = await StockDailyRepository.get_by_range(
+            session,
+            list({asset.asset_stock.stock.code for asset in assets}),
+            (target_date - timedelta(days=PORTFOLIO_PRICE_LOOKBACK_DAYS), target_date),
+        )
+        for stock_daily in stock_dailies:
+            stock_dailies_by_code[stock_daily.code].append(stock_daily)
+
+    portfolio_dailies = []
+    for user_id in user_ids:
+        user_assets = assets_by_user.get(user_id, [])
+        user_stock_dailies = [
+            stock_daily
+            for stock_code in {asset.asset_stock.stock.code for asset in user_assets}
+            for stock_daily in stock_dailies_by_code[stock_code]
+        ]
+        portfolio_dailies.extend(
+            PortfolioHistoryService.get_portfolio_dailies(
+                user_id, user_assets, user_stock_dailies, stock_daily_map, exchange_rate_map, target_date, target_date
+            )
+        )
+
+    return portfolio_dailies
+
+
+async def insert_portfolio_daily(session: AsyncSession, redis_client: Redis, target_date: date, chunk_size: int):
+    exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
+
+    # 앱 요청으로 먼저 저장된 행은 종가 수집 전에 계산됐을 수 있으므로, 이미 있는 행도 다시 계산해 덮어씁니다.
+    # 중단된 작업을 다시 실행하면 이번 날짜의 체크포인트 이후 사용자부터 처리합니다.
+    checkpoint_key = f"{PORTFOLIO_DAILY_CHECKPOINT_KEY_PREFIX}:{target_date}"
+    checkpoint = await RedisPortfolioDailyCheckpointRepository.get(redis_client, checkpoint_key)
+    last_user_id = int(checkpoint) if checkpoint is not None else 0
+
+    # 실패한 묶음이 생기면 다시 실행할 때 그 묶음부터 처리하도록, 이후로는 체크포인트를 옮기지 않습니다.
+    has_failed = False
+    while True:
+        user_ids = await UserRepository.get_user_ids_after(session, last_user_id, chunk_size)
+        if len(user_ids) == 0:
+            break
+        last_user_id = user_ids[-1]
+
+        try:
+            portfolio_dailies = await process_user_chunk(session, user_ids, target_date, exchange_rate_map)
+        except Exception as e:
+            await session.rollback()
+            has_failed = True
+            ic(f"[insert_portfolio_daily] {user_ids[0]}~{last_user_id} 사용자 처리 중 에러가 발생했습니다: {e}")
+            continue
+
+        saved_count = await UserPortfolioDailyRepository.bulk_upsert(session, portfolio_dailies)
+        session.expunge_all()
+        ic(f"[insert_portfolio_daily] {last_user_id=}까지 {len(portfolio_dailies)}건 중 {saved_count}건 저장했습니다.")
+
+        has_failed = has_failed or saved_count < len(portfolio_dailies)
+        if not has_failed:
+            await RedisPortfolioDailyCheckpointRepository.save(
+                redis_client, checkpoint_key, last_user_id, PORTFOLIO_DAILY_CHECKPOINT_EXPIRE_SECOND
+            )
+
+
+async def main():
+    target_date = date.today() - timedelta(days=1)
+    print(f"{target_date} 사용자 일별 평가금 수집을 시작합니다.")
+
+    redis_client = get_redis_pool()
+    async with get_mysql_session() as session:
+        await insert_portfolio_daily(session, redis_client, target_date, PORTFOLIO_DAILY_USER_CHUNK_SIZE)
+    await close_redis_pool()
+
+    print(f"{target_date} 사용자 일별 평가금 수집을 완료합니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
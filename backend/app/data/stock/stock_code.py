@@ -24,10 +24,8 @@ async def main():
 
             stock_code_list.append(stock)
 
-        try:
-            await StockRepository.bulk_upsert(session, stock_code_list)
-        except Exception as e:
-            print(f"{e=}")
+        saved_count = await StockRepository.bulk_upsert(session, stock_code_list)
+        print(f"주식 코드 {len(stock_code_list)}건 중 {saved_count}건을 저장했습니다.")
 
     print("주식 코드 저장을 마칩니다.")
 
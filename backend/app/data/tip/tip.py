@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.module.chart.constant import TIP_EXPIRE_SECOND, TIP_TODAY_ID_REDIS_KEY
 from app.module.chart.redis_repository import RedisTipRepository
 from app.module.chart.repository import TipRepository
-from database.dependency import get_mysql_session, get_redis_pool
+from database.dependency import close_redis_pool, get_mysql_session, get_redis_pool
 
 
 async def set_invest_tip_key(session: AsyncSession, redis_client: Redis):
@@ -44,6 +44,7 @@ async def main():
     redis_client = get_redis_pool()
     async with get_mysql_session() as session:
         await set_invest_tip_key(session, redis_client)
+    await close_redis_pool()
 
 
 if __name__ == "__main__":
@@ -1,56 +1,111 @@
 import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date, datetime
 
 import pandas as pd
 import yfinance
 from icecream import ic
+from more_itertools import chunked
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.data.common.service import get_all_stock_code_list
-from app.data.yahoo.source.constant import BATCH_SIZE
-from app.data.yahoo.source.service import format_stock_code
-from app.module.asset.enum import Country
-from app.module.asset.model import Dividend
+from app.data.yahoo.dividend_calendar import save_dividend_calendar
+from app.data.yahoo.source.constant import BATCH_SIZE, DIVIDEND_WORKER_COUNT
+from app.data.yahoo.source.service import format_stock_code, get_dividend_fetch_start_date, get_new_dividend_records
+from app.module.asset.enum import Country, TimeInterval
+from app.module.asset.repository.dividend_ingestion_watermark_repository import DividendIngestionWatermarkRepository
 from app.module.asset.repository.dividend_repository import DividendRepository
 from app.module.asset.schema import StockInfo
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
 from database.dependency import get_mysql_session
 
 
-async def insert_dividend_data(session: AsyncSession, stock_list: list[StockInfo], batch_size: int):
-    for i in range(0, len(stock_list), batch_size):
-        stock_list_batch = stock_list[i : i + batch_size]
+def download_dividends(yahoo_stock_code: str, start_date: date | None) -> pd.Series:
+    # 스레드 풀에서 실행되며, 조회 시작일이 있으면 그 날부터만 조회합니다.
+    ticker = yfinance.Ticker(yahoo_stock_code)
+    if start_date is None:
+        return ticker.dividends
 
-        dividend_list = []
-        for stock in stock_list_batch:
-            try:
+    history = ticker.history(start=start_date, interval=TimeInterval.DAY.value, actions=True, auto_adjust=False)
+    if history.empty or "Dividends" not in history:
+        return pd.Series(dtype="float64")
+    return history["Dividends"]
 
-                stock_code = format_stock_code(
-                    stock.code.strip(), Country[stock.country.upper().strip()], stock.market_index.upper().strip()
-                )
 
-                stock_info = yfinance.Ticker(stock_code)
+async def fetch_new_dividends(
+    executor: Executor, semaphore: asyncio.Semaphore, stock: StockInfo, start_date: date | None, last_date: date | None
+) -> tuple[int, list[dict]] | None:
+    try:
+        yahoo_stock_code = format_stock_code(
+            stock.code.strip(), Country[stock.country.upper().strip()], stock.market_index.upper().strip()
+        )
+        async with semaphore:
+            dividends = await asyncio.get_running_loop().run_in_executor(
+                executor, download_dividends, yahoo_stock_code, start_date
+            )
+    except Exception as e:
+        ic(f"[fetch_new_dividends] {stock.code} 배당 조회 중 에러가 발생했습니다: {e}")
+        return None
 
-                dividends = stock_info.dividends
+    # 일봉 조회 결과에는 배당이 없는 날도 0으로 들어 있어, 실제 배당 건수만 셉니다.
+    return int((dividends > 0).sum()), get_new_dividend_records(dividends, stock.code, last_date)
 
-                if dividends.empty:
-                    continue
 
-                for dividend_date, dividend_amount in dividends.items():
-                    try:
-                        dividend = Dividend(
-                            dividend=dividend_amount, stock_code=stock.code, date=pd.to_datetime(dividend_date).date()
-                        )
-                    except Exception as e:
-                        ic(f"Error processing dividend for stock {stock.code} on {dividend_date}: {e}")
-                        continue
+async def insert_dividend_data(session: AsyncSession, stock_list: list[StockInfo], batch_size: int):
+    started_at = time.monotonic()
+    now = datetime.now()
+    last_date_map = await DividendRepository.get_last_dates(session)
+    checked_at_map = await DividendIngestionWatermarkRepository.get_checked_at_map(session)
+
+    # 오늘 이미 조회한 종목은 다시 조회하지 않아, 중단된 실행을 다시 돌리면 멈춘 지점부터 이어서 수집합니다.
+    target_stocks = [stock for stock in stock_list if checked_at_map.get(stock.code, datetime.min).date() < now.date()]
+    skipped_stock_count = len(stock_list) - len(target_stocks)
+
+    fetched_row_count = 0
+    saved_row_count = 0
+    failed_stock_count = 0
+    semaphore = asyncio.Semaphore(DIVIDEND_WORKER_COUNT)
+
+    with ThreadPoolExecutor(max_workers=DIVIDEND_WORKER_COUNT) as executor:
+        for stock_batch in chunked(target_stocks, batch_size):
+            results = await asyncio.gather(
+                *(
+                    fetch_new_dividends(
+                        executor,
+                        semaphore,
+                        stock,
+                        get_dividend_fetch_start_date(checked_at_map.get(stock.code), last_date_map.get(stock.code)),
+                        last_date_map.get(stock.code),
+                    )
+                    for stock in stock_batch
+                )
+            )
+
+            checked_codes = [stock.code for stock, result in zip(stock_batch, results) if result is not None]
+            failed_stock_count += len(stock_batch) - len(checked_codes)
+            dividend_records = [record for result in results if result is not None for record in result[1]]
+            fetched_row_count += sum(result[0] for result in results if result is not None)
 
-                    dividend_list.append(dividend)
+            if dividend_records:
+                saved_count = await DividendRepository.bulk_upsert_records(session, dividend_records)
+                saved_row_count += saved_count
 
-            except Exception as e:
-                ic(f"[분석][insert_dividend_data] Error during dividend processing for {stock.code}: {e}")
-                continue
+                # 저장에 실패한 배치는 조회 기록을 남기지 않아, 다음 실행에서 같은 구간을 다시 조회합니다.
+                if saved_count != len(dividend_records):
+                    ic(f"[insert_dividend_data] 배당 {len(dividend_records)}건 중 {saved_count}건만 저장되었습니다.")
+                    continue
 
-        await DividendRepository.bulk_upsert(session=session, dividends=dividend_list)
+            if checked_codes:
+                await DividendIngestionWatermarkRepository.bulk_upsert_records(
+                    session, [{"code": code, "checked_at": now} for code in checked_codes]
+                )
+
+    ic(
+        f"[insert_dividend_data] 종목 {len(target_stocks)}건 조회, {skipped_stock_count}건은 오늘 이미 조회되어 건너뜀, "
+        f"{failed_stock_count}건 조회 실패, 배당 {fetched_row_count}건 수신, {saved_row_count}건 저장, "
+        f"{time.monotonic() - started_at:.1f}초 소요"
+    )
 
 
 async def main():
@@ -60,6 +115,9 @@ async def main():
     async with get_mysql_session() as session:
         await insert_dividend_data(session, stock_list, BATCH_SIZE)
 
+        # 배당 달력은 새로 저장된 배당으로 계산해야 하므로, 수집이 끝난 뒤 이어서 갱신합니다.
+        await save_dividend_calendar(session, stock_list, date.today())
+
     print("배당금 수집을 완료합니다.")
 
 
@@ -0,0 +1,57 @@
+import asyncio
+from datetime import date
+
+from icecream import ic
+from more_itertools import chunked
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.common.service import get_all_stock_code_list
+from app.data.yahoo.source.constant import BATCH_SIZE
+from app.module.asset.constant import DIVIDEND_CALENDAR_EXPIRE_SECOND, DIVIDEND_CALENDAR_KEY
+from app.module.asset.model import Dividend
+from app.module.asset.redis_repository import RedisDividendCalendarRepository
+from app.module.asset.repository.dividend_repository import DividendRepository
+from app.module.asset.schema import StockInfo
+from app.module.asset.services.dividend_service import DividendService
+from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
+from database.dependency import get_mysql_session, get_redis_pool
+
+
+async def build_dividend_calendar(session: AsyncSession, stock_codes: list[str], today: date) -> dict[str, str]:
+    calendar_map = {}
+    for stock_code_batch in chunked(stock_codes, BATCH_SIZE):
+        dividends: list[Dividend] = await DividendRepository.get_dividends(session, list(stock_code_batch))
+        dividend_index = DividendService.get_dividend_index(dividends)
+
+        for stock_code, ordinals in dividend_index.ordinals.items():
+            calendar = DividendService.get_dividend_calendar(ordinals, dividend_index.amounts[stock_code], today)
+            if calendar is None or len(calendar.ordinals) == 0:
+                continue
+            calendar_map[stock_code] = DividendService.dump_dividend_calendar(calendar)
+    return calendar_map
+
+
+async def save_dividend_calendar(session: AsyncSession, stock_list: list[StockInfo], today: date) -> None:
+    stock_codes = sorted({stock.code for stock in stock_list})
+    calendar_map = await build_dividend_calendar(session, stock_codes, today)
+
+    redis_client = get_redis_pool()
+    await RedisDividendCalendarRepository.replace(
+        redis_client, DIVIDEND_CALENDAR_KEY, calendar_map, expire_time=DIVIDEND_CALENDAR_EXPIRE_SECOND
+    )
+    ic(f"[dividend_calendar] 종목 {len(stock_codes)}건 중 {len(calendar_map)}건의 배당 달력을 저장했습니다.")
+
+
+async def main():
+    today = date.today()
+    print(f"{today} 배당 달력 계산을 시작합니다.")
+    stock_list: list[StockInfo] = get_all_stock_code_list()
+
+    async with get_mysql_session() as session:
+        await save_dividend_calendar(session, stock_list, today)
+
+    print(f"{today} 배당 달력 계산을 완료합니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,29 +1,62 @@
 import asyncio
+import time
 
+import pandas as pd
 import yfinance
 from icecream import ic
+from redis.asyncio import Redis
 
 from app.data.common.constant import STOCK_CACHE_SECOND
+from app.data.yahoo.source.service import get_cross_exchange_rates, get_exchange_rate_symbol
 from app.module.asset.constant import CURRENCY_PAIRS
+from app.module.asset.enum import CurrencyType
 from app.module.asset.redis_repository import RedisExchangeRateRepository
+from app.module.asset.services.portfolio_snapshot_service import PortfolioSnapshotService
 from database.dependency import get_redis_pool
 
 
-async def fetch_exchange_rate(source_currency: str, target_currency: str) -> float | None:
-    url = f"{source_currency}{target_currency}=X"
-    try:
-        ticker = yfinance.Ticker(url)
-        exchange_rate_history = ticker.history(period="1d")
+def download_usd_rates(currencies: list[CurrencyType]) -> dict[CurrencyType, float]:
+    # 스레드 풀에서 실행되며, 달러 기준 환율을 한 번의 요청으로 받아옵니다.
+    symbol_currency_map = {get_exchange_rate_symbol(currency): currency for currency in currencies}
+    df = yfinance.download(
+        tickers=list(symbol_currency_map),
+        period="1d",
+        progress=False,
+        threads=False,
+    )
+    if df.empty:
+        return {}
 
-        if exchange_rate_history.empty:
-            ic(f"No data found for {url}")
-            return None
+    close = df["Close"]
+    if not isinstance(close, pd.DataFrame):
+        close = close.to_frame(name=next(iter(symbol_currency_map)))
 
-        rate = exchange_rate_history["Close"].iloc[0]
-        return rate
-    except Exception as e:
-        ic(e)
-        return None
+    # 통화마다 마지막 거래 시각이 달라 빈 행이 생기므로, 가장 최근 값을 사용합니다.
+    last_close = close.ffill().iloc[-1]
+    return {
+        currency: float(last_close[symbol])
+        for symbol, currency in symbol_currency_map.items()
+        if symbol in last_close and pd.notna(last_close[symbol])
+    }
+
+
+async def collect_exchange_rates(redis_client: Redis) -> None:
+    started_at = time.monotonic()
+    currencies = sorted({currency for pair in CURRENCY_PAIRS for currency in pair if currency != CurrencyType.USA})
+
+    usd_rates = await asyncio.to_thread(download_usd_rates, currencies)
+    exchange_rates = get_cross_exchange_rates(usd_rates, CURRENCY_PAIRS)
+    if not exchange_rates:
+        ic("[exchange_rate] 환율을 가져오지 못했습니다.")
+        return
+
+    await RedisExchangeRateRepository.bulk_save(redis_client, exchange_rates, expire_time=STOCK_CACHE_SECOND)
+    await PortfolioSnapshotService.invalidate_prices(redis_client)
+
+    ic(
+        f"[exchange_rate] {len(usd_rates)}개 통화로 {len(exchange_rates)}/{len(CURRENCY_PAIRS)}개 환율 저장, "
+        f"{time.monotonic() - started_at:.1f}초 소요"
+    )
 
 
 async def main():
@@ -31,14 +64,7 @@ async def main():
 
     while True:
         try:
-            for source_currency, target_currency in CURRENCY_PAIRS:
-                rate = await fetch_exchange_rate(source_currency, target_currency)
-
-                if rate is None:
-                    continue
-
-                cache_key = source_currency + "_" + target_currency
-                await RedisExchangeRateRepository.save(redis_client, cache_key, rate, expire_time=STOCK_CACHE_SECOND)
+            await collect_exchange_rates(redis_client)
         except Exception as e:
             ic(e)
 
@@ -1,58 +1,46 @@
 import asyncio
 
+import pandas as pd
 import yfinance
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.data.common.enum import MarketIndexEnum
 from app.data.yahoo.source.constant import MARKET_INDEX_TIME_INTERVALS
-from app.data.yahoo.source.service import get_last_week_period_bounds
-from app.module.asset.model import MarketIndexDaily, MarketIndexMonthly, MarketIndexWeekly
+from app.data.yahoo.source.service import get_last_week_period_bounds, get_market_index_records, resample_daily_history
+from app.module.asset.enum import TimeInterval
 from app.module.asset.repository.market_index_daily_repository import MarketIndexDailyRepository
 from app.module.asset.repository.market_index_monthly_repository import MarketIndexMonthlyRepository
 from app.module.asset.repository.market_index_weekly_repository import MarketIndexWeeklyRepository
 from database.dependency import get_mysql_session
 
 
-async def fetch_and_save_market_index_data(
+async def save_market_index_data(
     session: AsyncSession,
     index_symbol: str,
-    start_period: str,
-    end_period: str,
-    interval: str,
-    model: MarketIndexDaily | MarketIndexWeekly | MarketIndexMonthly,
+    index_data: pd.DataFrame,
     repository: MarketIndexDailyRepository | MarketIndexWeeklyRepository | MarketIndexMonthlyRepository,
 ):
-    index_data = yfinance.download(index_symbol, start=start_period, end=end_period, interval=interval, progress=False)
+    market_index_records = get_market_index_records(index_data, index_symbol.value.lstrip("^"))
 
-    if index_data.empty:
-        print(f"{index_symbol} 데이터를 찾지 못 했습니다.")
-        return
+    if market_index_records:
+        saved_count = await repository.bulk_upsert_records(session, market_index_records)
+        print(f"{index_symbol}의 {len(market_index_records)}건 중 {saved_count}건 데이터를 저장 하였습니다.")
 
-    market_index_records = []
 
-    for index, row in index_data.iterrows():
-        market_index_record = model(
-            name=index_symbol.value.lstrip("^"),
-            date=index.date(),
-            open_price=row["Open"],
-            close_price=row["Close"],
-            high_price=row["High"],
-            low_price=row["Low"],
-            volume=row["Volume"],
-        )
-        market_index_records.append(market_index_record)
-
-    if market_index_records:
-        await repository.bulk_upsert(session, market_index_records)
-        print(f"{index_symbol}의 {len(market_index_records)} 데이터를 저장 하였습니다.")
+async def fetch_and_save_all_intervals(session: AsyncSession, index_symbol: str, start_period: int, end_period: int):
+    daily_index_data = yfinance.download(
+        index_symbol, start=start_period, end=end_period, interval=TimeInterval.DAY.value, progress=False
+    )
 
+    if daily_index_data.empty:
+        print(f"{index_symbol} 데이터를 찾지 못 했습니다.")
+        return
 
-async def fetch_and_save_all_intervals(session: AsyncSession, index_symbol: str, start_period: str, end_period: str):
-    for time_interval, model, repository in MARKET_INDEX_TIME_INTERVALS:
+    # 일봉 한 번만 받아오고, 주봉/월봉은 일봉으로 만듭니다.
+    for time_interval, _, repository in MARKET_INDEX_TIME_INTERVALS:
+        index_data = resample_daily_history(daily_index_data, time_interval, start_period)
         # [객체 안 객체 인식 안됨]
-        await fetch_and_save_market_index_data(
-            session, index_symbol, start_period, end_period, time_interval.value, model, repository  # type: ignore
-        )
+        await save_market_index_data(session, index_symbol, index_data, repository)  # type: ignore
 
 
 async def main():
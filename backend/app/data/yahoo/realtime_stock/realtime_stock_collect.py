@@ -1,94 +1,64 @@
-import argparse
 import asyncio
-import json
+from collections.abc import Callable
 
-import yfinance
 from icecream import ic
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.util.time import get_now_datetime
 from app.data.common.constant import STOCK_CACHE_SECOND
-from app.data.yahoo.source.service import format_stock_code
-from app.module.asset.enum import Country
+from app.data.common.service import StockCodeFileReader
+from app.data.yahoo.source.quote import QuoteCollector
+from app.data.yahoo.source.service import get_yahoo_stock_code_map
 from app.module.asset.model import StockMinutely
 from app.module.asset.redis_repository import RedisRealTimeStockRepository
 from app.module.asset.repository.stock_minutely_repository import StockMinutelyRepository
-from app.module.asset.schema import StockInfo
-from database.dependency import get_mysql_session, get_redis_pool
+from app.module.asset.services.portfolio_snapshot_service import PortfolioSnapshotService
+from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
+from database.config import mysql_session_factory
+from database.dependency import get_redis_pool
 
 
-def fetch_stock_price(stock_code: str, code: str) -> tuple[str, float]:
-    try:
-        stock = yfinance.Ticker(stock_code)
-        current_price = stock.info.get("bid")
-        return code, current_price
-    except ValueError as ve:
-        ic(f"Error fetching stock data for {stock_code}: {ve}")
-        return code, 0.0
-    except Exception as e:
-        ic(f"Error fetching stock data: {e}")
-        return code, 0.0
-
-
-async def collect_stock_data(redis_client: Redis, session: AsyncSession, stock_code_list: list[StockInfo]) -> None:
+async def collect_stock_data(
+    redis_client: Redis, session: AsyncSession, collector: QuoteCollector, stock_code_map: dict[str, str]
+) -> int:
     now = get_now_datetime()
-    code_price_pairs = []
-    db_bulk_data = []
-    fetch_tasks = []
-
-    event_loop = asyncio.get_event_loop()
-
-    for stock_dict in stock_code_list:
-        trimmed_stock_dict = {
-            key: value.strip() if isinstance(value, str) else value for key, value in stock_dict.items()
-        }
-        stockinfo = StockInfo(**trimmed_stock_dict)
-        try:
-            country = Country[stockinfo.country.upper().replace(" ", "_")]
-            stock_code = format_stock_code(
-                stockinfo.code,
-                country,
-                stockinfo.market_index.upper(),
-            )
-
-            fetch_tasks.append(event_loop.run_in_executor(None, fetch_stock_price, stock_code, stockinfo.code))
-        except Exception as e:
-            ic(f"Error formatting stock code: {e}")
-            continue
+    symbol_prices = await collector.fetch_prices(list(stock_code_map))
 
-    code_price_pairs = await asyncio.gather(*fetch_tasks)
-
-    redis_bulk_data = [(code, price) for code, price in code_price_pairs if price]
-
-    for code, price in redis_bulk_data:
-        current_stock_data = StockMinutely(code=code, datetime=now, current_price=price)
-        db_bulk_data.append(current_stock_data)
+    redis_bulk_data = [(stock_code_map[symbol], price) for symbol, price in symbol_prices.items() if price]
+    db_bulk_data = [StockMinutely(code=code, datetime=now, current_price=price) for code, price in redis_bulk_data]
 
     if redis_bulk_data:
         await RedisRealTimeStockRepository.bulk_save(redis_client, redis_bulk_data, expire_time=STOCK_CACHE_SECOND)
+        await PortfolioSnapshotService.invalidate_prices(redis_client)
 
     if db_bulk_data:
-        await StockMinutelyRepository.bulk_upsert(session, db_bulk_data)
+        saved_count = await StockMinutelyRepository.bulk_upsert(session, db_bulk_data)
+        if saved_count != len(db_bulk_data):
+            ic(f"[collect_stock_data] 분봉 {len(db_bulk_data)}건 중 {saved_count}건만 저장했습니다.")
+
+    ic(f"[collect_stock_data] {len(stock_code_map)}건 중 {len(redis_bulk_data)}건의 현재가를 저장했습니다.")
+    return len(redis_bulk_data)
 
 
-async def main():
-    parser = argparse.ArgumentParser(description="Process stock code chunk.")
-    parser.add_argument("stock_code_list", type=str, help="JSON serialized list of stock codes")
-    args = parser.parse_args()
+def load_stock_code_map() -> dict[str, str]:
+    return get_yahoo_stock_code_map(StockCodeFileReader.get_all_stock_code_list())
 
-    stock_code_list_chunk = json.loads(args.stock_code_list)
+
+async def run_stock_shard(
+    collector: QuoteCollector, stock_code_map: dict[str, str], heartbeat: Callable[[], None]
+) -> None:
     redis_client = get_redis_pool()
 
+    # 샤드들은 같은 프로세스의 DB 커넥션 풀, redis 풀, HTTP 세션을 함께 사용합니다.
     while True:
         try:
-            async with get_mysql_session() as session:
-                await collect_stock_data(redis_client, session, stock_code_list_chunk)
+            async with mysql_session_factory() as session:
+                saved_count = await collect_stock_data(redis_client, session, collector, stock_code_map)
+            # 조회가 모두 실패해도 예외 없이 끝나므로, 현재가를 하나라도 저장한 경우에만 정상으로 알립니다.
+            if saved_count > 0:
+                heartbeat()
         except Exception as e:
             ic(f"Error occurred: {e}")
         finally:
             await asyncio.sleep(10)
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
@@ -1,70 +1,24 @@
 import asyncio
-import json
-import os
-from os import getenv
+from functools import partial
 
-from dotenv import load_dotenv
-from more_itertools import chunked
-
-from app.data.common.service import StockCodeFileReader
-from app.data.yahoo.source.constant import REALTIME_STOCK_LIST
-from database.enum import EnvironmentType
-
-load_dotenv()
-
-ENVIRONMENT = getenv("ENVIRONMENT", None)
-
-
-async def spawn_cluster_process(stock_code_list_chunk):
-    stock_code_list_chunk_serializable = [stock.model_dump() for stock in stock_code_list_chunk]
-
-    if ENVIRONMENT == EnvironmentType.DEV:
-        command = [
-            "python",
-            "app/data/yahoo/realtime_stock/realtime_stock_collect.py",
-            json.dumps(stock_code_list_chunk_serializable),
-        ]
-
-        env = os.environ.copy()
-        env["PYTHONPATH"] = "/Users/kcw2297/Desktop/assetManagement/backend"
-
-        process = await asyncio.create_subprocess_exec(
-            *command, cwd="/Users/kcw2297/Desktop/assetManagement/backend", env=env
-        )
-
-        print(f"Spawned subprocess with PID: {process.pid}")
-    else:
-        python_executable = "/usr/local/bin/python"
-        script_path = "/app/app/data/yahoo/realtime_stock/realtime_stock_collect.py"
-
-        command = [
-            python_executable,
-            script_path,
-            json.dumps(stock_code_list_chunk_serializable),
-        ]
-
-        env = os.environ.copy()
-        env["PYTHONPATH"] = "/app"
-
-        process = await asyncio.create_subprocess_exec(*command, cwd="/app", env=env)
-
-        print(f"Spawned subprocess with PID: {process.pid}")
-
-    return process.pid
+from app.data.common.supervisor import CollectorSupervisor
+from app.data.yahoo.realtime_stock.realtime_stock_collect import load_stock_code_map, run_stock_shard
+from app.data.yahoo.source.constant import REALTIME_STOCK_SHARD_SIZE
+from app.data.yahoo.source.quote import QuoteCollector, YahooQuoteSource
+from database.dependency import get_redis_pool
 
 
 async def main():
-    stock_code_list = StockCodeFileReader.get_all_stock_code_list()
-
-    stock_code_list_chunks = chunked(stock_code_list, REALTIME_STOCK_LIST)
-
-    cluster_tasks = [spawn_cluster_process(stock_code_list_chunk) for stock_code_list_chunk in stock_code_list_chunks]
-
-    pids = await asyncio.gather(*cluster_tasks, return_exceptions=True)
-
-    print(f"All subprocesses started with PIDs: {pids}")
-    while True:
-        await asyncio.sleep(3600)
+    # 요청 제한이 샤드 전체에 함께 걸리도록 수집기 하나를 모든 샤드가 공유합니다.
+    async with QuoteCollector(YahooQuoteSource()) as collector:
+        supervisor = CollectorSupervisor(
+            "realtime_stock",
+            load_stock_code_map,
+            partial(run_stock_shard, collector),
+            get_redis_pool(),
+            REALTIME_STOCK_SHARD_SIZE,
+        )
+        await supervisor.run()
 
 
 if __name__ == "__main__":
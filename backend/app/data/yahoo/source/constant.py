@@ -18,7 +18,26 @@ STOCK_SCHEDULE_INTERVAL = "7d"
 STOCK_TIME_INTERVAL = "1d"
 STOCK_HISTORY_TIMERANGE_YEAR = 15
 BATCH_SIZE = 100
-REALTIME_STOCK_LIST = 200
+REALTIME_STOCK_SHARD_SIZE = 1000
+STOCK_ALL_DOWNLOAD_BATCH_SIZE = 20
+STOCK_ALL_WORKER_COUNT = 4
+STOCK_ALL_QUEUE_SIZE = 8
+DIVIDEND_WORKER_COUNT = 8
+
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+YAHOO_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+YAHOO_COOKIE_URL = "https://fc.yahoo.com"
+YAHOO_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+QUOTE_BATCH_SIZE = 50
+QUOTE_CONCURRENCY = 4
+QUOTE_REQUEST_PER_SECOND = 5
+QUOTE_RETRY_COUNT = 3
+QUOTE_BACKOFF_SECOND = 1
+QUOTE_TIMEOUT_SECOND = 5
+# 401은 crumb 만료로 보고, crumb를 다시 발급받아 재시도합니다.
+QUOTE_RETRYABLE_STATUS = (401, 429, 500, 502, 503, 504)
 
 
 TIME_INTERVAL_MODEL_REPO_MAP = {
@@ -39,3 +58,19 @@ MARKET_INDEX_TIME_INTERVALS = [
     (TimeInterval.WEEK, MarketIndexWeekly, MarketIndexWeeklyRepository),
     (TimeInterval.MONTH, MarketIndexMonthly, MarketIndexMonthlyRepository),
 ]
+
+# 주봉은 월요일, 월봉은 1일 기준으로 yahoo 와 같은 날짜를 사용합니다.
+RESAMPLE_RULE_MAP = {
+    TimeInterval.WEEK: "W-MON",
+    TimeInterval.MONTH: "MS",
+}
+
+OHLCV_AGGREGATION = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+}
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
@@ -0,0 +1,149 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+from icecream import ic
+from more_itertools import chunked
+
+from app.data.yahoo.source.constant import (
+    QUOTE_BACKOFF_SECOND,
+    QUOTE_BATCH_SIZE,
+    QUOTE_CONCURRENCY,
+    QUOTE_REQUEST_PER_SECOND,
+    QUOTE_RETRY_COUNT,
+    QUOTE_RETRYABLE_STATUS,
+    QUOTE_TIMEOUT_SECOND,
+    YAHOO_COOKIE_URL,
+    YAHOO_CRUMB_URL,
+    YAHOO_QUOTE_URL,
+    YAHOO_USER_AGENT,
+)
+
+
+class QuoteSource(ABC):
+    @abstractmethod
+    async def fetch_quotes(self, session: ClientSession, symbols: list[str]) -> dict[str, float]:
+        """한 번의 요청으로 여러 종목의 현재가를 조회해 {심볼: 가격}으로 반환합니다."""
+
+
+class YahooQuoteSource(QuoteSource):
+    def __init__(
+        self,
+        quote_url: str = YAHOO_QUOTE_URL,
+        crumb_url: str | None = YAHOO_CRUMB_URL,
+        cookie_url: str = YAHOO_COOKIE_URL,
+    ):
+        self.quote_url = quote_url
+        self.crumb_url = crumb_url
+        self.cookie_url = cookie_url
+        self.crumb: str | None = None
+        self._crumb_lock = asyncio.Lock()
+
+    async def fetch_quotes(self, session: ClientSession, symbols: list[str]) -> dict[str, float]:
+        params = {"symbols": ",".join(symbols)}
+        crumb = await self._get_crumb(session)
+        if crumb is not None:
+            params["crumb"] = crumb
+
+        async with session.get(self.quote_url, params=params) as response:
+            if response.status == 401 and self.crumb == crumb:
+                # crumb가 만료되면 다음 요청에서 다시 발급받습니다. 다른 요청이 이미 새로 발급받았다면 그대로 둡니다.
+                self.crumb = None
+            response.raise_for_status()
+            payload = await response.json()
+
+        quotes = payload.get("quoteResponse", {}).get("result", [])
+        # 장외 시간에는 bid가 0으로 내려오므로 정규장 가격으로 대신합니다.
+        return {
+            quote["symbol"]: price for quote in quotes if (price := quote.get("bid") or quote.get("regularMarketPrice"))
+        }
+
+    async def _get_crumb(self, session: ClientSession) -> str | None:
+        if self.crumb_url is None or self.crumb is not None:
+            return self.crumb
+
+        # 동시에 만료를 확인한 요청들이 각자 crumb를 발급받지 않도록, 한 요청만 발급받고 나머지는 그 값을 사용합니다.
+        async with self._crumb_lock:
+            if self.crumb is not None:
+                return self.crumb
+
+            async with session.get(self.cookie_url):
+                pass
+            async with session.get(self.crumb_url) as response:
+                response.raise_for_status()
+                self.crumb = await response.text()
+        return self.crumb
+
+
+class QuoteCollector:
+    def __init__(
+        self,
+        source: QuoteSource,
+        batch_size: int = QUOTE_BATCH_SIZE,
+        concurrency: int = QUOTE_CONCURRENCY,
+        request_per_second: float = QUOTE_REQUEST_PER_SECOND,
+        retry_count: int = QUOTE_RETRY_COUNT,
+        backoff_second: float = QUOTE_BACKOFF_SECOND,
+    ):
+        self.source = source
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.request_interval = 1 / request_per_second
+        self.retry_count = retry_count
+        self.backoff_second = backoff_second
+
+        self._session: ClientSession | None = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
+    async def __aenter__(self) -> "QuoteCollector":
+        # 요청마다 연결을 새로 맺지 않도록 세션 하나를 수집 주기 내내 재사용합니다.
+        self._session = ClientSession(
+            connector=TCPConnector(limit=self.concurrency),
+            timeout=ClientTimeout(total=QUOTE_TIMEOUT_SECOND),
+            headers={"User-Agent": YAHOO_USER_AGENT},
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+        self._session = None
+
+    async def fetch_prices(self, symbols: list[str]) -> dict[str, float]:
+        batch_results = await asyncio.gather(
+            *(self._fetch_batch(list(batch)) for batch in chunked(symbols, self.batch_size))
+        )
+
+        prices: dict[str, float] = {}
+        for batch_result in batch_results:
+            prices.update(batch_result)
+        return prices
+
+    async def _fetch_batch(self, symbols: list[str]) -> dict[str, float]:
+        for attempt in range(1, self.retry_count + 1):
+            async with self._semaphore:
+                await self._wait_rate_limit()
+                try:
+                    return await self.source.fetch_quotes(self._session, symbols)
+                except ClientResponseError as e:
+                    if e.status not in QUOTE_RETRYABLE_STATUS:
+                        ic(f"[QuoteCollector] {symbols[0]} 외 {len(symbols)}건 조회에 실패했습니다: {e.status}")
+                        return {}
+                except (ClientError, asyncio.TimeoutError) as e:
+                    ic(f"[QuoteCollector] {symbols[0]} 외 {len(symbols)}건 조회 중 에러가 발생했습니다: {e}")
+
+            await asyncio.sleep(self.backoff_second * 2 ** (attempt - 1))
+
+        ic(f"[QuoteCollector] {symbols[0]} 외 {len(symbols)}건을 {self.retry_count}회 시도했으나 실패했습니다.")
+        return {}
+
+    async def _wait_rate_limit(self) -> None:
+        # 요청 시작 시각을 request_interval 간격으로 벌려, 초당 요청 수를 제한합니다.
+        async with self._rate_lock:
+            now = asyncio.get_running_loop().time()
+            wait_second = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.request_interval
+
+        if wait_second > 0:
+            await asyncio.sleep(wait_second)
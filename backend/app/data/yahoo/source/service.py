@@ -1,8 +1,12 @@
 import datetime
 
+import numpy as np
+import pandas as pd
+
 from app.common.util.time import end_timestamp, start_timestamp
+from app.data.yahoo.source.constant import OHLCV_AGGREGATION, PRICE_COLUMNS, RESAMPLE_RULE_MAP
 from app.module.asset.constant import KOSPI
-from app.module.asset.enum import Country, CountryMarketCode
+from app.module.asset.enum import Country, CountryMarketCode, CurrencyType, TimeInterval
 from app.module.asset.model import (  # noqa: F401 > relationship 설정시 필요합니다.
     Asset,
     AssetStock,
@@ -12,6 +16,7 @@ from app.module.asset.model import (  # noqa: F401 > relationship 설정시 필
     StockMonthly,
     StockWeekly,
 )
+from app.module.asset.schema import StockInfo
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
 
 
@@ -19,12 +24,40 @@ def get_last_week_period_bounds() -> tuple[int, int]:
     now = datetime.datetime.now()
     seven_days_ago = now - datetime.timedelta(days=7)
 
-    start_period = int(seven_days_ago.timestamp())
+    # 주봉/월봉을 일봉으로 다시 만들 수 있도록, 7일 전이 속한 주와 달의 시작일부터 조회합니다.
+    week_start = seven_days_ago - datetime.timedelta(days=seven_days_ago.weekday())
+    month_start = seven_days_ago.replace(day=1)
+    period_start = min(week_start, month_start).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    start_period = int(period_start.timestamp())
     end_period = int(now.timestamp())
 
     return start_period, end_period
 
 
+def get_fetch_start_date(last_dates: list[datetime.date | None], default_start_date: datetime.date) -> datetime.date:
+    # 저장된 적이 없는 주기가 있으면 기본 구간부터 조회합니다.
+    if any(last_date is None for last_date in last_dates):
+        return default_start_date
+
+    # 주봉/월봉은 마지막 구간을 처음부터 다시 만들어야 하므로, 주기별 마지막 봉 날짜 중 가장 이른 날부터 조회합니다.
+    # 수집이 며칠 빠져도 이 날짜부터 다시 받으므로 빈 구간이 자동으로 채워집니다.
+    return min(last_dates)
+
+
+def get_dividend_fetch_start_date(
+    checked_at: datetime.datetime | None, last_date: datetime.date | None
+) -> datetime.date | None:
+    # 마지막으로 조회한 날부터 다시 받아, 배당이 없는 종목도 매번 전체 이력을 받지 않도록 합니다.
+    if checked_at is not None:
+        return checked_at.date()
+
+    # 조회 기록이 없으면 저장된 마지막 배당 다음 날부터, 둘 다 없으면 전체 이력을 조회합니다.
+    if last_date is not None:
+        return last_date + datetime.timedelta(days=1)
+    return None
+
+
 def get_period_bounds(stock_history_timerange: int) -> tuple[int, int]:
     now = datetime.datetime.now()
     current_year = now.year
@@ -34,6 +67,90 @@ def get_period_bounds(stock_history_timerange: int) -> tuple[int, int]:
     return start_timestamp(start_year, current_month), end_timestamp(current_year, current_month)
 
 
+def resample_daily_history(df: pd.DataFrame, interval: TimeInterval, start_period: int) -> pd.DataFrame:
+    if interval == TimeInterval.DAY or df.empty:
+        return df
+
+    resampled_df = (
+        df.resample(RESAMPLE_RULE_MAP[interval], label="left", closed="left")
+        .agg(OHLCV_AGGREGATION)
+        .dropna(subset=["Close"])
+    )
+
+    # 조회 시작일 이전에 시작하는 주/월 구간은 일부 일자만 포함하므로 저장하지 않습니다.
+    start_date = datetime.datetime.fromtimestamp(start_period).date()
+    return resampled_df[resampled_df.index.date >= start_date]
+
+
+def get_stock_records(df: pd.DataFrame, stock_code: str) -> list[dict]:
+    ohlcv_df = get_valid_ohlcv(df)
+    return [
+        {
+            "code": stock_code,
+            "date": stock_date,
+            "opening_price": opening_price,
+            "highest_price": highest_price,
+            "lowest_price": lowest_price,
+            "close_price": close_price,
+            "adj_close_price": close_price,
+            "trade_volume": trade_volume,
+        }
+        for stock_date, opening_price, highest_price, lowest_price, close_price, trade_volume in zip(
+            ohlcv_df.index.date.tolist(),
+            ohlcv_df["Open"].tolist(),
+            ohlcv_df["High"].tolist(),
+            ohlcv_df["Low"].tolist(),
+            ohlcv_df["Close"].tolist(),
+            ohlcv_df["Volume"].tolist(),
+        )
+    ]
+
+
+def get_new_dividend_records(dividends: pd.Series, stock_code: str, last_date: datetime.date | None) -> list[dict]:
+    # 이미 저장된 마지막 배당일 이후의 배당만 남깁니다.
+    dividend_dates = pd.to_datetime(dividends.index).date
+    return [
+        {"dividend": float(dividend_amount), "stock_code": stock_code, "date": dividend_date}
+        for dividend_date, dividend_amount in zip(dividend_dates.tolist(), dividends.tolist())
+        if dividend_amount > 0 and (last_date is None or dividend_date > last_date)
+    ]
+
+
+def get_market_index_records(df: pd.DataFrame, index_name: str) -> list[dict]:
+    ohlcv_df = get_valid_ohlcv(df)
+    return [
+        {
+            "name": index_name,
+            "date": index_date,
+            "open_price": open_price,
+            "high_price": high_price,
+            "low_price": low_price,
+            "close_price": close_price,
+            "volume": volume,
+        }
+        for index_date, open_price, high_price, low_price, close_price, volume in zip(
+            ohlcv_df.index.date.tolist(),
+            ohlcv_df["Open"].tolist(),
+            ohlcv_df["High"].tolist(),
+            ohlcv_df["Low"].tolist(),
+            ohlcv_df["Close"].tolist(),
+            ohlcv_df["Volume"].tolist(),
+        )
+    ]
+
+
+def get_valid_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    # 행 단위 검증 대신 컬럼 단위로 형변환하고, 가격이 비어 있거나 무한대인 행은 제외합니다.
+    if df.empty:
+        return pd.DataFrame(columns=list(OHLCV_AGGREGATION), index=pd.DatetimeIndex([]))
+
+    prices = df[PRICE_COLUMNS].astype("float64")
+    valid = np.isfinite(prices.to_numpy()).all(axis=1)
+
+    volume = pd.to_numeric(df.loc[valid, "Volume"], errors="coerce").fillna(0).astype("int64")
+    return prices[valid].assign(Volume=volume)
+
+
 def format_stock_code(code: str, country: Country, market_index: str) -> str:
     if country == Country.USA:
         return code
@@ -72,3 +189,35 @@ def format_stock_code(code: str, country: Country, market_index: str) -> str:
         return f"{code}.{CountryMarketCode.UK}"
     else:
         return code
+
+
+def get_yahoo_stock_code_map(stock_list: list[StockInfo]) -> dict[str, str]:
+    stock_code_map = {}
+    for stock_info in stock_list:
+        try:
+            yahoo_stock_code = format_stock_code(
+                stock_info.code,
+                Country[stock_info.country.upper().replace(" ", "_")],
+                stock_info.market_index.upper(),
+            )
+        except KeyError:
+            print(f"Skipping stock with invalid market index: {stock_info.market_index}")
+            continue
+        stock_code_map[yahoo_stock_code] = stock_info.code
+    return stock_code_map
+
+
+def get_exchange_rate_symbol(currency: CurrencyType) -> str:
+    return f"{CurrencyType.USA}{currency}=X"
+
+
+def get_cross_exchange_rates(
+    usd_rates: dict[CurrencyType, float], currency_pairs: list[tuple[CurrencyType, CurrencyType]]
+) -> dict[str, float]:
+    # usd_rates는 1달러당 각 통화의 가격이며, 모든 환율을 달러를 거쳐 계산합니다.
+    rates = {**usd_rates, CurrencyType.USA: 1.0}
+    return {
+        f"{source_currency}_{target_currency}": rates[target_currency] / rates[source_currency]
+        for source_currency, target_currency in currency_pairs
+        if rates.get(source_currency) and rates.get(target_currency)
+    }
@@ -1,88 +1,117 @@
 import asyncio
+import time
+from datetime import date, datetime
 
 import yfinance
 from icecream import ic
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.data.common.service import get_all_stock_code_list
-from app.data.yahoo.source.constant import TIME_INTERVAL_MODEL_REPO_MAP, TIME_INTERVAL_REPOSITORY_MAP
-from app.data.yahoo.source.schema import StockDataFrame
-from app.data.yahoo.source.service import format_stock_code, get_last_week_period_bounds
+from app.data.yahoo.source.constant import TIME_INTERVAL_REPOSITORY_MAP
+from app.data.yahoo.source.service import (
+    format_stock_code,
+    get_fetch_start_date,
+    get_last_week_period_bounds,
+    get_stock_records,
+    resample_daily_history,
+)
 from app.module.asset.enum import Country, TimeInterval
-from app.module.asset.model import Stock, StockDaily, StockMonthly, StockWeekly  # noqa: F401 > relationship 설정시 필요합니다.
+from app.module.asset.model import (  # noqa: F401 > relationship 설정시 필요합니다.
+    Stock,
+    StockDaily,
+    StockIngestionWatermark,
+    StockMonthly,
+    StockWeekly,
+)
+from app.module.asset.repository.stock_ingestion_watermark_repository import StockIngestionWatermarkRepository
 from app.module.asset.schema import StockInfo
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
 from database.dependency import get_mysql_session
 
 
-async def process_stock_data(session: AsyncSession, stock_list: list[StockInfo], start_period: int, end_period: int):
+async def process_stock_data(session: AsyncSession, stock_list: list[StockInfo], default_start_period: int):
+    started_at = time.monotonic()
+    now = datetime.now()
+    end_period = int(now.timestamp())
+    default_start_date = datetime.fromtimestamp(default_start_period).date()
+    watermark_map: dict[tuple[str, str], StockIngestionWatermark] = await StockIngestionWatermarkRepository.get_map(
+        session
+    )
+
+    fetched_stock_count = 0
+    resumed_stock_count = 0
+    saved_row_count = 0
+
     for stock_info in stock_list:
-        for interval in TimeInterval:
-            stock_model = TIME_INTERVAL_MODEL_REPO_MAP[interval]
-            interval_repository = TIME_INTERVAL_REPOSITORY_MAP[interval]
-
-            try:
-                stock_code = format_stock_code(
-                    stock_info.code,
-                    Country[stock_info.country.upper().replace(" ", "_")],
-                    stock_info.market_index.upper(),
-                )
-            except KeyError:
-                ic(f"Skipping stock with invalid market index: {stock_info.market_index}")
-                continue
-
-            try:
-                stock = yfinance.Ticker(stock_code)
-                df = stock.history(start=start_period, end=end_period, interval=interval.value)
-                df.reset_index(inplace=True)
-            except Exception as e:
-                ic(f"{e=}")
-                continue
-
-            stock_rows = []
-
-            for _, row in df.iterrows():
-                try:
-                    stock_dataframe = StockDataFrame(
-                        date=row["Date"].strftime("%Y-%m-%d"),
-                        open=row["Open"],
-                        high=row["High"],
-                        low=row["Low"],
-                        close=row["Close"],
-                        adj_close=row["Close"],
-                        volume=row["Volume"],
+        watermarks = [watermark_map.get((stock_info.code, interval)) for interval in TimeInterval]
+
+        # 오늘 이미 수집을 마친 종목은 건너뛰어, 중단된 실행을 다시 돌리면 멈춘 지점부터 이어서 수집합니다.
+        if all(watermark is not None and watermark.checked_at.date() >= now.date() for watermark in watermarks):
+            resumed_stock_count += 1
+            continue
+
+        try:
+            stock_code = format_stock_code(
+                stock_info.code,
+                Country[stock_info.country.upper().replace(" ", "_")],
+                stock_info.market_index.upper(),
+            )
+        except KeyError:
+            ic(f"Skipping stock with invalid market index: {stock_info.market_index}")
+            continue
+
+        last_dates: list[date | None] = [watermark.last_date if watermark else None for watermark in watermarks]
+        start_date = get_fetch_start_date(last_dates, default_start_date)
+        start_period = int(datetime.combine(start_date, datetime.min.time()).timestamp())
+
+        try:
+            stock = yfinance.Ticker(stock_code)
+            daily_df = stock.history(start=start_period, end=end_period, interval=TimeInterval.DAY.value)
+        except Exception as e:
+            ic(f"{e=}")
+            continue
+        fetched_stock_count += 1
+
+        # 일봉 한 번만 받아오고, 주봉/월봉은 일봉으로 만듭니다.
+        watermark_records = []
+        for interval, last_date in zip(TimeInterval, last_dates):
+            stock_records = get_stock_records(resample_daily_history(daily_df, interval, start_period), stock_info.code)
+
+            if stock_records:
+                saved_count = await TIME_INTERVAL_REPOSITORY_MAP[interval].bulk_upsert_records(session, stock_records)
+                saved_row_count += saved_count
+
+                # 일부 배치라도 저장에 실패하면 워터마크를 그대로 두어, 다음 실행에서 같은 구간을 다시 수집합니다.
+                if saved_count != len(stock_records):
+                    ic(
+                        f"[process_stock_data] {stock_info.code} {interval.value} {len(stock_records)}건 중 {saved_count}건만 저장"
                     )
-                except Exception:
                     continue
 
-                stock_row = stock_model(
-                    code=stock_info.code,
-                    date=stock_dataframe.date,
-                    opening_price=stock_dataframe.open,
-                    highest_price=stock_dataframe.high,
-                    lowest_price=stock_dataframe.low,
-                    close_price=stock_dataframe.close,
-                    adj_close_price=stock_dataframe.adj_close,
-                    trade_volume=stock_dataframe.volume,
-                )
+                fetched_last_date = max(stock_record["date"] for stock_record in stock_records)
+                last_date = max(last_date, fetched_last_date) if last_date else fetched_last_date
+
+            watermark_records.append(
+                {"code": stock_info.code, "interval": interval.value, "last_date": last_date, "checked_at": now}
+            )
 
-                stock_rows.append(stock_row)
+        # 종목마다 저장이 끝난 뒤 워터마크를 남겨, 다음 실행의 조회 시작일과 재시작 지점으로 사용합니다.
+        if watermark_records:
+            await StockIngestionWatermarkRepository.bulk_upsert_records(session, watermark_records)
 
-            try:
-                await interval_repository.bulk_upsert(session, stock_rows)
-            except IntegrityError as e:
-                print(f"{e=}")
-                await session.rollback()
-                continue
+    ic(
+        f"[process_stock_data] 종목 {len(stock_list)}건 중 {fetched_stock_count}건 조회, "
+        f"{resumed_stock_count}건은 오늘 이미 수집되어 건너뜀, {saved_row_count}건 저장, "
+        f"{time.monotonic() - started_at:.1f}초 소요"
+    )
 
 
 async def main():
-    start_period, end_period = get_last_week_period_bounds()
+    default_start_period, _ = get_last_week_period_bounds()
     stock_list: list[StockInfo] = get_all_stock_code_list()
 
     async with get_mysql_session() as session:
-        await process_stock_data(session, stock_list, start_period, end_period)
+        await process_stock_data(session, stock_list, default_start_period)
 
 
 if __name__ == "__main__":
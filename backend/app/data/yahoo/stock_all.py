@@ -1,80 +1,168 @@
 import asyncio
+import time
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
 
+import pandas as pd
 import yfinance
 from icecream import ic
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.data.common.service import get_all_stock_code_list
 from app.data.yahoo.source.constant import (
+    STOCK_ALL_DOWNLOAD_BATCH_SIZE,
+    STOCK_ALL_QUEUE_SIZE,
+    STOCK_ALL_WORKER_COUNT,
     STOCK_HISTORY_TIMERANGE_YEAR,
-    TIME_INTERVAL_MODEL_REPO_MAP,
     TIME_INTERVAL_REPOSITORY_MAP,
 )
-from app.data.yahoo.source.schema import StockDataFrame
-from app.data.yahoo.source.service import format_stock_code, get_period_bounds
-from app.module.asset.enum import Country, TimeInterval
+from app.data.yahoo.source.service import (
+    get_period_bounds,
+    get_stock_records,
+    get_yahoo_stock_code_map,
+    resample_daily_history,
+)
+from app.module.asset.enum import TimeInterval
 from app.module.asset.model import Stock, StockDaily, StockMonthly, StockWeekly  # noqa: F401 > relationship 설정시 필요합니다.
 from app.module.asset.schema import StockInfo
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
 from database.dependency import get_mysql_session
 
 
-async def process_stock_data(session: AsyncSession, stock_list: list[StockInfo], start_period: int, end_period: int):
-    for stock_info in stock_list:
+def download_stock_history(yahoo_stock_codes: list[str], start_period: int, end_period: int) -> dict[str, pd.DataFrame]:
+    # yfinance.download는 모듈 전역 변수에 결과를 모아 합치므로, 여러 스레드에서 동시에 부르면 서로의 결과를 지웁니다.
+    # 스레드 풀에서 실행되므로 호출마다 상태가 분리된 종목별 Ticker로 받아옵니다.
+    stock_histories = {}
+    for yahoo_stock_code in yahoo_stock_codes:
+        try:
+            daily_df = yfinance.Ticker(yahoo_stock_code).history(
+                start=start_period, end=end_period, interval=TimeInterval.DAY.value
+            )
+        except Exception as e:
+            ic(f"[download_stock_history] {yahoo_stock_code} 에러: {e}")
+            continue
+
+        if not daily_df.empty:
+            stock_histories[yahoo_stock_code] = daily_df.dropna(subset=["Close"])
+    return stock_histories
+
+
+async def fetch_stock_batch(
+    queue: asyncio.Queue,
+    executor: ThreadPoolExecutor,
+    semaphore: asyncio.Semaphore,
+    yahoo_stock_codes: list[str],
+    start_period: int,
+    end_period: int,
+):
+    # 큐에 넣을 때까지 semaphore를 쥐고 있어, 메모리에 올라간 응답은 작업자 수 + 큐 크기로 제한됩니다.
+    async with semaphore:
+        loop = asyncio.get_running_loop()
+        try:
+            stock_histories = await loop.run_in_executor(
+                executor, download_stock_history, yahoo_stock_codes, start_period, end_period
+            )
+        except Exception as e:
+            ic(f"[fetch_stock_batch] {yahoo_stock_codes[0]} 외 {len(yahoo_stock_codes) - 1}개 에러: {e}")
+            stock_histories = {}
+
+        await queue.put((yahoo_stock_codes, stock_histories))
+
+
+async def write_stock_batches(
+    session: AsyncSession,
+    queue: asyncio.Queue,
+    stock_code_map: dict[str, str],
+    total_batch_count: int,
+    start_period: int,
+):
+    started_at = time.monotonic()
+    done_batch_count = 0
+    failed_batch_count = 0
+    saved_row_count = 0
+
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+
+        yahoo_stock_codes, stock_histories = item
+        try:
+            saved_row_count += await write_stock_batch(session, stock_histories, stock_code_map, start_period)
+        except Exception as e:
+            # 한 배치의 저장 실패로 writer가 멈추면 수집 작업이 큐에서 기다리게 되므로, 기록만 하고 다음 배치를 처리합니다.
+            failed_batch_count += 1
+            ic(f"[write_stock_batches] {yahoo_stock_codes[0]} 외 {len(yahoo_stock_codes) - 1}개 저장 중 에러: {e}")
+
+        done_batch_count += 1
+        elapsed = time.monotonic() - started_at
+        ic(
+            f"[write_stock_batches] {done_batch_count}/{total_batch_count} 배치, {saved_row_count}건 저장, "
+            f"{failed_batch_count}개 배치 실패, {saved_row_count / elapsed:.1f} rows/s, "
+            f"{done_batch_count * STOCK_ALL_DOWNLOAD_BATCH_SIZE / elapsed:.2f} 종목/s"
+        )
+
+
+async def write_stock_batch(
+    session: AsyncSession,
+    stock_histories: dict[str, pd.DataFrame],
+    stock_code_map: dict[str, str],
+    start_period: int,
+) -> int:
+    saved_row_count = 0
+    for yahoo_stock_code, daily_df in stock_histories.items():
+        # 주봉/월봉은 다시 받아오지 않고 일봉으로 만듭니다.
         for interval in TimeInterval:
-            stock_model = TIME_INTERVAL_MODEL_REPO_MAP[interval]
-            interval_repository = TIME_INTERVAL_REPOSITORY_MAP[interval]
-
-            try:
-                stock_code = format_stock_code(
-                    stock_info.code,
-                    Country[stock_info.country.upper().replace(" ", "_")],
-                    stock_info.market_index.upper(),
-                )
-            except KeyError:
-                print(f"Skipping stock with invalid market index: {stock_info.market_index}")
+            stock_records = get_stock_records(
+                resample_daily_history(daily_df, interval, start_period), stock_code_map[yahoo_stock_code]
+            )
+            if len(stock_records) == 0:
                 continue
 
-            try:
-                stock = yfinance.Ticker(stock_code)
-                df = stock.history(start=start_period, end=end_period, interval=interval.value)
-                df.reset_index(inplace=True)
-            except Exception as e:
-                ic(f"{e=}")
-                continue
+            saved_row_count += await TIME_INTERVAL_REPOSITORY_MAP[interval].bulk_upsert_records(session, stock_records)
+    return saved_row_count
 
-            stock_rows = []
-
-            for _, row in df.iterrows():
-                try:
-                    stock_dataframe = StockDataFrame(
-                        date=row["Date"].strftime("%Y-%m-%d"),
-                        open=row["Open"],
-                        high=row["High"],
-                        low=row["Low"],
-                        close=row["Close"],
-                        adj_close=row["Close"],
-                        volume=row["Volume"],
-                    )
-                except Exception as e:
-                    ic(f"{e=}")
-                    continue
-
-                stock_row = stock_model(
-                    code=stock_info.code,
-                    date=stock_dataframe.date,
-                    opening_price=stock_dataframe.open,
-                    highest_price=stock_dataframe.high,
-                    lowest_price=stock_dataframe.low,
-                    close_price=stock_dataframe.close,
-                    adj_close_price=stock_dataframe.adj_close,
-                    trade_volume=stock_dataframe.volume,
-                )
 
-                stock_rows.append(stock_row)
+async def wait_with_writer(writer: asyncio.Task, awaitable: Awaitable) -> None:
+    # writer가 먼저 끝났다면 예외로 멈춘 것이므로, 큐에서 기다리는 작업을 취소하고 writer의 예외를 올립니다.
+    task = asyncio.ensure_future(awaitable)
+    done, _ = await asyncio.wait({writer, task}, return_when=asyncio.FIRST_COMPLETED)
+    if task in done:
+        task.result()
+        return
 
-            await interval_repository.bulk_upsert(session, stock_rows)
-            ic("저장하였습니다.")
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    writer.result()
+    raise RuntimeError("[wait_with_writer] writer가 종료 신호를 받기 전에 끝났습니다.")
+
+
+async def process_stock_data(session: AsyncSession, stock_list: list[StockInfo], start_period: int, end_period: int):
+    stock_code_map = get_yahoo_stock_code_map(stock_list)
+    yahoo_stock_codes = list(stock_code_map)
+    stock_batches = [
+        yahoo_stock_codes[i : i + STOCK_ALL_DOWNLOAD_BATCH_SIZE]
+        for i in range(0, len(yahoo_stock_codes), STOCK_ALL_DOWNLOAD_BATCH_SIZE)
+    ]
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STOCK_ALL_QUEUE_SIZE)
+    semaphore = asyncio.Semaphore(STOCK_ALL_WORKER_COUNT)
+
+    with ThreadPoolExecutor(max_workers=STOCK_ALL_WORKER_COUNT) as executor:
+        writer = asyncio.create_task(
+            write_stock_batches(session, queue, stock_code_map, len(stock_batches), start_period)
+        )
+        await wait_with_writer(
+            writer,
+            asyncio.gather(
+                *(
+                    fetch_stock_batch(queue, executor, semaphore, batch, start_period, end_period)
+                    for batch in stock_batches
+                )
+            ),
+        )
+        await wait_with_writer(writer, queue.put(None))
+        await writer
 
 
 async def main():
@@ -73,6 +73,20 @@ STOCK_QUANTITIES = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
 
 
 REDIS_STOCK_EXPIRE_SECOND = 60 * 60 * 24
+PRICE_EPOCH_KEY = "price_epoch"
+PRICE_EPOCH_THROTTLE_KEY = "price_epoch_throttle"
+PRICE_EPOCH_THROTTLE_SECOND = 30
+PORTFOLIO_SNAPSHOT_KEY = "portfolio_snapshot"
+PORTFOLIO_VERSION_KEY = "portfolio_version"
+PORTFOLIO_SNAPSHOT_EXPIRE_SECOND = 60
+DIVIDEND_CALENDAR_KEY = "dividend_calendar"
+DIVIDEND_CALENDAR_EXPIRE_SECOND = 60 * 60 * 24 * 2
+DIVIDEND_CALENDAR_HORIZON_DAYS = 365
+DIVIDEND_INACTIVE_DAYS = 365 + 90
+DIVIDEND_FREQUENCY_SAMPLE_SIZE = 8
+DIVIDEND_FREQUENCY_GAP_DAYS = [(45, 12), (135, 4), (250, 2)]
+MARKET_INDEX_UPDATED_AT_KEY = "market_index_updated_at"
+MARKET_INDEX_STALE_SECOND = 60 * 5
 
 MARKET_INDEX_KR_MAPPING = {
     "KS11": "코스피",
@@ -192,3 +206,6 @@ COUNTRY_TRANSLATIONS = {
 }
 
 RequiredAssetField = ["id", "buy_date", "purchase_currency_type", "quantity", "stock_name"]
+
+# 보존 기간이 지난 분 단위 시세는 30분 구간으로 묶어 보관합니다.
+MINUTELY_ROLLUP_SECOND = 60 * 30
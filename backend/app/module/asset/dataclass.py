@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 from datetime import date
 
+import numpy as np
+
+from app.module.asset.enum import AccountType, CurrencyType
+from app.module.asset.model import Asset, StockDaily
+
 
 @dataclass
 class StockAssetObject:
@@ -22,3 +27,45 @@ class StockAssetObject:
     stock_code: str
     stock_name: str
     stock_volume: int | None
+
+
+@dataclass
+class Holdings:
+    codes: list[str]
+    names: list[str]
+    code_index: np.ndarray
+    accounts: list[AccountType | None]
+    account_index: np.ndarray
+    currencies: list[CurrencyType]
+    currency_index: np.ndarray
+    quantity: np.ndarray
+    purchase_price: np.ndarray
+    purchase_usd: np.ndarray
+    purchase_date: list[date]
+    purchase_ordinal: np.ndarray
+
+
+@dataclass
+class DividendIndex:
+    # 종목별로 배당일(ordinal) 오름차순 정렬된 배열과 같은 순서의 배당금 배열입니다.
+    ordinals: dict[str, np.ndarray]
+    amounts: dict[str, np.ndarray]
+
+
+@dataclass
+class DividendCalendar:
+    # 연간 배당 횟수와 앞으로 1년간 예상되는 배당일(ordinal), 배당금입니다.
+    frequency: int
+    ordinals: np.ndarray
+    amounts: np.ndarray
+
+
+@dataclass
+class PortfolioSnapshot:
+    assets: list[Asset]
+    stock_daily_map: dict[tuple[str, date], StockDaily]
+    lastest_stock_daily_map: dict[str, StockDaily]
+    current_stock_price_map: dict[str, float]
+    exchange_rate_map: dict[str, float]
+    dividend_map: dict[str, float]
+    holdings: Holdings
@@ -91,10 +91,27 @@ class StockMinutely(MySQLBase):
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     code = Column(String(255), nullable=False)
-    datetime = Column(DateTime, nullable=False)
+    datetime = Column(DateTime, primary_key=True, nullable=False, info={"description": "일 단위 파티션 기준 컬럼"})
     current_price = Column(Float, nullable=False)
+    bucket_30m = Column(DateTime, nullable=True, info={"description": "30분 경계 시각, 경계가 아니면 NULL"})
+    bucket_1h = Column(DateTime, nullable=True, info={"description": "정각 시각, 정각이 아니면 NULL"})
 
-    __table_args__ = (UniqueConstraint("code", "datetime", name="uq_code_name_datetime"),)
+    __table_args__ = (
+        UniqueConstraint("code", "datetime", name="uq_code_name_datetime"),
+        Index("idx_code_bucket_30m", "code", "bucket_30m", "datetime"),
+        Index("idx_code_bucket_1h", "code", "bucket_1h", "datetime"),
+    )
+
+
+class StockHalfHourly(MySQLBase):
+    __tablename__ = "stock_half_hourly"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    code = Column(String(255), nullable=False)
+    datetime = Column(DateTime, nullable=False, info={"description": "30분 구간 시작 시각"})
+    current_price = Column(Float, nullable=False, info={"description": "구간 마지막 가격"})
+
+    __table_args__ = (UniqueConstraint("code", "datetime", name="uq_code_datetime"),)
 
 
 class StockDaily(MySQLBase):
@@ -145,13 +162,50 @@ class StockMonthly(MySQLBase):
     ___table_args__ = (UniqueConstraint("code", "date", name="uq_code_date"),)
 
 
+class StockIngestionWatermark(MySQLBase):
+    __tablename__ = "stock_ingestion_watermark"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    code = Column(String(255), nullable=False)
+    interval = Column(String(16), nullable=False, info={"description": "봉 주기(1d, 1wk, 1mo)"})
+    last_date = Column(Date, nullable=True, info={"description": "마지막으로 저장한 봉의 날짜"})
+    checked_at = Column(DateTime, nullable=False, info={"description": "마지막으로 수집을 마친 시각"})
+
+    __table_args__ = (UniqueConstraint("code", "interval", name="uq_code_interval"),)
+
+
+class DividendIngestionWatermark(MySQLBase):
+    __tablename__ = "dividend_ingestion_watermark"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    code = Column(String(255), nullable=False, unique=True)
+    checked_at = Column(DateTime, nullable=False, info={"description": "마지막으로 배당 조회를 마친 시각"})
+
+
 class MarketIndexMinutely(MySQLBase):
     __tablename__ = "market_index_minutely"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
-    datetime = Column(DateTime, nullable=False)
+    datetime = Column(DateTime, primary_key=True, nullable=False, info={"description": "일 단위 파티션 기준 컬럼"})
     current_price = Column(Float, nullable=False)
+    bucket_30m = Column(DateTime, nullable=True, info={"description": "30분 경계 시각, 경계가 아니면 NULL"})
+    bucket_1h = Column(DateTime, nullable=True, info={"description": "정각 시각, 정각이 아니면 NULL"})
+
+    __table_args__ = (
+        UniqueConstraint("name", "datetime", name="uq_name_datetime"),
+        Index("idx_name_bucket_30m", "name", "bucket_30m", "datetime"),
+        Index("idx_name_bucket_1h", "name", "bucket_1h", "datetime"),
+    )
+
+
+class MarketIndexHalfHourly(MySQLBase):
+    __tablename__ = "market_index_half_hourly"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    datetime = Column(DateTime, nullable=False, info={"description": "30분 구간 시작 시각"})
+    current_price = Column(Float, nullable=False, info={"description": "구간 마지막 가격"})
 
     __table_args__ = (UniqueConstraint("name", "datetime", name="uq_name_datetime"),)
 
@@ -27,6 +27,14 @@ class RedisExchangeRateRepository:
     async def save(redis_client: Redis, key: str, data: float, expire_time: int) -> None:
         await redis_client.set(key, data, ex=expire_time)
 
+    @staticmethod
+    async def bulk_save(redis_client: Redis, exchange_rates: dict[str, float], expire_time: int) -> None:
+        # 모든 환율을 MULTI/EXEC로 묶어 씁니다. 읽는 쪽은 한 번의 MGET으로 읽으므로 서로 다른 주기의 환율이 섞이지 않습니다.
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for key, rate in exchange_rates.items():
+                pipe.set(key, rate, ex=expire_time)
+            await pipe.execute()
+
 
 class RedisRealTimeMarketIndexRepository:
     @staticmethod
@@ -35,3 +43,72 @@ class RedisRealTimeMarketIndexRepository:
         for key, market_index_json in bulk_data:
             pipeline.set(key, market_index_json, ex=expire_time)
         await pipeline.execute()
+
+
+class RedisMarketIndexUpdatedAtRepository:
+    @staticmethod
+    async def bulk_get(redis_client: Redis, key: str, names: list[str]) -> list[str | None]:
+        return await redis_client.hmget(key, names)
+
+    @staticmethod
+    async def bulk_save(redis_client: Redis, key: str, updated_at_map: dict[str, str]) -> None:
+        await redis_client.hset(key, mapping=updated_at_map)
+
+
+class RedisDividendCalendarRepository:
+    @staticmethod
+    async def bulk_get(redis_client: Redis, key: str, stock_codes: list[str]) -> list[str | None]:
+        return await redis_client.hmget(key, stock_codes)
+
+    @staticmethod
+    async def replace(redis_client: Redis, key: str, calendar_map: dict[str, str], expire_time: int) -> None:
+        # 임시 키에 모두 쓴 뒤 RENAME으로 교체해, 읽는 쪽에서 반쯤 갱신된 달력을 보지 않게 합니다.
+        temp_key = f"{key}:temp"
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(temp_key)
+            if calendar_map:
+                pipe.hset(temp_key, mapping=calendar_map)
+                pipe.expire(temp_key, expire_time)
+                pipe.rename(temp_key, key)
+            else:
+                pipe.delete(key)
+            await pipe.execute()
+
+
+class RedisVersionRepository:
+    @staticmethod
+    async def bulk_get(redis_client: Redis, keys: list[str]) -> list[int]:
+        versions = await redis_client.mget(keys)
+        return [int(version) if version is not None else 0 for version in versions]
+
+    @staticmethod
+    async def increase(redis_client: Redis, key: str) -> None:
+        await redis_client.incr(key)
+
+    @staticmethod
+    async def increase_throttled(redis_client: Redis, key: str, throttle_key: str, throttle_second: int) -> bool:
+        # throttle_key를 먼저 선점한 경우에만 버전을 올려, throttle_second 동안 최대 한 번만 증가합니다.
+        if not await redis_client.set(throttle_key, 1, nx=True, ex=throttle_second):
+            return False
+        await redis_client.incr(key)
+        return True
+
+
+class RedisPortfolioSnapshotRepository:
+    @staticmethod
+    async def get(redis_client: Redis, key: str) -> str | None:
+        return await redis_client.get(key)
+
+    @staticmethod
+    async def save(redis_client: Redis, key: str, data: str, expire_time: int) -> None:
+        await redis_client.set(key, data, ex=expire_time)
+
+
+class RedisCollectorHealthRepository:
+    @staticmethod
+    async def get(redis_client: Redis, key: str) -> str | None:
+        return await redis_client.get(key)
+
+    @staticmethod
+    async def save(redis_client: Redis, key: str, data: str, expire_time: int) -> None:
+        await redis_client.set(key, data, ex=expire_time)
@@ -20,13 +20,22 @@ class AssetRepository:
         )
         return result.unique().scalars().all()
 
+    @staticmethod
+    async def get_eager_by_user_ids(session: AsyncSession, user_ids: list[int], asset_type: AssetType) -> list[Asset]:
+        result = await session.execute(
+            select(Asset)
+            .filter(and_(Asset.user_id.in_(user_ids), Asset.asset_type == asset_type, Asset.deleted_at.is_(None)))
+            .options(joinedload(Asset.asset_stock).joinedload(AssetStock.stock))
+        )
+        return result.unique().scalars().all()
+
     @staticmethod
     async def save(session: AsyncSession, asset: Asset) -> None:
         session.add(asset)
         await session.commit()
 
     @staticmethod
-    async def delete_asset(session: AsyncSession, asset_id: int) -> None:
+    async def delete_asset(session: AsyncSession, asset_id: int) -> Asset:
         try:
             asset = await session.execute(
                 select(Asset).filter(Asset.id == asset_id).options(joinedload(Asset.asset_stock))
@@ -40,6 +49,7 @@ class AssetRepository:
 
         asset.deleted_at = datetime.now()
         await session.commit()
+        return asset
 
     @staticmethod
     async def get_assets(session: AsyncSession, user_id: str) -> list[Asset]:
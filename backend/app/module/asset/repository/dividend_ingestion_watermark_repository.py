@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.module.asset.model import DividendIngestionWatermark
+from database.bulk_write import chunked_upsert
+
+
+class DividendIngestionWatermarkRepository:
+    @staticmethod
+    async def get_checked_at_map(session: AsyncSession) -> dict[str, datetime]:
+        result = await session.execute(select(DividendIngestionWatermark.code, DividendIngestionWatermark.checked_at))
+        return {code: checked_at for code, checked_at in result.all()}
+
+    @staticmethod
+    async def bulk_upsert_records(session: AsyncSession, watermark_records: list[dict]) -> int:
+        return await chunked_upsert(session, DividendIngestionWatermark, watermark_records, ["checked_at"])
@@ -1,10 +1,12 @@
-from icecream import ic
+from datetime import date
+
 from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql import func
 
 from app.module.asset.model import Dividend
+from database.bulk_write import chunked_upsert
 
 
 class DividendRepository:
@@ -24,6 +26,13 @@ class DividendRepository:
         result = await session.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    async def get_last_dates(session: AsyncSession) -> dict[str, date]:
+        result = await session.execute(
+            select(Dividend.stock_code, func.max(Dividend.date)).group_by(Dividend.stock_code)
+        )
+        return {stock_code: last_date for stock_code, last_date in result.all()}
+
     @staticmethod
     async def get_dividend(session: AsyncSession, stock_code: str) -> Dividend:
         result = await session.execute(select(Dividend).where(Dividend.stock_code == stock_code))
@@ -57,22 +66,15 @@ class DividendRepository:
         await session.commit()
 
     @staticmethod
-    async def bulk_upsert(session: AsyncSession, dividends: list[Dividend]) -> None:
-        stmt = insert(Dividend).values(
+    async def bulk_upsert(session: AsyncSession, dividends: list[Dividend]) -> int:
+        return await DividendRepository.bulk_upsert_records(
+            session,
             [
                 {"dividend": float(dividend.dividend), "stock_code": str(dividend.stock_code), "date": dividend.date}
                 for dividend in dividends
-            ]
+            ],
         )
 
-        update_stmt = {"dividend": stmt.inserted.dividend, "updated_at": func.now()}
-
-        upsert_stmt = stmt.on_duplicate_key_update(update_stmt)
-
-        try:
-            await session.execute(upsert_stmt)
-            await session.commit()
-            ic("성공적으로 저장하였습니다.")
-        except Exception as e:
-            await session.rollback()
-            ic(f"저장에 실패했습니다. 에러: {e}")
+    @staticmethod
+    async def bulk_upsert_records(session: AsyncSession, dividend_records: list[dict]) -> int:
+        return await chunked_upsert(session, Dividend, dividend_records, ["dividend"], {"updated_at": func.now()})
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.constant import MINUTELY_ROLLUP_SECOND
+from app.module.asset.model import MarketIndexHalfHourly, MarketIndexMinutely
+
+
+class MarketIndexHalfHourlyRepository:
+    @staticmethod
+    async def rollup_minutely(session: AsyncSession, date_range: tuple[datetime, datetime]) -> None:
+        start_datetime, end_datetime = date_range
+        bucket = func.from_unixtime(
+            func.floor(func.unix_timestamp(MarketIndexMinutely.datetime) / MINUTELY_ROLLUP_SECOND)
+            * MINUTELY_ROLLUP_SECOND
+        )
+
+        # 구간별 마지막 시각의 가격을 대표값으로 사용합니다.
+        last_minutely = (
+            select(
+                MarketIndexMinutely.name,
+                bucket.label("bucket"),
+                func.max(MarketIndexMinutely.datetime).label("last_datetime"),
+            )
+            .where(MarketIndexMinutely.datetime >= start_datetime, MarketIndexMinutely.datetime < end_datetime)
+            .group_by(MarketIndexMinutely.name, bucket)
+            .subquery()
+        )
+        rollup_select = select(
+            MarketIndexMinutely.name, last_minutely.c.bucket, MarketIndexMinutely.current_price
+        ).join(
+            last_minutely,
+            (MarketIndexMinutely.name == last_minutely.c.name)
+            & (MarketIndexMinutely.datetime == last_minutely.c.last_datetime),
+        )
+
+        stmt = insert(MarketIndexHalfHourly).from_select(["name", "datetime", "current_price"], rollup_select)
+        try:
+            await session.execute(stmt.on_duplicate_key_update(current_price=stmt.inserted.current_price))
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -1,8 +1,9 @@
 from sqlalchemy import extract, select
-from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.util.time import get_bucket_datetime
 from app.module.asset.model import MarketIndexMinutely
+from database.bulk_write import chunked_upsert
 
 
 class MarketIndexMinutelyRepository:
@@ -25,34 +26,37 @@ class MarketIndexMinutelyRepository:
     ) -> list[MarketIndexMinutely]:
         start_date, end_date = date_range
 
+        # 구간 경계 행에만 값이 있는 bucket 컬럼으로 (name, bucket, datetime) 인덱스를 범위 조회합니다.
+        # datetime 조건은 파티션을 좁히기 위해 함께 둡니다.
+        bucket_column = {30: MarketIndexMinutely.bucket_30m, 60: MarketIndexMinutely.bucket_1h}.get(interval)
+        if bucket_column is not None:
+            interval_condition = bucket_column.between(start_date, end_date)
+        else:
+            interval_condition = extract("minute", MarketIndexMinutely.datetime) % interval == 0
+
         stmt = select(MarketIndexMinutely).where(
-            MarketIndexMinutely.datetime.between(start_date, end_date),
             MarketIndexMinutely.name == name,
-            (extract("minute", MarketIndexMinutely.datetime) % interval == 0),
+            MarketIndexMinutely.datetime.between(start_date, end_date),
+            interval_condition,
         )
 
         result = await session.execute(stmt)
         return result.scalars().all()
 
     @staticmethod
-    async def bulk_upsert(session: AsyncSession, market_indexes: list[MarketIndexMinutely]) -> None:
-        stmt = insert(MarketIndexMinutely).values(
+    async def bulk_upsert(session: AsyncSession, market_indexes: list[MarketIndexMinutely]) -> int:
+        return await chunked_upsert(
+            session,
+            MarketIndexMinutely,
             [
                 {
                     "name": market_index.name,
                     "datetime": market_index.datetime,
                     "current_price": market_index.current_price,
+                    "bucket_30m": get_bucket_datetime(market_index.datetime, 30),
+                    "bucket_1h": get_bucket_datetime(market_index.datetime, 60),
                 }
                 for market_index in market_indexes
-            ]
+            ],
+            ["current_price"],
         )
-
-        update_dict = {"current_price": stmt.inserted.current_price}
-
-        upsert_stmt = stmt.on_duplicate_key_update(update_dict)
-
-        try:
-            await session.execute(upsert_stmt)
-            await session.commit()
-        except Exception:
-            await session.rollback()
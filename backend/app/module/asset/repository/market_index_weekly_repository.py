@@ -1,7 +1,7 @@
-from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.module.asset.model import MarketIndexWeekly
+from database.bulk_write import chunked_upsert
 
 
 class MarketIndexWeeklyRepository:
@@ -11,8 +11,9 @@ class MarketIndexWeeklyRepository:
         await session.commit()
 
     @staticmethod
-    async def bulk_upsert(session: AsyncSession, market_indexes: list[MarketIndexWeekly]) -> None:
-        stmt = insert(MarketIndexWeekly).values(
+    async def bulk_upsert(session: AsyncSession, market_indexes: list[MarketIndexWeekly]) -> int:
+        return await MarketIndexWeeklyRepository.bulk_upsert_records(
+            session,
             [
                 {
                     "name": market_index.name,
@@ -24,21 +25,14 @@ class MarketIndexWeeklyRepository:
                     "volume": market_index.volume,
                 }
                 for market_index in market_indexes
-            ]
+            ],
         )
 
-        update_dict = {
-            "open_price": stmt.inserted.open_price,
-            "high_price": stmt.inserted.high_price,
-            "low_price": stmt.inserted.low_price,
-            "close_price": stmt.inserted.close_price,
-            "volume": stmt.inserted.volume,
-        }
-
-        upsert_stmt = stmt.on_duplicate_key_update(update_dict)
-
-        try:
-            await session.execute(upsert_stmt)
-            await session.commit()
-        except Exception:
-            await session.rollback()
+    @staticmethod
+    async def bulk_upsert_records(session: AsyncSession, market_index_records: list[dict]) -> int:
+        return await chunked_upsert(
+            session,
+            MarketIndexWeekly,
+            market_index_records,
+            ["open_price", "high_price", "low_price", "close_price", "volume"],
+        )
@@ -1,12 +1,12 @@
 from datetime import date
 
 from sqlalchemy import func, tuple_
-from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import aliased
 
 from app.module.asset.model import StockDaily
+from database.bulk_write import chunked_upsert
 
 
 class StockDailyRepository:
@@ -18,6 +18,19 @@ class StockDailyRepository:
         result = await session.execute(stmt)
         return result.scalars().all()
 
+    @staticmethod
+    async def get_by_range(
+        session: AsyncSession, stock_codes: list[str], date_range: tuple[date, date]
+    ) -> list[StockDaily]:
+        start_date, end_date = date_range
+        stmt = (
+            select(StockDaily)
+            .where(StockDaily.code.in_(stock_codes), StockDaily.date.between(start_date, end_date))
+            .order_by(StockDaily.date)
+        )
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
     @staticmethod
     async def get_latest(session: AsyncSession, stock_codes: list[str]) -> list[StockDaily]:
         subquery = (
@@ -36,6 +49,11 @@ class StockDailyRepository:
         result = await session.execute(stmt)
         return result.scalars().all()
 
+    @staticmethod
+    async def get_latest_date(session: AsyncSession, stock_codes: list[str]) -> date | None:
+        result = await session.execute(select(func.max(StockDaily.date)).where(StockDaily.code.in_(stock_codes)))
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_stock_daily(session: AsyncSession, stock_code: str, stock_date: date) -> StockDaily:
         result = await session.execute(
@@ -73,8 +91,9 @@ class StockDailyRepository:
         return result.scalars().all()
 
     @staticmethod
-    async def bulk_upsert(session: AsyncSession, stock_dailies: list[StockDaily]) -> None:
-        stmt = mysql_insert(StockDaily).values(
+    async def bulk_upsert(session: AsyncSession, stock_dailies: list[StockDaily]) -> int:
+        return await StockDailyRepository.bulk_upsert_records(
+            session,
             [
                 {
                     "code": stock_daily.code,
@@ -87,22 +106,14 @@ class StockDailyRepository:
                     "trade_volume": stock_daily.trade_volume,
                 }
                 for stock_daily in stock_dailies
-            ]
+            ],
         )
 
-        update_dict = {
-            "opening_price": stmt.inserted.opening_price,
-            "highest_price": stmt.inserted.highest_price,
-            "lowest_price": stmt.inserted.lowest_price,
-            "close_price": stmt.inserted.close_price,
-            "adj_close_price": stmt.inserted.adj_close_price,
-            "trade_volume": stmt.inserted.trade_volume,
-        }
-
-        upsert_stmt = stmt.on_duplicate_key_update(update_dict)
-
-        try:
-            await session.execute(upsert_stmt)
-            await session.commit()
-        except Exception:
-            await session.rollback()
+    @staticmethod
+    async def bulk_upsert_records(session: AsyncSession, stock_records: list[dict]) -> int:
+        return await chunked_upsert(
+            session,
+            StockDaily,
+            stock_records,
+            ["opening_price", "highest_price", "lowest_price", "close_price", "adj_close_price", "trade_volume"],
+        )
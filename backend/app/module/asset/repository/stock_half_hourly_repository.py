@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.constant import MINUTELY_ROLLUP_SECOND
+from app.module.asset.model import StockHalfHourly, StockMinutely
+
+
+class StockHalfHourlyRepository:
+    @staticmethod
+    async def rollup_minutely(session: AsyncSession, date_range: tuple[datetime, datetime]) -> None:
+        start_datetime, end_datetime = date_range
+        bucket = func.from_unixtime(
+            func.floor(func.unix_timestamp(StockMinutely.datetime) / MINUTELY_ROLLUP_SECOND) * MINUTELY_ROLLUP_SECOND
+        )
+
+        # 구간별 마지막 시각의 가격을 대표값으로 사용합니다.
+        last_minutely = (
+            select(
+                StockMinutely.code,
+                bucket.label("bucket"),
+                func.max(StockMinutely.datetime).label("last_datetime"),
+            )
+            .where(StockMinutely.datetime >= start_datetime, StockMinutely.datetime < end_datetime)
+            .group_by(StockMinutely.code, bucket)
+            .subquery()
+        )
+        rollup_select = select(StockMinutely.code, last_minutely.c.bucket, StockMinutely.current_price).join(
+            last_minutely,
+            (StockMinutely.code == last_minutely.c.code) & (StockMinutely.datetime == last_minutely.c.last_datetime),
+        )
+
+        stmt = insert(StockHalfHourly).from_select(["code", "datetime", "current_price"], rollup_select)
+        try:
+            await session.execute(stmt.on_duplicate_key_update(current_price=stmt.inserted.current_price))
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
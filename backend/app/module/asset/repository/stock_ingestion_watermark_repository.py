@@ -0,0 +1,16 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.module.asset.model import StockIngestionWatermark
+from database.bulk_write import chunked_upsert
+
+
+class StockIngestionWatermarkRepository:
+    @staticmethod
+    async def get_map(session: AsyncSession) -> dict[tuple[str, str], StockIngestionWatermark]:
+        result = await session.execute(select(StockIngestionWatermark))
+        return {(watermark.code, watermark.interval): watermark for watermark in result.scalars().all()}
+
+    @staticmethod
+    async def bulk_upsert_records(session: AsyncSession, watermark_records: list[dict]) -> int:
+        return await chunked_upsert(session, StockIngestionWatermark, watermark_records, ["last_date", "checked_at"])
@@ -1,8 +1,9 @@
 from sqlalchemy import extract, select
-from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.util.time import get_bucket_datetime
 from app.module.asset.model import StockMinutely
+from database.bulk_write import chunked_upsert
 
 
 class StockMinutelyRepository:
@@ -15,34 +16,35 @@ class StockMinutelyRepository:
     ) -> list[StockMinutely]:
         start_date, end_date = date_range
 
+        # 구간 경계 행에만 값이 있는 bucket 컬럼으로 (code, bucket, datetime) 인덱스를 범위 조회합니다.
+        # datetime 조건은 파티션을 좁히기 위해 함께 둡니다.
+        bucket_column = {30: StockMinutely.bucket_30m, 60: StockMinutely.bucket_1h}.get(interval)
+        if bucket_column is not None:
+            interval_condition = bucket_column.between(start_date, end_date)
+        else:
+            interval_condition = extract("minute", StockMinutely.datetime) % interval == 0
+
         stmt = select(StockMinutely).where(
-            StockMinutely.datetime.between(start_date, end_date),
-            StockMinutely.code.in_(codes),
-            (extract("minute", StockMinutely.datetime) % interval == 0),
+            StockMinutely.code.in_(codes), StockMinutely.datetime.between(start_date, end_date), interval_condition
         )
 
         result = await session.execute(stmt)
         return result.scalars().all()
 
     @staticmethod
-    async def bulk_upsert(session: AsyncSession, stocks: list[StockMinutely]) -> None:
-        stmt = insert(StockMinutely).values(
+    async def bulk_upsert(session: AsyncSession, stocks: list[StockMinutely]) -> int:
+        return await chunked_upsert(
+            session,
+            StockMinutely,
             [
                 {
                     "code": stock.code,
                     "datetime": stock.datetime,
                     "current_price": stock.current_price,
+                    "bucket_30m": get_bucket_datetime(stock.datetime, 30),
+                    "bucket_1h": get_bucket_datetime(stock.datetime, 60),
                 }
                 for stock in stocks
-            ]
+            ],
+            ["current_price"],
         )
-
-        update_dict = {"current_price": stmt.inserted.current_price}
-
-        upsert_stmt = stmt.on_duplicate_key_update(update_dict)
-
-        try:
-            await session.execute(upsert_stmt)
-            await session.commit()
-        except Exception:
-            await session.rollback()
@@ -1,13 +1,14 @@
-from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.module.asset.model import StockMonthly
+from database.bulk_write import chunked_upsert
 
 
 class StockMonthlyRepository:
     @staticmethod
-    async def bulk_upsert(session: AsyncSession, stock_dailies: list[StockMonthly]) -> None:
-        stmt = mysql_insert(StockMonthly).values(
+    async def bulk_upsert(session: AsyncSession, stock_dailies: list[StockMonthly]) -> int:
+        return await StockMonthlyRepository.bulk_upsert_records(
+            session,
             [
                 {
                     "code": stock_daily.code,
@@ -20,23 +21,14 @@ class StockMonthlyRepository:
                     "trade_volume": stock_daily.trade_volume,
                 }
                 for stock_daily in stock_dailies
-            ]
+            ],
         )
 
-        update_dict = {
-            "opening_price": stmt.inserted.opening_price,
-            "highest_price": stmt.inserted.highest_price,
-            "lowest_price": stmt.inserted.lowest_price,
-            "close_price": stmt.inserted.close_price,
-            "adj_close_price": stmt.inserted.adj_close_price,
-            "trade_volume": stmt.inserted.trade_volume,
-        }
-
-        upsert_stmt = stmt.on_duplicate_key_update(update_dict)
-
-        try:
-            await session.execute(upsert_stmt)
-            await session.commit()
-        except Exception as e:
-            print(f"Error during bulk upsert: {e}")
-            await session.rollback()
+    @staticmethod
+    async def bulk_upsert_records(session: AsyncSession, stock_records: list[dict]) -> int:
+        return await chunked_upsert(
+            session,
+            StockMonthly,
+            stock_records,
+            ["opening_price", "highest_price", "lowest_price", "close_price", "adj_close_price", "trade_volume"],
+        )
@@ -1,9 +1,9 @@
-from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql import func
 
 from app.module.asset.model import Stock
+from database.bulk_write import chunked_upsert
 
 
 class StockRepository:
@@ -44,25 +44,14 @@ class StockRepository:
         await session.commit()
 
     @staticmethod
-    async def bulk_upsert(session: AsyncSession, stocks: list[Stock]) -> None:
-        stmt = insert(Stock).values(
+    async def bulk_upsert(session: AsyncSession, stocks: list[Stock]) -> int:
+        return await chunked_upsert(
+            session,
+            Stock,
             [
                 {"code": stock.code, "name": stock.name, "market_index": stock.market_index, "country": stock.country}
                 for stock in stocks
-            ]
+            ],
+            ["name", "market_index", "country"],
+            {"updated_at": func.now()},
         )
-
-        update_dict = {
-            "name": stmt.inserted.name,
-            "market_index": stmt.inserted.market_index,
-            "country": stmt.inserted.country,
-            "updated_at": func.now(),
-        }
-
-        upsert_stmt = stmt.on_duplicate_key_update(update_dict)
-
-        try:
-            await session.execute(upsert_stmt)
-            await session.commit()
-        except Exception:
-            await session.rollback()
@@ -8,6 +8,7 @@ from app.module.asset.repository.asset_field_repository import AssetFieldReposit
 from app.module.asset.repository.asset_repository import AssetRepository
 from app.module.asset.schema import AssetStockPostRequest
 from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.asset.services.valuation_service import ValuationService
 
 
 class AssetStockService:
@@ -64,15 +65,9 @@ class AssetStockService:
         current_stock_price_map: dict[str, float],
         exchange_rate_map: dict[str, float],
     ) -> float:
-        result = 0.0
-
-        for asset in assets:
-            result += (
-                current_stock_price_map.get(asset.asset_stock.stock.code)
-                * asset.asset_stock.quantity
-                * ExchangeRateService.get_won_exchange_rate(asset, exchange_rate_map)
-            )
-        return result
+        return ValuationService.get_total_asset_amount(
+            ValuationService.get_holdings(assets), current_stock_price_map, exchange_rate_map
+        )
 
     @staticmethod
     async def get_stock_assets(
@@ -168,22 +163,6 @@ class AssetStockService:
         stock_daily_map: dict[tuple[str, date], StockDaily],
         exchange_rate_map: dict[str, float],
     ) -> float:
-        total_invest_amount = 0.0
-
-        for asset in assets:
-            stock_daily = stock_daily_map.get((asset.asset_stock.stock.code, asset.asset_stock.purchase_date), None)
-            if stock_daily is None:
-                continue
-
-            invest_price = (
-                asset.asset_stock.purchase_price * ExchangeRateService.get_won_exchange_rate(asset, exchange_rate_map)
-                if asset.asset_stock.purchase_currency_type == PurchaseCurrencyType.USA
-                and asset.asset_stock.purchase_price
-                else asset.asset_stock.purchase_price
-                if asset.asset_stock.purchase_price
-                else stock_daily.adj_close_price * ExchangeRateService.get_won_exchange_rate(asset, exchange_rate_map)
-            )
-
-            total_invest_amount += invest_price * asset.asset_stock.quantity
-
-        return total_invest_amount
+        return ValuationService.get_total_investment_amount(
+            ValuationService.get_holdings(assets), stock_daily_map, exchange_rate_map
+        )
@@ -1,13 +1,27 @@
+import json
 from collections import defaultdict
 from datetime import date
 
-from pandas import to_datetime
+import numpy as np
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.module.asset.constant import (
+    DIVIDEND_CALENDAR_HORIZON_DAYS,
+    DIVIDEND_CALENDAR_KEY,
+    DIVIDEND_FREQUENCY_GAP_DAYS,
+    DIVIDEND_FREQUENCY_SAMPLE_SIZE,
+    DIVIDEND_INACTIVE_DAYS,
+)
+from app.module.asset.dataclass import DividendCalendar, DividendIndex
 from app.module.asset.enum import CurrencyType
 from app.module.asset.model import Asset, Dividend
+from app.module.asset.redis_repository import RedisDividendCalendarRepository
 from app.module.asset.repository.dividend_repository import DividendRepository
 from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.asset.services.valuation_service import ValuationService
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
 class DividendService:
@@ -55,72 +69,160 @@ class DividendService:
             for stock_code, dividend in total_dividend.items()
         ]
 
+    @staticmethod
+    def get_dividend_index(dividends: list[Dividend]) -> DividendIndex:
+        dividend_rows: defaultdict[str, list[tuple[int, float]]] = defaultdict(list)
+        for dividend in dividends:
+            dividend_rows[dividend.stock_code].append((dividend.date.toordinal(), dividend.dividend))
+
+        ordinals: dict[str, np.ndarray] = {}
+        amounts: dict[str, np.ndarray] = {}
+        for stock_code, rows in dividend_rows.items():
+            rows.sort()
+            ordinals[stock_code] = np.array([ordinal for ordinal, _ in rows], dtype=np.int64)
+            amounts[stock_code] = np.array([amount for _, amount in rows], dtype=np.float64)
+        return DividendIndex(ordinals=ordinals, amounts=amounts)
+
+    @staticmethod
+    def get_dividend_calendar(ordinals: np.ndarray, amounts: np.ndarray, today: date) -> DividendCalendar | None:
+        if len(ordinals) == 0:
+            return None
+
+        last_ordinal = int(ordinals[-1])
+        # 오랫동안 배당이 없던 종목은 배당을 중단한 것으로 보고 예상하지 않습니다.
+        if today.toordinal() - last_ordinal > DIVIDEND_INACTIVE_DAYS:
+            return None
+
+        frequency = DividendService._detect_frequency(ordinals)
+        horizon_ordinal = today.toordinal() + DIVIDEND_CALENDAR_HORIZON_DAYS
+
+        # 최근 1년치 배당(연간 배당 횟수만큼)이 같은 날짜, 같은 금액으로 반복된다고 예상합니다.
+        projected: dict[int, float] = {}
+        for ordinal, amount in zip(ordinals[-frequency:], amounts[-frequency:]):
+            dividend_date = date.fromordinal(int(ordinal))
+            year = dividend_date.year + 1
+            projected_ordinal = DividendService._replace_year(dividend_date, year).toordinal()
+            while projected_ordinal <= today.toordinal():
+                year += 1
+                projected_ordinal = DividendService._replace_year(dividend_date, year).toordinal()
+            if projected_ordinal <= horizon_ordinal:
+                projected[projected_ordinal] = projected.get(projected_ordinal, 0.0) + float(amount)
+
+        projected_ordinals = sorted(projected)
+        return DividendCalendar(
+            frequency=frequency,
+            ordinals=np.array(projected_ordinals, dtype=np.int64),
+            amounts=np.array([projected[ordinal] for ordinal in projected_ordinals], dtype=np.float64),
+        )
+
+    @staticmethod
+    async def get_dividend_calendar_map(redis_client: Redis, stock_codes: list[str]) -> dict[str, DividendCalendar]:
+        calendar_values = await RedisDividendCalendarRepository.bulk_get(
+            redis_client, DIVIDEND_CALENDAR_KEY, stock_codes
+        )
+
+        result = {}
+        for stock_code, calendar_value in zip(stock_codes, calendar_values):
+            if calendar_value is None:
+                continue
+            calendar = json.loads(calendar_value)
+            result[stock_code] = DividendCalendar(
+                frequency=calendar["frequency"],
+                ordinals=np.array(
+                    [date.fromisoformat(dividend_date).toordinal() for dividend_date in calendar["dates"]],
+                    dtype=np.int64,
+                ),
+                amounts=np.array(calendar["amounts"], dtype=np.float64),
+            )
+        return result
+
+    @staticmethod
+    def dump_dividend_calendar(calendar: DividendCalendar) -> str:
+        return json.dumps(
+            {
+                "frequency": calendar.frequency,
+                "dates": [date.fromordinal(int(ordinal)).isoformat() for ordinal in calendar.ordinals],
+                "amounts": calendar.amounts.tolist(),
+            }
+        )
+
     @staticmethod
     def get_total_estimate_dividend(
         assets: list[Asset],
         exchange_rate_map: dict[str, float],
-        dividend_map: dict[str, float],
-    ) -> dict[str, float]:
-        total_dividend_date: defaultdict[date, float] = defaultdict(float)
+        dividend_index: DividendIndex,
+        dividend_calendar_map: dict[str, DividendCalendar],
+    ) -> dict[int, np.ndarray]:
+        estimate_ordinals: list[np.ndarray] = []
+        estimate_amounts: list[np.ndarray] = []
 
         for asset in assets:
+            stock_code = asset.asset_stock.stock.code
             source_country = asset.asset_stock.stock.country.upper().strip()
             source_currency = CurrencyType[source_country]
-
             won_exchange_rate = ExchangeRateService.get_exchange_rate(
                 source_currency, CurrencyType.KOREA, exchange_rate_map
             )
-
-            stock_code = asset.asset_stock.stock.code
-            purchase_date = asset.asset_stock.purchase_date
-            quantity = asset.asset_stock.quantity
-
-            last_dividend_date: date | None = None
-
-            for key, dividend_amount in dividend_map.items():
-                dividend_code, dividend_date_str = key.split("_")
-                try:
-                    dividend_date = to_datetime(dividend_date_str).date()
-
-                    if dividend_code == stock_code and dividend_date >= purchase_date:
-                        dividend_kr = dividend_amount * won_exchange_rate * quantity
-                        total_dividend_date[dividend_date] += dividend_kr
-                        last_dividend_date = dividend_date
-                except Exception:
-                    continue
-
-            if last_dividend_date:
-                last_year = last_dividend_date.year - 1
-                last_year_dividend_date = last_dividend_date.replace(year=last_year)
-
-                for key, dividend_amount in dividend_map.items():
-                    dividend_code, dividend_date_str = key.split("_")
-                    try:
-                        dividend_date = to_datetime(dividend_date_str).date()
-                        if (
-                            dividend_code == stock_code
-                            and dividend_date >= last_year_dividend_date
-                            and dividend_date <= date(last_year, 12, 31)
-                        ):
-                            new_dividend_date = dividend_date.replace(year=last_dividend_date.year)
-                            dividend_kr = dividend_amount * won_exchange_rate * quantity
-                            total_dividend_date[new_dividend_date] += dividend_kr
-                    except Exception:
-                        continue
-
-        return {dividend_date.isoformat(): amount for dividend_date, amount in total_dividend_date.items()}
+            multiplier = won_exchange_rate * asset.asset_stock.quantity
+
+            # 매수일 이후 지급된 배당을 합산합니다.
+            ordinals = dividend_index.ordinals.get(stock_code)
+            if ordinals is not None:
+                purchase_index = int(
+                    np.searchsorted(ordinals, asset.asset_stock.purchase_date.toordinal(), side="left")
+                )
+                estimate_ordinals.append(ordinals[purchase_index:])
+                estimate_amounts.append(dividend_index.amounts[stock_code][purchase_index:] * multiplier)
+
+            # 앞으로 1년간의 예상 배당은 미리 계산해 둔 배당 달력을 사용합니다.
+            calendar = dividend_calendar_map.get(stock_code)
+            if calendar is not None:
+                estimate_ordinals.append(calendar.ordinals)
+                estimate_amounts.append(calendar.amounts * multiplier)
+
+        if len(estimate_ordinals) == 0:
+            return {}
+
+        ordinals = np.concatenate(estimate_ordinals)
+        if len(ordinals) == 0:
+            return {}
+
+        months = (ordinals - EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+        first_month = int(months.min()) // 12 * 12
+        month_index = months - first_month
+
+        totals = np.zeros(int(month_index.max()) // 12 * 12 + 12, dtype=np.float64)
+        np.add.at(totals, month_index, np.concatenate(estimate_amounts))
+        totals = totals.reshape(-1, 12)
+
+        first_year = 1970 + first_month // 12
+        return {
+            first_year + year_offset: year_totals for year_offset, year_totals in enumerate(totals) if year_totals.any()
+        }
 
     @staticmethod
     def get_total_dividend(
         assets: list[Asset], dividend_map: dict[str, float], exchange_rate_map: dict[str, float]
     ) -> float:
-        total_dividend_amount = 0.0
+        return ValuationService.get_total_dividend(
+            ValuationService.get_holdings(assets), dividend_map, exchange_rate_map
+        )
 
-        for asset in assets:
-            total_dividend_amount += (
-                dividend_map.get(asset.asset_stock.stock.code, 0.0)
-                * asset.asset_stock.quantity
-                * ExchangeRateService.get_won_exchange_rate(asset, exchange_rate_map)
-            )
+    @staticmethod
+    def _detect_frequency(ordinals: np.ndarray) -> int:
+        if len(ordinals) < 2:
+            return 1
 
-        return total_dividend_amount
+        # 최근 배당 간격의 중앙값으로 월/분기/반기/연 배당을 구분합니다.
+        gap_days = float(np.median(np.diff(ordinals[-(DIVIDEND_FREQUENCY_SAMPLE_SIZE + 1) :])))
+        for max_gap_days, frequency in DIVIDEND_FREQUENCY_GAP_DAYS:
+            if gap_days <= max_gap_days:
+                return frequency
+        return 1
+
+    @staticmethod
+    def _replace_year(target_date: date, year: int) -> date:
+        # 2월 29일은 평년에 없으므로 2월 28일로 옮깁니다.
+        if target_date.month == 2 and target_date.day == 29:
+            return date(year, 2, 28)
+        return target_date.replace(year=year)
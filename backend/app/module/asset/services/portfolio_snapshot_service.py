@@ -0,0 +1,207 @@
+import asyncio
+import json
+from datetime import date
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.constant import (
+    PORTFOLIO_SNAPSHOT_EXPIRE_SECOND,
+    PORTFOLIO_SNAPSHOT_KEY,
+    PORTFOLIO_VERSION_KEY,
+    PRICE_EPOCH_KEY,
+    PRICE_EPOCH_THROTTLE_KEY,
+    PRICE_EPOCH_THROTTLE_SECOND,
+)
+from app.module.asset.dataclass import PortfolioSnapshot
+from app.module.asset.enum import AccountType, AssetType, InvestmentBankType, PurchaseCurrencyType
+from app.module.asset.model import Asset, AssetStock, Stock, StockDaily
+from app.module.asset.redis_repository import RedisPortfolioSnapshotRepository, RedisVersionRepository
+from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.services.dividend_service import DividendService
+from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.asset.services.stock_daily_service import StockDailyService
+from app.module.asset.services.stock_service import StockService
+from app.module.asset.services.valuation_service import ValuationService
+
+STOCK_DAILY_FIELDS = [
+    "code",
+    "date",
+    "adj_close_price",
+    "close_price",
+    "highest_price",
+    "lowest_price",
+    "opening_price",
+    "trade_volume",
+]
+
+
+class PortfolioSnapshotService:
+    @staticmethod
+    async def get(session: AsyncSession, redis_client: Redis, user_id: int) -> PortfolioSnapshot:
+        price_epoch, portfolio_version = await RedisVersionRepository.bulk_get(
+            redis_client, [PRICE_EPOCH_KEY, f"{PORTFOLIO_VERSION_KEY}_{user_id}"]
+        )
+        snapshot_key = f"{PORTFOLIO_SNAPSHOT_KEY}_{user_id}_{portfolio_version}_{price_epoch}"
+
+        snapshot_raw = await RedisPortfolioSnapshotRepository.get(redis_client, snapshot_key)
+        if snapshot_raw is not None:
+            return PortfolioSnapshotService._loads(snapshot_raw)
+
+        snapshot = await PortfolioSnapshotService._build(session, redis_client, user_id)
+        await RedisPortfolioSnapshotRepository.save(
+            redis_client, snapshot_key, PortfolioSnapshotService._dumps(snapshot), PORTFOLIO_SNAPSHOT_EXPIRE_SECOND
+        )
+        return snapshot
+
+    @staticmethod
+    async def invalidate(redis_client: Redis, user_id: int) -> None:
+        await RedisVersionRepository.increase(redis_client, f"{PORTFOLIO_VERSION_KEY}_{user_id}")
+
+    @staticmethod
+    async def invalidate_prices(redis_client: Redis) -> None:
+        # 수집기는 매 주기마다 호출하므로, epoch는 PRICE_EPOCH_THROTTLE_SECOND마다 최대 한 번만 올려 스냅샷을 재사용합니다.
+        await RedisVersionRepository.increase_throttled(
+            redis_client, PRICE_EPOCH_KEY, PRICE_EPOCH_THROTTLE_KEY, PRICE_EPOCH_THROTTLE_SECOND
+        )
+
+    @staticmethod
+    async def _build(session: AsyncSession, redis_client: Redis, user_id: int) -> PortfolioSnapshot:
+        # 하나의 session은 동시에 쿼리를 실행할 수 없어, DB 조회는 순차로 두고 redis 조회만 병렬로 실행합니다.
+        (assets, stock_daily_map, lastest_stock_daily_map, dividend_map), exchange_rate_map = await asyncio.gather(
+            PortfolioSnapshotService._load_from_db(session, user_id),
+            ExchangeRateService.get_exchange_rate_map(redis_client),
+        )
+        if len(assets) == 0:
+            return PortfolioSnapshot(
+                assets=[],
+                stock_daily_map={},
+                lastest_stock_daily_map={},
+                current_stock_price_map={},
+                exchange_rate_map=exchange_rate_map,
+                dividend_map={},
+                holdings=ValuationService.get_holdings([]),
+            )
+
+        current_stock_price_map = await StockService.get_current_stock_price(
+            redis_client, lastest_stock_daily_map, assets
+        )
+
+        return PortfolioSnapshot(
+            assets=assets,
+            stock_daily_map=stock_daily_map,
+            lastest_stock_daily_map=lastest_stock_daily_map,
+            current_stock_price_map=current_stock_price_map,
+            exchange_rate_map=exchange_rate_map,
+            dividend_map=dividend_map,
+            holdings=ValuationService.get_holdings(assets),
+        )
+
+    @staticmethod
+    async def _load_from_db(
+        session: AsyncSession, user_id: int
+    ) -> tuple[list[Asset], dict[tuple[str, date], StockDaily], dict[str, StockDaily], dict[str, float]]:
+        assets: list[Asset] = await AssetRepository.get_eager(session, user_id, AssetType.STOCK)
+        if len(assets) == 0:
+            return [], {}, {}, {}
+
+        stock_daily_map = await StockDailyService.get_map_range(session, assets)
+        lastest_stock_daily_map = await StockDailyService.get_latest_map(session, assets)
+        dividend_map = await DividendService.get_recent_map(session, assets)
+        return assets, stock_daily_map, lastest_stock_daily_map, dividend_map
+
+    @staticmethod
+    def _dumps(snapshot: PortfolioSnapshot) -> str:
+        return json.dumps(
+            {
+                "assets": [PortfolioSnapshotService._dump_asset(asset) for asset in snapshot.assets],
+                "stock_dailies": [
+                    PortfolioSnapshotService._dump_stock_daily(daily) for daily in snapshot.stock_daily_map.values()
+                ],
+                "lastest_stock_dailies": [
+                    PortfolioSnapshotService._dump_stock_daily(daily)
+                    for daily in snapshot.lastest_stock_daily_map.values()
+                ],
+                "current_stock_price_map": snapshot.current_stock_price_map,
+                "exchange_rate_map": snapshot.exchange_rate_map,
+                "dividend_map": snapshot.dividend_map,
+            }
+        )
+
+    @staticmethod
+    def _loads(snapshot_raw: str) -> PortfolioSnapshot:
+        snapshot_data = json.loads(snapshot_raw)
+        stock_cache: dict[str, Stock] = {}
+
+        stock_dailies = [PortfolioSnapshotService._load_stock_daily(data) for data in snapshot_data["stock_dailies"]]
+        lastest_stock_dailies = [
+            PortfolioSnapshotService._load_stock_daily(data) for data in snapshot_data["lastest_stock_dailies"]
+        ]
+
+        assets = [PortfolioSnapshotService._load_asset(data, stock_cache) for data in snapshot_data["assets"]]
+
+        return PortfolioSnapshot(
+            assets=assets,
+            stock_daily_map={(daily.code, daily.date): daily for daily in stock_dailies},
+            lastest_stock_daily_map={daily.code: daily for daily in lastest_stock_dailies},
+            current_stock_price_map=snapshot_data["current_stock_price_map"],
+            exchange_rate_map=snapshot_data["exchange_rate_map"],
+            dividend_map=snapshot_data["dividend_map"],
+            holdings=ValuationService.get_holdings(assets),
+        )
+
+    @staticmethod
+    def _dump_asset(asset: Asset) -> dict:
+        asset_stock = asset.asset_stock
+        return {
+            "id": asset.id,
+            "user_id": asset.user_id,
+            "account_type": str(asset_stock.account_type) if asset_stock.account_type else None,
+            "investment_bank": str(asset_stock.investment_bank) if asset_stock.investment_bank else None,
+            "purchase_currency_type": str(asset_stock.purchase_currency_type)
+            if asset_stock.purchase_currency_type
+            else None,
+            "purchase_date": asset_stock.purchase_date.isoformat(),
+            "purchase_price": asset_stock.purchase_price,
+            "quantity": asset_stock.quantity,
+            "stock": {
+                "id": asset_stock.stock.id,
+                "code": asset_stock.stock.code,
+                "country": asset_stock.stock.country,
+                "market_index": asset_stock.stock.market_index,
+                "name": asset_stock.stock.name,
+            },
+        }
+
+    @staticmethod
+    def _load_asset(data: dict, stock_cache: dict[str, Stock]) -> Asset:
+        stock_data = data["stock"]
+        stock = stock_cache.get(stock_data["code"])
+        if stock is None:
+            stock = Stock(**stock_data)
+            stock_cache[stock.code] = stock
+
+        asset_stock = AssetStock(
+            account_type=AccountType(data["account_type"]) if data["account_type"] else None,
+            investment_bank=InvestmentBankType(data["investment_bank"]) if data["investment_bank"] else None,
+            purchase_currency_type=PurchaseCurrencyType(data["purchase_currency_type"])
+            if data["purchase_currency_type"]
+            else None,
+            purchase_date=date.fromisoformat(data["purchase_date"]),
+            purchase_price=data["purchase_price"],
+            quantity=data["quantity"],
+            stock_id=stock.id,
+            asset_id=data["id"],
+            stock=stock,
+        )
+        return Asset(id=data["id"], asset_type=AssetType.STOCK, user_id=data["user_id"], asset_stock=asset_stock)
+
+    @staticmethod
+    def _dump_stock_daily(stock_daily: StockDaily) -> dict:
+        data = {field: getattr(stock_daily, field) for field in STOCK_DAILY_FIELDS}
+        data["date"] = stock_daily.date.isoformat()
+        return data
+
+    @staticmethod
+    def _load_stock_daily(data: dict) -> StockDaily:
+        return StockDaily(**{**data, "date": date.fromisoformat(data["date"])})
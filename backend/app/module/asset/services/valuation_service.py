@@ -0,0 +1,161 @@
+from datetime import date
+
+import numpy as np
+
+from app.module.asset.dataclass import Holdings
+from app.module.asset.enum import CurrencyType, PurchaseCurrencyType
+from app.module.asset.model import Asset, StockDaily
+from app.module.asset.services.exchange_rate_service import ExchangeRateService
+
+
+class ValuationService:
+    @staticmethod
+    def get_holdings(assets: list[Asset]) -> Holdings:
+        code_positions: dict[str, int] = {}
+        account_positions: dict = {}
+        country_positions: dict[str, int] = {}
+        names: list[str] = []
+        currencies: list[CurrencyType] = []
+
+        code_index: list[int] = []
+        account_index: list[int] = []
+        currency_index: list[int] = []
+        quantity: list[int] = []
+        purchase_price: list[float] = []
+        purchase_usd: list[bool] = []
+        purchase_date: list[date] = []
+        usd = PurchaseCurrencyType.USA
+
+        for asset in assets:
+            asset_stock = asset.asset_stock
+            stock = asset_stock.stock
+            code = stock.code
+            country = stock.country
+
+            code_position = code_positions.get(code)
+            if code_position is None:
+                code_position = code_positions[code] = len(code_positions)
+                names.append(stock.name)
+            code_index.append(code_position)
+
+            account_index.append(account_positions.setdefault(asset_stock.account_type, len(account_positions)))
+
+            # 국가 -> 통화 변환은 국가 종류 수 만큼만 수행합니다.
+            country_position = country_positions.get(country)
+            if country_position is None:
+                country_position = country_positions[country] = len(country_positions)
+                currencies.append(CurrencyType[country.upper().strip()])
+            currency_index.append(country_position)
+
+            quantity.append(asset_stock.quantity)
+            purchase_price.append(asset_stock.purchase_price or np.nan)
+            purchase_usd.append(asset_stock.purchase_currency_type == usd)
+            purchase_date.append(asset_stock.purchase_date)
+
+        return Holdings(
+            codes=list(code_positions),
+            names=names,
+            code_index=np.array(code_index, dtype=np.int64),
+            accounts=list(account_positions),
+            account_index=np.array(account_index, dtype=np.int64),
+            currencies=currencies,
+            currency_index=np.array(currency_index, dtype=np.int64),
+            quantity=np.array(quantity, dtype=np.float64),
+            purchase_price=np.array(purchase_price, dtype=np.float64),
+            purchase_usd=np.array(purchase_usd, dtype=np.bool_),
+            purchase_date=purchase_date,
+            purchase_ordinal=np.array([purchase_date.toordinal() for purchase_date in purchase_date], dtype=np.int64),
+        )
+
+    @staticmethod
+    def get_won_exchange_rates(holdings: Holdings, exchange_rate_map: dict[str, float]) -> np.ndarray:
+        currency_rates = np.array(
+            [
+                ExchangeRateService.get_exchange_rate(currency, CurrencyType.KOREA, exchange_rate_map)
+                for currency in holdings.currencies
+            ],
+            dtype=np.float64,
+        )
+        return currency_rates[holdings.currency_index] if len(currency_rates) else np.zeros(0)
+
+    @staticmethod
+    def get_code_values(holdings: Holdings, code_value_map: dict[str, float]) -> np.ndarray:
+        code_values = np.array([code_value_map.get(code, 0.0) for code in holdings.codes], dtype=np.float64)
+        return code_values[holdings.code_index] if len(code_values) else np.zeros(0)
+
+    @staticmethod
+    def get_current_values(
+        holdings: Holdings, current_stock_price_map: dict[str, float], exchange_rate_map: dict[str, float]
+    ) -> np.ndarray:
+        return (
+            ValuationService.get_code_values(holdings, current_stock_price_map)
+            * holdings.quantity
+            * ValuationService.get_won_exchange_rates(holdings, exchange_rate_map)
+        )
+
+    @staticmethod
+    def get_total_asset_amount(
+        holdings: Holdings,
+        current_stock_price_map: dict[str, float],
+        exchange_rate_map: dict[str, float],
+        purchased_before: date | None = None,
+    ) -> float:
+        current_values = ValuationService.get_current_values(holdings, current_stock_price_map, exchange_rate_map)
+        if purchased_before is not None:
+            current_values = current_values[holdings.purchase_ordinal <= purchased_before.toordinal()]
+        return float(current_values.sum())
+
+    @staticmethod
+    def get_total_investment_amount(
+        holdings: Holdings,
+        stock_daily_map: dict[tuple[str, date], StockDaily],
+        exchange_rate_map: dict[str, float],
+    ) -> float:
+        return float(ValuationService.get_investment_amounts(holdings, stock_daily_map, exchange_rate_map).sum())
+
+    @staticmethod
+    def get_investment_amounts(
+        holdings: Holdings,
+        stock_daily_map: dict[tuple[str, date], StockDaily],
+        exchange_rate_map: dict[str, float],
+    ) -> np.ndarray:
+        purchase_dailies = [
+            stock_daily_map.get((holdings.codes[code_position], purchase_date))
+            for code_position, purchase_date in zip(holdings.code_index.tolist(), holdings.purchase_date)
+        ]
+        has_daily = np.array([daily is not None for daily in purchase_dailies], dtype=np.bool_)
+        adj_close_price = np.array(
+            [daily.adj_close_price if daily is not None else np.nan for daily in purchase_dailies], dtype=np.float64
+        )
+
+        won_exchange_rates = ValuationService.get_won_exchange_rates(holdings, exchange_rate_map)
+        has_purchase_price = ~np.isnan(holdings.purchase_price)
+
+        # 매입가가 없으면 매입일 종가를, 달러 매입가는 원화로 환산합니다.
+        invest_price = np.where(
+            has_purchase_price,
+            np.where(holdings.purchase_usd, holdings.purchase_price * won_exchange_rates, holdings.purchase_price),
+            adj_close_price * won_exchange_rates,
+        )
+        return np.where(has_daily, invest_price * holdings.quantity, 0.0)
+
+    @staticmethod
+    def get_profit_rates(total_asset_amounts: np.ndarray, total_invest_amounts: np.ndarray) -> np.ndarray:
+        profit_rates = np.zeros(len(total_invest_amounts))
+        invested = total_invest_amounts > 0
+        profit_rates[invested] = (
+            (total_asset_amounts[invested] - total_invest_amounts[invested]) / total_invest_amounts[invested]
+        ) * 100
+        return profit_rates
+
+    @staticmethod
+    def get_total_dividend(
+        holdings: Holdings, dividend_map: dict[str, float], exchange_rate_map: dict[str, float]
+    ) -> float:
+        return float(
+            (
+                ValuationService.get_code_values(holdings, dividend_map)
+                * holdings.quantity
+                * ValuationService.get_won_exchange_rates(holdings, exchange_rate_map)
+            ).sum()
+        )
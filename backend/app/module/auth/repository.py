@@ -19,6 +19,12 @@ class UserRepository:
         result = await session.execute(select_instance)
         return result.scalars().first()
 
+    @staticmethod
+    async def get_user_ids_after(session: AsyncSession, last_user_id: int, limit: int) -> list[int]:
+        select_instance = select(User.id).where(User.id > last_user_id).order_by(User.id).limit(limit)
+        result = await session.execute(select_instance)
+        return result.scalars().all()
+
     @staticmethod
     async def create(session: AsyncSession, new_user: User) -> User:
         session.add(new_user)
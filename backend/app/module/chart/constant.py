@@ -4,3 +4,5 @@ NONE_ACCOUNT = "기타"
 RICHPICKKEY = "richpick"
 RICHPICKNAMEKEY = "richpickname"
 RICH_PICK_SECOND = 60 * 60
+# 기간 시작일이 휴장일이면 직전 종가로 채우기 위해 조회 범위를 앞당깁니다.
+PORTFOLIO_PRICE_LOOKBACK_DAYS = 14
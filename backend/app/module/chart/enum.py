@@ -44,3 +44,12 @@ class IntervalType(StrEnum):
         elif self == IntervalType.ONEYEAR:
             return 1
         return 1
+
+
+class DashboardSection(StrEnum):
+    SUMMARY = "summary"
+    COMPOSITION = "composition"
+    ACCOUNT = "account"
+    MY_STOCK = "my_stock"
+    ESTIMATE_DIVIDEND = "estimate_dividend"
+    PERFORMANCE_ANALYSIS = "performance_analysis"
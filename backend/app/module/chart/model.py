@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, String
+from sqlalchemy import BigInteger, Column, Date, Float, ForeignKey, String, UniqueConstraint
 
 from app.common.mixin.timestamp import TimestampMixin
 from database.config import MySQLBase
@@ -9,3 +9,17 @@ class InvestTip(TimestampMixin, MySQLBase):
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     tip = Column(String(255), nullable=False)
+
+
+class UserPortfolioDaily(MySQLBase):
+    __tablename__ = "user_portfolio_daily"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(BigInteger, ForeignKey("user.id"), nullable=False)
+    date = Column(Date, nullable=False, info={"description": "평가 일자"})
+    total_asset_amount = Column(Float, nullable=False, info={"description": "해당 일자 종가 기준 평가금"})
+    total_invest_amount = Column(Float, nullable=False, info={"description": "해당 일자까지 누적 투자금"})
+    profit_rate = Column(Float, nullable=False, info={"description": "수익률"})
+
+    # 유니크 제약이 (user_id, date) 인덱스를 만들므로 별도 인덱스는 두지 않습니다.
+    __table_args__ = (UniqueConstraint("user_id", "date", name="uq_user_date"),)
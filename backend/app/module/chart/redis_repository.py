@@ -51,3 +51,13 @@ class RedisMarketIndiceRepository:
     @staticmethod
     async def save(redis_client: Redis, key: str, market_index_value: str, expire_time: int) -> None:
         await redis_client.set(key, market_index_value, ex=expire_time)
+
+
+class RedisPortfolioDailyCheckpointRepository:
+    @staticmethod
+    async def get(redis_client: Redis, key: str) -> str | None:
+        return await redis_client.get(key)
+
+    @staticmethod
+    async def save(redis_client: Redis, key: str, last_user_id: int, expire_time: int) -> None:
+        await redis_client.set(key, last_user_id, ex=expire_time)
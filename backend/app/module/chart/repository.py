@@ -1,9 +1,13 @@
+from datetime import date
+
+from sqlalchemy import delete
 from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql import func
 
-from app.module.chart.model import InvestTip
+from app.module.chart.model import InvestTip, UserPortfolioDaily
+from database.bulk_write import chunked_upsert
 
 
 class TipRepository:
@@ -27,3 +31,44 @@ class TipRepository:
         result = await session.execute(select(func.count(InvestTip.id)).where(InvestTip.id == tip_id))
         count = result.scalar_one()
         return count > 0
+
+
+class UserPortfolioDailyRepository:
+    @staticmethod
+    async def get_by_range(
+        session: AsyncSession, user_id: int, date_range: tuple[date, date]
+    ) -> list[UserPortfolioDaily]:
+        start_date, end_date = date_range
+        result = await session.execute(
+            select(UserPortfolioDaily)
+            .where(UserPortfolioDaily.user_id == user_id, UserPortfolioDaily.date.between(start_date, end_date))
+            .order_by(UserPortfolioDaily.date)
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    async def delete_from_date(session: AsyncSession, user_id: int, from_date: date) -> None:
+        await session.execute(
+            delete(UserPortfolioDaily).where(
+                UserPortfolioDaily.user_id == user_id, UserPortfolioDaily.date >= from_date
+            )
+        )
+        await session.commit()
+
+    @staticmethod
+    async def bulk_upsert(session: AsyncSession, portfolio_dailies: list[UserPortfolioDaily]) -> int:
+        return await chunked_upsert(
+            session,
+            UserPortfolioDaily,
+            [
+                {
+                    "user_id": portfolio_daily.user_id,
+                    "date": portfolio_daily.date,
+                    "total_asset_amount": portfolio_daily.total_asset_amount,
+                    "total_invest_amount": portfolio_daily.total_invest_amount,
+                    "profit_rate": portfolio_daily.profit_rate,
+                }
+                for portfolio_daily in portfolio_dailies
+            ],
+            ["total_asset_amount", "total_invest_amount", "profit_rate"],
+        )
@@ -1,3 +1,6 @@
+from datetime import datetime
+
+from fastapi import HTTPException, status
 from pydantic import BaseModel, Field, RootModel
 
 from app.module.asset.constant import MARKET_INDEX_KR_MAPPING
@@ -15,12 +18,21 @@ class SummaryResponse(BaseModel):
     profit_amount: int = Field(..., description="수익금")
     profit_rate: float = Field(..., description="수익률")
 
+    @staticmethod
+    def validate_stocks(not_found_stock_codes: list[str]) -> None:
+        if not_found_stock_codes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail={"not_found_stock_codes": not_found_stock_codes}
+            )
+
 
 class MarketIndiceResponseValue(BaseModel):
     name: str = Field(..., example=f"{', '.join([e.value for e in MarketIndex])}")
     name_kr: str = Field(..., description="한국어 지수 이름", example=f"{', '.join(MARKET_INDEX_KR_MAPPING.values())}")
     current_value: float = Field(..., description="현재 지수")
     change_percent: float = Field(..., description="1일 기준 변동성")
+    updated_at: datetime | None = Field(None, description="마지막 수집 성공 시각")
+    is_stale: bool = Field(False, description="마지막 수집 성공 후 일정 시간이 지났는지 여부")
 
 
 class MarketIndiceResponse(BaseModel):
@@ -77,6 +89,17 @@ class MyStockResponse(BaseModel):
     my_stock_list: list[MyStockResponseValue]
 
 
+class DashboardResponse(BaseModel):
+    summary: SummaryResponse | None = Field(None, description="오늘의 리뷰, 나의 총자산, 나의 투자 금액, 수익금")
+    composition: CompositionResponse | None = Field(None, description="종목 별 구성")
+    account: CompositionResponse | None = Field(None, description="계좌 별 구성")
+    my_stock: MyStockResponse | None = Field(None, description="내 보유 주식")
+    estimate_dividend: EstimateDividendEveryResponse | EstimateDividendTypeResponse | None = Field(
+        None, description="예상 배당액"
+    )
+    performance_analysis: PerformanceAnalysisResponse | None = Field(None, description="투자 성과 분석")
+
+
 class RichPickValue(BaseModel):
     name: str
     price: float
@@ -0,0 +1,260 @@
+from datetime import date, datetime, timedelta
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.dataclass import PortfolioSnapshot
+from app.module.asset.model import Dividend
+from app.module.asset.repository.dividend_repository import DividendRepository
+from app.module.asset.services.asset_stock_service import AssetStockService
+from app.module.asset.services.dividend_service import DividendService
+from app.module.asset.services.portfolio_snapshot_service import PortfolioSnapshotService
+from app.module.asset.services.stock_service import StockService
+from app.module.asset.services.valuation_service import ValuationService
+from app.module.chart.enum import CompositionType, DashboardSection, EstimateDividendType, IntervalType
+from app.module.chart.model import UserPortfolioDaily
+from app.module.chart.schema import (
+    CompositionResponse,
+    CompositionResponseValue,
+    DashboardResponse,
+    EstimateDividendEveryResponse,
+    EstimateDividendEveryValue,
+    EstimateDividendTypeResponse,
+    EstimateDividendTypeValue,
+    MyStockResponse,
+    MyStockResponseValue,
+    PerformanceAnalysisResponse,
+    SummaryResponse,
+)
+from app.module.chart.service.composition_service import CompositionService
+from app.module.chart.service.performance_analysis_service import PerformanceAnalysis
+from app.module.chart.service.portfolio_history_service import PortfolioHistoryService
+
+
+class DashboardService:
+    @staticmethod
+    async def get_dashboard(
+        session: AsyncSession,
+        redis_client: Redis,
+        user_id: int,
+        sections: list[DashboardSection],
+        category: EstimateDividendType,
+        interval: IntervalType,
+    ) -> DashboardResponse:
+        snapshot: PortfolioSnapshot = await PortfolioSnapshotService.get(session, redis_client, user_id)
+        response = DashboardResponse()
+
+        if DashboardSection.SUMMARY in sections:
+            response.summary = await DashboardService.get_summary(session, redis_client, user_id, snapshot)
+        if DashboardSection.COMPOSITION in sections:
+            response.composition = DashboardService.get_composition(snapshot, CompositionType.COMPOSITION)
+        if DashboardSection.ACCOUNT in sections:
+            response.account = DashboardService.get_composition(snapshot, CompositionType.ACCOUNT)
+        if DashboardSection.MY_STOCK in sections:
+            response.my_stock = await DashboardService.get_my_stock(session, user_id, snapshot)
+        if DashboardSection.ESTIMATE_DIVIDEND in sections:
+            response.estimate_dividend = await DashboardService.get_estimate_dividend(
+                session, redis_client, snapshot, category
+            )
+        if DashboardSection.PERFORMANCE_ANALYSIS in sections:
+            response.performance_analysis = await DashboardService.get_performance_analysis(
+                session, redis_client, user_id, interval
+            )
+
+        return response
+
+    @staticmethod
+    async def get_summary(
+        session: AsyncSession, redis_client: Redis, user_id: int, snapshot: PortfolioSnapshot
+    ) -> SummaryResponse:
+        assets = snapshot.assets
+        if len(assets) == 0:
+            return SummaryResponse(
+                today_review_rate=0.0, total_asset_amount=0, total_investment_amount=0, profit_amount=0, profit_rate=0.0
+            )
+
+        current_stock_price_map = snapshot.current_stock_price_map
+        exchange_rate_map = snapshot.exchange_rate_map
+
+        not_found_stock_codes: list[str] = StockService.check_not_found_stock(
+            snapshot.stock_daily_map, current_stock_price_map, assets
+        )
+        SummaryResponse.validate_stocks(not_found_stock_codes)
+
+        total_asset_amount = ValuationService.get_total_asset_amount(
+            snapshot.holdings, current_stock_price_map, exchange_rate_map
+        )
+        total_investment_amount = ValuationService.get_total_investment_amount(
+            snapshot.holdings, snapshot.stock_daily_map, exchange_rate_map
+        )
+
+        profit_amount = total_asset_amount - total_investment_amount
+        profit_rate = (total_asset_amount - total_investment_amount) / total_asset_amount * 100
+
+        # 30일 전 평가금은 일별 평가금 테이블에서 읽습니다.
+        thirty_days_ago = datetime.now().date() - timedelta(days=30)
+        portfolio_dailies_30days: list[UserPortfolioDaily] = await PortfolioHistoryService.get_series(
+            session, redis_client, user_id, thirty_days_ago, thirty_days_ago
+        )
+
+        if len(portfolio_dailies_30days) == 0 or portfolio_dailies_30days[0].total_asset_amount == 0:
+            today_review_rate = 100.0
+        else:
+            total_asset_amount_30days = portfolio_dailies_30days[0].total_asset_amount
+            today_review_rate = (total_asset_amount - total_asset_amount_30days) / total_asset_amount * 100
+
+        return SummaryResponse(
+            today_review_rate=today_review_rate,
+            total_asset_amount=int(total_asset_amount),
+            total_investment_amount=int(total_investment_amount),
+            profit_amount=int(profit_amount),
+            profit_rate=profit_rate,
+        )
+
+    @staticmethod
+    def get_composition(snapshot: PortfolioSnapshot, type: CompositionType) -> CompositionResponse:
+        assets = snapshot.assets
+        if len(assets) == 0:
+            return CompositionResponse(
+                composition=[CompositionResponseValue(name="자산 없음", percent_rate=0.0, current_amount=0.0)]
+            )
+
+        if type is CompositionType.COMPOSITION:
+            composition_data = CompositionService.get_asset_stock_composition(
+                snapshot.holdings, snapshot.current_stock_price_map, snapshot.exchange_rate_map
+            )
+        else:
+            composition_data = CompositionService.get_asset_stock_account(
+                snapshot.holdings, snapshot.current_stock_price_map, snapshot.exchange_rate_map
+            )
+
+        return CompositionResponse(
+            composition=[
+                CompositionResponseValue(
+                    name=item["name"], percent_rate=item["percent_rate"], current_amount=item["current_amount"]
+                )
+                for item in composition_data
+            ]
+        )
+
+    @staticmethod
+    async def get_my_stock(session: AsyncSession, user_id: int, snapshot: PortfolioSnapshot) -> MyStockResponse:
+        assets = snapshot.assets
+        if len(assets) == 0:
+            return MyStockResponse(my_stock_list=[])
+
+        stock_assets: list[dict] = await AssetStockService.get_stock_assets(
+            session,
+            user_id,
+            assets,
+            snapshot.stock_daily_map,
+            snapshot.current_stock_price_map,
+            snapshot.dividend_map,
+            snapshot.exchange_rate_map,
+        )
+
+        my_stock_list = [
+            MyStockResponseValue(
+                name=stock_asset["stock_name"],
+                current_price=stock_asset["current_price"],
+                profit_rate=stock_asset["profit_rate"],
+                profit_amount=stock_asset["profit_amount"],
+                quantity=stock_asset["quantity"],
+            )
+            for stock_asset in stock_assets
+        ]
+
+        return MyStockResponse(my_stock_list=my_stock_list)
+
+    @staticmethod
+    async def get_estimate_dividend(
+        session: AsyncSession, redis_client: Redis, snapshot: PortfolioSnapshot, category: EstimateDividendType
+    ) -> EstimateDividendEveryResponse | EstimateDividendTypeResponse:
+        assets = snapshot.assets
+        if len(assets) == 0:
+            if category == EstimateDividendType.EVERY:
+                return EstimateDividendEveryResponse({})
+            else:
+                return EstimateDividendTypeResponse([])
+
+        exchange_rate_map = snapshot.exchange_rate_map
+
+        if category == EstimateDividendType.EVERY:
+            stock_codes = list({asset.asset_stock.stock.code for asset in assets})
+            dividends: list[Dividend] = await DividendRepository.get_dividends(session, stock_codes)
+            dividend_index = DividendService.get_dividend_index(dividends)
+            dividend_calendar_map = await DividendService.get_dividend_calendar_map(redis_client, stock_codes)
+
+            dividend_by_year_month = DividendService.get_total_estimate_dividend(
+                assets, exchange_rate_map, dividend_index, dividend_calendar_map
+            )
+
+            response_data = {}
+
+            for year, months in dividend_by_year_month.items():
+                xAxises = ["1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월", "9월", "10월", "11월", "12월"]
+
+                data = months.tolist()
+                total = sum(data)
+
+                response_data[str(year)] = EstimateDividendEveryValue(
+                    xAxises=xAxises, data=data, unit="만원", total=total
+                )
+
+            sorted_response_data = dict(sorted(response_data.items(), key=lambda item: int(item[0])))
+
+            return EstimateDividendEveryResponse(sorted_response_data)
+        else:
+            total_type_dividends: list[tuple[str, float, float]] = await DividendService.get_composition(
+                assets, exchange_rate_map, snapshot.dividend_map
+            )
+            estimate_dividend_list = [
+                EstimateDividendTypeValue(code=stock_code, amount=amount, composition_rate=composition_rate)
+                for stock_code, amount, composition_rate in total_type_dividends
+            ]
+
+            return EstimateDividendTypeResponse(estimate_dividend_list)
+
+    @staticmethod
+    async def get_performance_analysis(
+        session: AsyncSession, redis_client: Redis, user_id: int, interval: IntervalType
+    ) -> PerformanceAnalysisResponse:
+        current_datetime = datetime.now()
+        start_datetime = current_datetime - interval.get_timedelta()
+
+        if interval in [IntervalType.ONEMONTH, IntervalType.THREEMONTH, IntervalType.SIXMONTH, IntervalType.ONEYEAR]:
+            market_analysis_result: dict[date, float] = await PerformanceAnalysis.get_market_analysis(
+                session, redis_client, start_datetime, current_datetime
+            )
+            user_analysis_result: dict[date, float] = await PerformanceAnalysis.get_user_analysis(
+                session, redis_client, start_datetime.date(), current_datetime.date(), user_id, market_analysis_result
+            )
+            sorted_dates = sorted(market_analysis_result.keys())
+
+            return PerformanceAnalysisResponse(
+                xAxises=[market_date.strftime("%Y.%m.%d") for market_date in sorted_dates],
+                values1={"values": [user_analysis_result[d] for d in sorted_dates], "name": "내 수익률"},
+                values2={"values": [market_analysis_result[d] for d in sorted_dates], "name": "코스피"},
+                unit="%",
+            )
+        else:
+            market_analysis_result_short: dict[datetime, float] = await PerformanceAnalysis.get_market_analysis_short(
+                session, redis_client, start_datetime, current_datetime, interval
+            )
+            user_analysis_result_short: dict[datetime, float] = await PerformanceAnalysis.get_user_analysis_short(
+                session,
+                redis_client,
+                start_datetime,
+                current_datetime,
+                user_id,
+                interval,
+                market_analysis_result_short,
+            )
+            sorted_datetimes = sorted(market_analysis_result_short.keys())
+
+            return PerformanceAnalysisResponse(
+                xAxises=[market_datetime.strftime("%Y.%m.%d:%H:%M") for market_datetime in sorted_datetimes],
+                values1={"values": [user_analysis_result_short[d] for d in sorted_datetimes], "name": "내 수익률"},
+                values2={"values": [market_analysis_result_short[d] for d in sorted_datetimes], "name": "코스피"},
+                unit="%",
+            )
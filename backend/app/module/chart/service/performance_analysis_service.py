@@ -1,7 +1,7 @@
 import json
-from collections import defaultdict
 from datetime import date, datetime, time
 
+import numpy as np
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,11 +12,12 @@ from app.module.asset.repository.market_index_daily_repository import MarketInde
 from app.module.asset.repository.market_index_minutely_repository import MarketIndexMinutelyRepository
 from app.module.asset.repository.stock_daily_repository import StockDailyRepository
 from app.module.asset.repository.stock_minutely_repository import StockMinutelyRepository
-from app.module.asset.services.asset_stock_service import AssetStockService
 from app.module.asset.services.exchange_rate_service import ExchangeRateService
-from app.module.asset.services.stock_service import StockService
+from app.module.asset.services.valuation_service import ValuationService
 from app.module.chart.enum import IntervalType
+from app.module.chart.model import UserPortfolioDaily
 from app.module.chart.redis_repository import RedisMarketIndiceRepository
+from app.module.chart.service.portfolio_history_service import PortfolioHistoryService
 
 
 class PerformanceAnalysis:
@@ -47,39 +48,48 @@ class PerformanceAnalysis:
             session, (interval_start, interval_end), stock_codes, interval.get_interval()
         )
 
-        stock_interval_date_price_map = {
-            f"{stock_minutely.code}_{stock_minutely.datetime}": stock_minutely.current_price
+        stock_interval_price_map = {
+            (stock_minutely.code, stock_minutely.datetime): stock_minutely.current_price
             for stock_minutely in interval_data
         }
 
-        assets_by_date = defaultdict(list)
-        for asset in assets:
-            purchase_datetime = datetime.combine(asset.asset_stock.purchase_date, time.max)
-            assets_by_date[purchase_datetime].append(asset)
+        holdings = ValuationService.get_holdings(assets)
+        sorted_datetimes = sorted(market_analysis_result)
+        datetime_positions = {market_datetime: i for i, market_datetime in enumerate(sorted_datetimes)}
+        code_positions = {code: i for i, code in enumerate(holdings.codes)}
 
-        result = {}
-        cumulative_assets = []
-
-        for market_datetime in sorted(market_analysis_result):
-            if market_datetime in assets_by_date:
-                assets_for_date = assets_by_date[market_datetime]
-                cumulative_assets.extend(assets_for_date)
-
-            total_asset_amount = AssetStockService.get_total_asset_amount_minute(
-                assets, stock_interval_date_price_map, exchange_rate_map, market_datetime
-            )
+        # 분 단위 평가금은 누적 매입 여부와 관계없이 전체 자산 기준이므로, 종목별 (수량 x 환율) 가중치로 한 번에 합산합니다.
+        code_weights = np.bincount(
+            holdings.code_index,
+            weights=holdings.quantity * ValuationService.get_won_exchange_rates(holdings, exchange_rate_map),
+            minlength=len(holdings.codes),
+        )
+        price_positions, price_amounts = [], []
+        for (stock_code, minute_datetime), current_price in stock_interval_price_map.items():
+            datetime_position = datetime_positions.get(minute_datetime)
+            code_position = code_positions.get(stock_code)
+            if datetime_position is None or code_position is None or current_price is None:
+                continue
+            price_positions.append(datetime_position)
+            price_amounts.append(current_price * code_weights[code_position])
+
+        total_asset_amounts = np.bincount(
+            np.array(price_positions, dtype=np.int64),
+            weights=np.array(price_amounts, dtype=np.float64),
+            minlength=len(sorted_datetimes),
+        )
+        total_invest_amounts = PerformanceAnalysis._get_cumulative_amounts(
+            sorted_datetimes,
+            [datetime.combine(purchase_date, time.min) for purchase_date in holdings.purchase_date],
+            ValuationService.get_investment_amounts(holdings, stock_daily_map, exchange_rate_map),
+        )
 
-            total_invest_amount = AssetStockService.get_total_investment_amount(
-                cumulative_assets, stock_daily_map, exchange_rate_map
+        return dict(
+            zip(
+                sorted_datetimes,
+                ValuationService.get_profit_rates(total_asset_amounts, total_invest_amounts).tolist(),
             )
-
-            total_profit_rate = 0.0
-            if total_invest_amount > 0:
-                total_profit_rate = ((total_asset_amount - total_invest_amount) / total_invest_amount) * 100
-
-            result[market_datetime] = total_profit_rate
-
-        return result
+        )
 
     @staticmethod
     async def get_user_analysis(
@@ -90,52 +100,34 @@ class PerformanceAnalysis:
         user_id: int,
         market_analysis_result: dict[date, float],
     ) -> dict[date, float]:
-        assets = await AssetRepository.get_eager_by_range(
-            session, user_id, AssetType.STOCK, (interval_start, interval_end)
-        )
-
-        stock_codes = [asset.asset_stock.stock.code for asset in assets]
-        stock_code_date_pairs = [(asset.asset_stock.stock.code, asset.asset_stock.purchase_date) for asset in assets]
-
-        stock_dailies: list[StockDaily] = await StockDailyRepository.get_stock_dailies_by_code_and_date(
-            session, stock_code_date_pairs
+        portfolio_dailies: list[UserPortfolioDaily] = await PortfolioHistoryService.get_series(
+            session, redis_client, user_id, interval_start, interval_end
         )
-        stock_daily_map = {(daily.code, daily.date): daily for daily in stock_dailies}
+        portfolio_ordinals = np.array([portfolio_daily.date.toordinal() for portfolio_daily in portfolio_dailies])
+        profit_rates = [portfolio_daily.profit_rate for portfolio_daily in portfolio_dailies]
 
-        latest_stock_dailies: list[StockDaily] = await StockDailyRepository.get_latest(session, stock_codes)
-        latest_stock_daily_map = {daily.code: daily for daily in latest_stock_dailies}
-
-        current_stock_price_map = await StockService.get_current_stock_price_by_code(
-            redis_client, latest_stock_daily_map, stock_codes
+        # 시장 일자마다 그 날짜 이전의 가장 최근 일별 수익률을 사용합니다.
+        sorted_dates = sorted(market_analysis_result)
+        positions = np.searchsorted(
+            portfolio_ordinals, [market_date.toordinal() for market_date in sorted_dates], side="right"
         )
-        exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
-
-        assets_by_date = defaultdict(list)
-        for asset in assets:
-            assets_by_date[asset.asset_stock.purchase_date].append(asset)
-
-        cumulative_assets = []
-        result = {}
 
-        for market_date in sorted(market_analysis_result):
-            if market_date in assets_by_date:
-                assets_for_date = assets_by_date[market_date]
-                cumulative_assets.extend(assets_for_date)
-
-            total_asset_amount = AssetStockService.get_total_asset_amount(
-                cumulative_assets, current_stock_price_map, exchange_rate_map
-            )
-            total_invest_amount = AssetStockService.get_total_investment_amount(
-                cumulative_assets, stock_daily_map, exchange_rate_map
-            )
-
-            total_profit_rate = 0.0
-            if total_invest_amount > 0:
-                total_profit_rate = ((total_asset_amount - total_invest_amount) / total_invest_amount) * 100
-
-            result[market_date] = total_profit_rate
+        return {
+            market_date: profit_rates[position - 1] if position > 0 else 0.0
+            for market_date, position in zip(sorted_dates, positions.tolist())
+        }
 
-        return result
+    @staticmethod
+    def _get_cumulative_amounts(market_keys: list, purchase_keys: list, amounts: np.ndarray) -> np.ndarray:
+        # 정렬된 시장 시점 중 매입 시점 이후의 첫 시점부터 해당 자산이 누적됩니다.
+        # 구간 이전 매입분은 첫 시점부터 포함되고, 마지막 시점 이후 매입분은 포함되지 않습니다.
+        entry_positions = np.searchsorted(
+            np.array(market_keys, dtype=object), np.array(purchase_keys, dtype=object), side="left"
+        ).astype(np.int64)
+        entered = entry_positions < len(market_keys)
+
+        amounts_by_entry = np.bincount(entry_positions[entered], weights=amounts[entered], minlength=len(market_keys))
+        return np.cumsum(amounts_by_entry)
 
     @staticmethod
     async def get_market_analysis_short(
@@ -0,0 +1,184 @@
+from datetime import date, timedelta
+
+import numpy as np
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.dataclass import Holdings
+from app.module.asset.enum import AssetType
+from app.module.asset.model import Asset, StockDaily
+from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.repository.stock_daily_repository import StockDailyRepository
+from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.asset.services.stock_daily_service import StockDailyService
+from app.module.asset.services.valuation_service import ValuationService
+from app.module.chart.constant import PORTFOLIO_PRICE_LOOKBACK_DAYS
+from app.module.chart.model import UserPortfolioDaily
+from app.module.chart.repository import UserPortfolioDailyRepository
+
+
+class PortfolioHistoryService:
+    @staticmethod
+    async def get_series(
+        session: AsyncSession, redis_client: Redis, user_id: int, start_date: date, end_date: date
+    ) -> list[UserPortfolioDaily]:
+        # 당일 종가는 장 마감 후 수집되므로, 전일까지의 평가금만 저장합니다.
+        end_date = min(end_date, date.today() - timedelta(days=1))
+        if start_date > end_date:
+            return []
+
+        saved_portfolio_dailies = await UserPortfolioDailyRepository.get_by_range(
+            session, user_id, (start_date, end_date)
+        )
+        saved_dates = {portfolio_daily.date for portfolio_daily in saved_portfolio_dailies}
+        missing_dates = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+            if start_date + timedelta(days=offset) not in saved_dates
+        ]
+        if len(missing_dates) == 0:
+            return saved_portfolio_dailies
+
+        # 비어 있는 날짜가 걸친 구간만 계산합니다.
+        assets = await AssetRepository.get_eager(session, user_id, AssetType.STOCK)
+        missing_date_set = set(missing_dates)
+        new_portfolio_dailies = [
+            portfolio_daily
+            for portfolio_daily in await PortfolioHistoryService.calculate_by_assets(
+                session, redis_client, user_id, assets, missing_dates[0], missing_dates[-1]
+            )
+            if portfolio_daily.date in missing_date_set
+        ]
+
+        # 전일 종가는 아침 수집 작업 이후에 들어오므로, 수집 전에는 이전 종가로 채운 평가금이 계산됩니다.
+        # 이런 날짜를 저장하면 다시 계산되지 않으므로, 보유 종목의 종가가 수집된 날짜까지만 저장합니다.
+        latest_ingested_date = None
+        if len(assets) > 0:
+            latest_ingested_date = await StockDailyRepository.get_latest_date(
+                session, list({asset.asset_stock.stock.code for asset in assets})
+            )
+        if latest_ingested_date is not None:
+            await UserPortfolioDailyRepository.bulk_upsert(
+                session,
+                [
+                    portfolio_daily
+                    for portfolio_daily in new_portfolio_dailies
+                    if portfolio_daily.date <= latest_ingested_date
+                ],
+            )
+        return sorted(
+            [*saved_portfolio_dailies, *new_portfolio_dailies], key=lambda portfolio_daily: portfolio_daily.date
+        )
+
+    @staticmethod
+    async def invalidate(session: AsyncSession, user_id: int, from_date: date) -> None:
+        # 자산의 매입일 이전 평가금은 바뀌지 않으므로, 매입일부터 저장된 평가금만 지웁니다.
+        await UserPortfolioDailyRepository.delete_from_date(session, user_id, from_date)
+
+    @staticmethod
+    async def calculate(
+        session: AsyncSession, redis_client: Redis, user_id: int, start_date: date, end_date: date
+    ) -> list[UserPortfolioDaily]:
+        assets = await AssetRepository.get_eager(session, user_id, AssetType.STOCK)
+        return await PortfolioHistoryService.calculate_by_assets(
+            session, redis_client, user_id, assets, start_date, end_date
+        )
+
+    @staticmethod
+    async def calculate_by_assets(
+        session: AsyncSession,
+        redis_client: Redis,
+        user_id: int,
+        assets: list[Asset],
+        start_date: date,
+        end_date: date,
+    ) -> list[UserPortfolioDaily]:
+        stock_daily_map: dict[tuple[str, date], StockDaily] = {}
+        stock_dailies: list[StockDaily] = []
+        if len(assets) > 0:
+            stock_daily_map = await StockDailyService.get_map_range(session, assets)
+            stock_dailies = await StockDailyRepository.get_by_range(
+                session,
+                list({asset.asset_stock.stock.code for asset in assets}),
+                (start_date - timedelta(days=PORTFOLIO_PRICE_LOOKBACK_DAYS), end_date),
+            )
+        exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
+
+        return PortfolioHistoryService.get_portfolio_dailies(
+            user_id, assets, stock_dailies, stock_daily_map, exchange_rate_map, start_date, end_date
+        )
+
+    @staticmethod
+    def get_portfolio_dailies(
+        user_id: int,
+        assets: list[Asset],
+        stock_dailies: list[StockDaily],
+        stock_daily_map: dict[tuple[str, date], StockDaily],
+        exchange_rate_map: dict[str, float],
+        start_date: date,
+        end_date: date,
+    ) -> list[UserPortfolioDaily]:
+        holdings = ValuationService.get_holdings(assets)
+        total_asset_amounts, total_invest_amounts = PortfolioHistoryService.get_daily_amounts(
+            holdings,
+            stock_dailies,
+            ValuationService.get_investment_amounts(holdings, stock_daily_map, exchange_rate_map),
+            exchange_rate_map,
+            start_date,
+            end_date,
+        )
+        profit_rates = ValuationService.get_profit_rates(total_asset_amounts, total_invest_amounts)
+
+        return [
+            UserPortfolioDaily(
+                user_id=user_id,
+                date=start_date + timedelta(days=offset),
+                total_asset_amount=total_asset_amount,
+                total_invest_amount=total_invest_amount,
+                profit_rate=profit_rate,
+            )
+            for offset, (total_asset_amount, total_invest_amount, profit_rate) in enumerate(
+                zip(total_asset_amounts.tolist(), total_invest_amounts.tolist(), profit_rates.tolist())
+            )
+        ]
+
+    @staticmethod
+    def get_daily_amounts(
+        holdings: Holdings,
+        stock_dailies: list[StockDaily],
+        investment_amounts: np.ndarray,
+        exchange_rate_map: dict[str, float],
+        start_date: date,
+        end_date: date,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        day_count = (end_date - start_date).days + 1
+        start_ordinal = start_date.toordinal()
+        code_positions = {code: i for i, code in enumerate(holdings.codes)}
+
+        # 종목 x 일자 종가 행렬입니다. 시작일 이전 종가는 첫 칸에 날짜순으로 덮어써 가장 최근 종가가 남습니다.
+        prices = np.full((len(holdings.codes), day_count), np.nan)
+        for stock_daily in sorted(stock_dailies, key=lambda stock_daily: stock_daily.date):
+            code_position = code_positions.get(stock_daily.code)
+            day_position = max(stock_daily.date.toordinal() - start_ordinal, 0)
+            if code_position is None or day_position >= day_count:
+                continue
+            prices[code_position, day_position] = stock_daily.adj_close_price
+
+        # 휴장일은 직전 거래일 종가로 채우고, 종가가 없는 구간은 0으로 둡니다.
+        filled_positions = np.where(np.isnan(prices), 0, np.arange(day_count))
+        np.maximum.accumulate(filled_positions, axis=1, out=filled_positions)
+        prices = np.nan_to_num(np.take_along_axis(prices, filled_positions, axis=1))
+
+        # 매입일부터 보유 수량이 누적되며, 기간 이전 매입분은 첫 날부터 보유한 것으로 봅니다.
+        entry_positions = np.maximum(holdings.purchase_ordinal - start_ordinal, 0)
+        held = entry_positions < day_count
+        weights = holdings.quantity * ValuationService.get_won_exchange_rates(holdings, exchange_rate_map)
+
+        code_weights = np.zeros((len(holdings.codes), day_count))
+        np.add.at(code_weights, (holdings.code_index[held], entry_positions[held]), weights[held])
+        total_asset_amounts = (np.cumsum(code_weights, axis=1) * prices).sum(axis=0)
+
+        total_invest_amounts = np.cumsum(
+            np.bincount(entry_positions[held], weights=investment_amounts[held], minlength=day_count)
+        )
+        return total_asset_amounts, total_invest_amounts
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from collections.abc import Iterator
+
+from icecream import ic
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.constant import (
+    BULK_UPSERT_MAX_BYTES,
+    BULK_UPSERT_MAX_ROWS,
+    BULK_UPSERT_RETRY_COUNT,
+    BULK_UPSERT_RETRY_SECOND,
+    MYSQL_RETRYABLE_ERROR_CODES,
+)
+
+
+# records를 행 수와 크기 기준으로 나눠 배치마다 upsert하고 커밋합니다.
+# 실패한 배치는 기록만 하고 다음 배치를 계속 저장하며, 예외를 올리지 않습니다.
+# 대신 실제로 저장된 행 수를 반환하므로, 호출하는 쪽은 반환값이 len(records)보다 작은지 확인해야 합니다.
+async def chunked_upsert(
+    session: AsyncSession,
+    model,
+    records: list[dict],
+    update_columns: list[str],
+    update_values: dict | None = None,
+    max_rows: int = BULK_UPSERT_MAX_ROWS,
+    max_bytes: int = BULK_UPSERT_MAX_BYTES,
+) -> int:
+    if len(records) == 0:
+        return 0
+
+    table_name = model.__tablename__
+    saved_row_count = 0
+
+    for batch_index, batch in enumerate(split_records(records, max_rows, max_bytes)):
+        started_at = time.monotonic()
+        try:
+            await _upsert_batch(session, model, batch, update_columns, update_values)
+        except Exception as e:
+            ic(f"[chunked_upsert] {table_name} {batch_index}번째 배치 {len(batch)}건 저장에 실패했습니다. {e}")
+            continue
+
+        saved_row_count += len(batch)
+        ic(
+            f"[chunked_upsert] {table_name} {batch_index}번째 배치 {len(batch)}건, "
+            f"{(time.monotonic() - started_at) * 1000:.1f}ms"
+        )
+
+    return saved_row_count
+
+
+def split_records(records: list[dict], max_rows: int, max_bytes: int) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    batch_bytes = 0
+
+    for record in records:
+        # 값의 문자열 길이로 INSERT 문 크기를 어림합니다.
+        record_bytes = sum(len(str(value)) + 4 for value in record.values())
+        if batch and (len(batch) >= max_rows or batch_bytes + record_bytes > max_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+
+        batch.append(record)
+        batch_bytes += record_bytes
+
+    if batch:
+        yield batch
+
+
+async def _upsert_batch(
+    session: AsyncSession, model, batch: list[dict], update_columns: list[str], update_values: dict | None
+) -> None:
+    for attempt in range(1, BULK_UPSERT_RETRY_COUNT + 1):
+        stmt = insert(model).values(batch)
+        update_dict = {column: stmt.inserted[column] for column in update_columns} | (update_values or {})
+
+        try:
+            await session.execute(stmt.on_duplicate_key_update(update_dict))
+            await session.commit()
+            return
+        except DBAPIError as e:
+            await session.rollback()
+            error_code = e.orig.args[0] if e.orig is not None and e.orig.args else None
+            if error_code not in MYSQL_RETRYABLE_ERROR_CODES or attempt == BULK_UPSERT_RETRY_COUNT:
+                raise
+
+            ic(f"[chunked_upsert] {model.__tablename__} 잠금 충돌({error_code}), {attempt}번째 재시도합니다.")
+            await asyncio.sleep(BULK_UPSERT_RETRY_SECOND * attempt)
+        except Exception:
+            await session.rollback()
+            raise
@@ -1,2 +1,15 @@
 POOL_SIZE = 20
 MAX_OVERFLOW = 5
+
+REDIS_HEALTH_CHECK_SECOND = 30
+REDIS_SOCKET_TIMEOUT_SECOND = 5
+
+BULK_UPSERT_MAX_ROWS = 1000
+# max_allowed_packet(기본 64MB)보다 충분히 작게 나눕니다.
+BULK_UPSERT_MAX_BYTES = 4 * 1024 * 1024
+BULK_UPSERT_RETRY_COUNT = 3
+BULK_UPSERT_RETRY_SECOND = 0.2
+# 1213: deadlock, 1205: lock wait timeout
+MYSQL_RETRYABLE_ERROR_CODES = (1213, 1205)
+
+MAX_PARTITION_NAME = "pmax"
@@ -7,7 +7,7 @@ from redis.asyncio import ConnectionPool, Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.config import mysql_engine, mysql_session_factory
-from database.constant import POOL_SIZE
+from database.constant import POOL_SIZE, REDIS_HEALTH_CHECK_SECOND, REDIS_SOCKET_TIMEOUT_SECOND
 from database.enum import EnvironmentType
 
 load_dotenv()
@@ -24,6 +24,17 @@ REDIS_PORT = int(getenv("REDIS_PORT", 6379))
 TEST_REDIS_HOST = getenv("TEST_REDIS_HOST", None)
 TEST_REDIS_PORT = int(getenv("TEST_REDIS_PORT", 6379))
 
+# 프로세스 전체가 공유하는 pool 입니다. 요청마다 pool을 만들면 매번 TCP 연결을 새로 맺게 됩니다.
+redis_pool = ConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    max_connections=POOL_SIZE,
+    decode_responses=True,
+    health_check_interval=REDIS_HEALTH_CHECK_SECOND,
+    socket_timeout=REDIS_SOCKET_TIMEOUT_SECOND,
+    socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECOND,
+)
+
 
 async def get_mysql_session_router() -> AsyncGenerator[AsyncSession, None]:
     db = mysql_session_factory()
@@ -53,8 +64,27 @@ async def get_mysql_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 def get_redis_pool() -> Redis:
-    pool = ConnectionPool(host=REDIS_HOST, port=REDIS_PORT, max_connections=POOL_SIZE, decode_responses=True)
-    return Redis(connection_pool=pool)
+    return Redis(connection_pool=redis_pool)
+
+
+def get_redis_pool_status() -> dict[str, int]:
+    return {
+        "max_connections": redis_pool.max_connections,
+        "created_connections": redis_pool._created_connections,
+        "available_connections": len(redis_pool._available_connections),
+        "in_use_connections": len(redis_pool._in_use_connections),
+    }
+
+
+async def check_redis_pool() -> bool:
+    try:
+        return await get_redis_pool().ping()
+    except Exception:
+        return False
+
+
+async def close_redis_pool() -> None:
+    await redis_pool.disconnect()
 
 
 def get_test_redis_pool() -> Redis:
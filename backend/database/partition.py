@@ -0,0 +1,73 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.constant import MAX_PARTITION_NAME
+
+
+def get_partition_name(partition_date: date) -> str:
+    return f"p{partition_date:%Y%m%d}"
+
+
+def get_partition_date(partition_name: str) -> date | None:
+    try:
+        return datetime.strptime(partition_name, "p%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def get_day_partition_clause(partition_date: date) -> str:
+    next_date = partition_date + timedelta(days=1)
+    return f"PARTITION {get_partition_name(partition_date)} VALUES LESS THAN (TO_DAYS('{next_date:%Y-%m-%d}'))"
+
+
+async def get_partition_dates(session: AsyncSession, table_name: str) -> list[date]:
+    result = await session.execute(
+        text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ),
+        {"table_name": table_name},
+    )
+    partition_names: list[str] = result.scalars().all()
+    return [
+        partition_date
+        for partition_date in (get_partition_date(partition_name) for partition_name in partition_names)
+        if partition_date is not None
+    ]
+
+
+async def partition_by_day(
+    session: AsyncSession, table_name: str, column: str, start_date: date, end_date: date
+) -> None:
+    # 파티션 테이블의 모든 unique key에는 파티션 컬럼이 포함되어야 합니다.
+    partition_clauses = [
+        get_day_partition_clause(start_date + timedelta(days=offset))
+        for offset in range((end_date - start_date).days + 1)
+    ]
+    partition_clauses.append(f"PARTITION {MAX_PARTITION_NAME} VALUES LESS THAN MAXVALUE")
+
+    await session.execute(text(f"ALTER TABLE {table_name} DROP PRIMARY KEY, ADD PRIMARY KEY (id, {column})"))
+    await session.execute(
+        text(f"ALTER TABLE {table_name} PARTITION BY RANGE (TO_DAYS({column})) ({', '.join(partition_clauses)})")
+    )
+
+
+async def add_day_partitions(session: AsyncSession, table_name: str, partition_dates: list[date]) -> None:
+    if len(partition_dates) == 0:
+        return
+
+    # 미래 구간은 비어 있는 MAXVALUE 파티션을 쪼개 만들므로 데이터 이동이 없습니다.
+    partition_clauses = [get_day_partition_clause(partition_date) for partition_date in sorted(partition_dates)]
+    partition_clauses.append(f"PARTITION {MAX_PARTITION_NAME} VALUES LESS THAN MAXVALUE")
+    await session.execute(
+        text(
+            f"ALTER TABLE {table_name} REORGANIZE PARTITION {MAX_PARTITION_NAME} INTO ({', '.join(partition_clauses)})"
+        )
+    )
+
+
+async def drop_day_partition(session: AsyncSession, table_name: str, partition_date: date) -> None:
+    await session.execute(text(f"ALTER TABLE {table_name} DROP PARTITION {get_partition_name(partition_date)}"))
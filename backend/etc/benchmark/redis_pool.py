@@ -0,0 +1,86 @@
+"""
+요청마다 ConnectionPool을 새로 만드는 방식과 공유 pool 방식의 연결 비용을 비교합니다.
+로컬에 PING/GET만 응답하는 redis 대역 서버를 띄우므로 실제 redis가 필요하지 않습니다.
+
+python etc/benchmark/redis_pool.py
+"""
+import asyncio
+import time
+
+from redis.asyncio import ConnectionPool, Redis
+
+HOST = "127.0.0.1"
+REQUEST_COUNT = 2000
+CONCURRENCY = 50
+
+
+class RedisStandIn:
+    def __init__(self) -> None:
+        self.accepted_connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.accepted_connections += 1
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                argument_count = int(header[1:])
+                arguments = []
+                for _ in range(argument_count):
+                    await reader.readline()
+                    arguments.append((await reader.readline()).strip().upper())
+
+                if arguments[0] == b"PING":
+                    writer.write(b"+PONG\r\n")
+                elif arguments[0] == b"GET":
+                    writer.write(b"$3\r\n100\r\n")
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def run(label: str, get_client, port: int, stand_in: RedisStandIn) -> None:
+    stand_in.accepted_connections = 0
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def request() -> None:
+        async with semaphore:
+            redis_client: Redis = get_client(port)
+            await redis_client.get("AAPL")
+            await redis_client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[request() for _ in range(REQUEST_COUNT)])
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{label:<12} {elapsed:.3f}s  {REQUEST_COUNT / elapsed:,.0f} req/s  "
+        f"connections={stand_in.accepted_connections}"
+    )
+
+
+async def main() -> None:
+    stand_in = RedisStandIn()
+    server = await asyncio.start_server(stand_in.handle, HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+
+    def per_request_pool(port: int) -> Redis:
+        pool = ConnectionPool(host=HOST, port=port, max_connections=CONCURRENCY, decode_responses=True)
+        return Redis(connection_pool=pool, auto_close_connection_pool=True)
+
+    shared_pool = ConnectionPool(host=HOST, port=port, max_connections=CONCURRENCY, decode_responses=True)
+
+    def shared(port: int) -> Redis:
+        return Redis(connection_pool=shared_pool)
+
+    async with server:
+        await run("per-request", per_request_pool, port, stand_in)
+        await run("shared", shared, port, stand_in)
+        await shared_pool.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
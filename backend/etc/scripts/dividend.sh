@@ -1,4 +1,6 @@
 #!/bin/bash
 sudo docker stop dividend_container
 sudo docker rm dividend_container
-sudo docker run -d --name dividend_container dividend
+sudo docker run -d --name dividend_container \
+  -v /var/cache/stock_universe:/tmp/stock_universe \
+  dividend
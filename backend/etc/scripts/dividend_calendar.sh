@@ -0,0 +1,6 @@
+#!/bin/bash
+sudo docker stop dividend_calendar_container
+sudo docker rm dividend_calendar_container
+sudo docker run -d --name dividend_calendar_container \
+  -v /var/cache/stock_universe:/tmp/stock_universe \
+  dividend_calendar
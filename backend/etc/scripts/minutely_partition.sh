@@ -0,0 +1,4 @@
+#!/bin/bash
+sudo docker stop minutely_partition_container
+sudo docker rm minutely_partition_container
+sudo docker run -d --name minutely_partition_container minutely_partition
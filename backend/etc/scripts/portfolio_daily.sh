@@ -0,0 +1,4 @@
+#!/bin/bash
+sudo docker stop portfolio_daily_container
+sudo docker rm portfolio_daily_container
+sudo docker run -d --name portfolio_daily_container portfolio_daily
@@ -3,4 +3,5 @@ sudo docker stop realtime_stock_container
 sudo docker rm realtime_stock_container
 sudo docker run -d --name realtime_stock_container \
   -e PYTHONPATH=/app \
+  -v /var/cache/stock_universe:/tmp/stock_universe \
   realtime_stock
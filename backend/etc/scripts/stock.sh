@@ -1,4 +1,6 @@
 #!/bin/bash
 sudo docker stop stock_container
 sudo docker rm stock_container
-sudo docker run -d --name stock_container stock
+sudo docker run -d --name stock_container \
+  -v /var/cache/stock_universe:/tmp/stock_universe \
+  stock
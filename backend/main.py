@@ -1,3 +1,5 @@
+import logging
+from contextlib import asynccontextmanager
 from os import getenv
 
 from dotenv import load_dotenv
@@ -9,8 +11,19 @@ from app.api.auth.v1.router import auth_router
 from app.api.chart.v1.router import chart_router
 from app.module.asset.model import Asset  # noqa: F401 > table 생성 시 필요합니다.
 from app.module.auth.model import User  # noqa: F401 > table 생성 시 필요합니다.
+from database.dependency import check_redis_pool, close_redis_pool, get_redis_pool_status
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not await check_redis_pool():
+        logging.warning("[lifespan] redis 연결에 실패하였습니다.")
+    yield
+    logging.info(f"[lifespan] redis pool을 종료합니다. {get_redis_pool_status()}")
+    await close_redis_pool()
+
+
+app = FastAPI(lifespan=lifespan)
 
 load_dotenv()
 
@@ -21,3 +34,8 @@ app.add_middleware(SessionMiddleware, secret_key=SESSION_KEY)
 app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
 app.include_router(chart_router, prefix="/api/chart", tags=["chart"])
 app.include_router(asset_stock_router, prefix="/api", tags=["asset"])
+
+
+@app.get("/health", summary="서버와 redis pool 상태를 반환합니다.")
+async def health() -> dict:
+    return {"redis": await check_redis_pool(), "redis_pool": get_redis_pool_status()}
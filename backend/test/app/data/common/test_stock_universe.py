@@ -0,0 +1,74 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app.data.common.stock_universe import LocalStockFileStorage, StockUniverseCache
+
+
+def write_stock_file(path, rows: list[list[str]]) -> None:
+    pd.DataFrame(rows, columns=["Symbol", "Company Name", "Country", "Code"]).to_excel(path, index=False)
+
+
+@pytest.fixture
+def stock_file_storage(tmp_path) -> LocalStockFileStorage:
+    bucket_dir = tmp_path / "bucket"
+    bucket_dir.mkdir()
+    write_stock_file(bucket_dir / "usa.xlsx", [["AAPL", "Apple", "USA", "NASDAQ"], ["TSLA", "Tesla", "USA", "NASDAQ"]])
+    write_stock_file(bucket_dir / "korea.xlsx", [["005930", "삼성전자", "Korea", "KOSPI"]])
+    return LocalStockFileStorage(str(bucket_dir))
+
+
+class TestStockUniverseCache:
+    def test_get_stock_code_list_bundle(self, tmp_path, stock_file_storage: LocalStockFileStorage):
+        # Given
+        cache = StockUniverseCache(stock_file_storage, str(tmp_path / "cache"))
+
+        # When
+        bundle = cache.get_stock_code_list_bundle(["usa.xlsx", "korea.xlsx"])
+
+        # Then
+        assert [[stock.code for stock in stock_list] for stock_list in bundle] == [["AAPL", "TSLA"], ["005930"]]
+        assert bundle[1][0].name == "삼성전자"
+        assert bundle[1][0].market_index == "KOSPI"
+
+    def test_get_stock_code_list_selected_key(self, tmp_path, stock_file_storage: LocalStockFileStorage):
+        # Given
+        cache = StockUniverseCache(stock_file_storage, str(tmp_path / "cache"))
+
+        # When
+        stock_list = cache.get_stock_code_list(["usa.xlsx", "korea.xlsx"], "korea.xlsx")
+
+        # Then
+        assert [stock.code for stock in stock_list] == ["005930"]
+
+    def test_get_stock_code_list_reuse_snapshot(self, tmp_path, mocker, stock_file_storage: LocalStockFileStorage):
+        # Given
+        cache = StockUniverseCache(stock_file_storage, str(tmp_path / "cache"))
+        keys = ["usa.xlsx", "korea.xlsx"]
+        cache.get_stock_code_list(keys)
+        read_excel = mocker.spy(pd, "read_excel")
+
+        # When
+        stock_list = cache.get_stock_code_list(keys)
+
+        # Then
+        assert read_excel.call_count == 0
+        assert [stock.code for stock in stock_list] == ["AAPL", "TSLA", "005930"]
+
+    def test_get_stock_code_list_rebuild_on_change(self, tmp_path, stock_file_storage: LocalStockFileStorage):
+        # Given
+        cache_dir = tmp_path / "cache"
+        cache = StockUniverseCache(stock_file_storage, str(cache_dir))
+        keys = ["usa.xlsx", "korea.xlsx"]
+        old_snapshot_path = cache.get_snapshot_path(keys)
+        cache.get_stock_code_list(keys)
+
+        # When
+        write_stock_file(tmp_path / "bucket" / "korea.xlsx", [["000660", "SK하이닉스", "Korea", "KOSPI"]])
+        stock_list = cache.get_stock_code_list(keys)
+
+        # Then
+        assert [stock.code for stock in stock_list] == ["AAPL", "TSLA", "000660"]
+        assert cache.get_snapshot_path(keys) != old_snapshot_path
+        assert os.listdir(cache_dir) == [os.path.basename(cache.get_snapshot_path(keys))]
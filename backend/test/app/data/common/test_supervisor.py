@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+from redis.asyncio import Redis
+
+from app.data.common.constant import COLLECTOR_HEALTH_KEY_PREFIX
+from app.data.common.supervisor import CollectorSupervisor
+from app.module.asset.redis_repository import RedisCollectorHealthRepository
+
+
+class TestCollectorSupervisor:
+    async def test_check_restart_failed_shard(self, redis_client: Redis):
+        # Given
+        run_count = {"value": 0}
+
+        async def run_shard(stock_code_map, heartbeat):
+            run_count["value"] += 1
+            if run_count["value"] == 1:
+                raise RuntimeError("shard failed")
+            heartbeat()
+            await asyncio.Event().wait()
+
+        supervisor = CollectorSupervisor(
+            "test", lambda: {"AAPL": "AAPL"}, run_shard, redis_client, shard_size=10, restart_backoff_second=0
+        )
+        await supervisor.reload_universe()
+        await asyncio.sleep(0)
+
+        # When
+        await supervisor.check()
+        await supervisor.check()
+        await asyncio.sleep(0)
+
+        # Then
+        shard = supervisor.shards[0]
+        assert run_count["value"] == 2
+        assert shard.restart_count == 1
+        assert shard.failure_count == 0
+        assert "shard failed" in shard.last_error
+
+        health = json.loads(
+            await RedisCollectorHealthRepository.get(redis_client, f"{COLLECTOR_HEALTH_KEY_PREFIX}:test")
+        )
+        assert health["shards"][0]["alive"] is True
+        await supervisor.stop()
+
+    async def test_check_reshard_on_universe_change(self, redis_client: Redis):
+        # Given
+        universe = {"AAPL": "AAPL", "TSLA": "TSLA"}
+
+        async def run_shard(stock_code_map, heartbeat):
+            await asyncio.Event().wait()
+
+        supervisor = CollectorSupervisor(
+            "test", lambda: dict(universe), run_shard, redis_client, shard_size=1, reshard_second=0
+        )
+        await supervisor.reload_universe()
+        universe["005930.KS"] = "005930"
+
+        # When
+        await supervisor.check()
+
+        # Then
+        assert [shard.stock_code_map for shard in supervisor.shards] == [
+            {"005930.KS": "005930"},
+            {"AAPL": "AAPL"},
+            {"TSLA": "TSLA"},
+        ]
+        assert all(not shard.task.done() for shard in supervisor.shards)
+        await supervisor.stop()
+
+    async def test_check_keep_shards_on_load_failure(self, redis_client: Redis):
+        # Given
+        load_count = {"value": 0}
+
+        def load_universe():
+            load_count["value"] += 1
+            if load_count["value"] == 2:
+                raise OSError("stock file unavailable")
+            return {"AAPL": "AAPL"}
+
+        async def run_shard(stock_code_map, heartbeat):
+            await asyncio.Event().wait()
+
+        supervisor = CollectorSupervisor("test", load_universe, run_shard, redis_client, shard_size=1, reshard_second=0)
+        await supervisor.reload_universe()
+        shard_tasks = [shard.task for shard in supervisor.shards]
+
+        # When
+        await supervisor.check()
+
+        # Then
+        assert load_count["value"] == 2
+        assert supervisor.universe == {"AAPL": "AAPL"}
+        assert [shard.task for shard in supervisor.shards] == shard_tasks
+        assert all(not task.done() for task in shard_tasks)
+
+        # When
+        await supervisor.check()
+
+        # Then
+        assert load_count["value"] == 3
+        await supervisor.stop()
@@ -0,0 +1,48 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from app.data.naver.sources.parser import LxmlNaverHtmlParser, NaverHtmlParser, SoupNaverHtmlParser
+
+NAVER_FIXTURE_DIR = Path(__file__).parents[4] / "fixtures" / "data" / "naver"
+GOLDEN = json.loads((NAVER_FIXTURE_DIR / "golden.json").read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("parser", [SoupNaverHtmlParser(), LxmlNaverHtmlParser()], ids=["soup", "lxml"])
+class TestNaverHtmlParser:
+    @pytest.mark.parametrize("file_name", GOLDEN["stock_price"])
+    def test_parse_stock_price(self, parser: NaverHtmlParser, file_name: str):
+        # Given
+        html = (NAVER_FIXTURE_DIR / file_name).read_text(encoding="utf-8")
+
+        # When
+        stock_price = parser.parse_stock_price(html)
+
+        # Then
+        assert stock_price == GOLDEN["stock_price"][file_name]
+
+    @pytest.mark.parametrize("file_name", GOLDEN["market_indexes"])
+    def test_parse_market_indexes(self, parser: NaverHtmlParser, file_name: str):
+        # Given
+        html = (NAVER_FIXTURE_DIR / file_name).read_text(encoding="utf-8")
+
+        # When
+        market_indexes = parser.parse_market_indexes(html)
+
+        # Then
+        assert {
+            market_index: asdict(market_index_value) for market_index, market_index_value in market_indexes.items()
+        } == GOLDEN["market_indexes"][file_name]
+
+    @pytest.mark.parametrize("file_name", GOLDEN["world_index_rows"])
+    def test_parse_world_index_rows(self, parser: NaverHtmlParser, file_name: str):
+        # Given
+        html = (NAVER_FIXTURE_DIR / file_name).read_text(encoding="utf-8")
+
+        # When
+        world_index_rows = parser.parse_world_index_rows(html)
+
+        # Then
+        assert world_index_rows == GOLDEN["world_index_rows"][file_name]
@@ -0,0 +1,7 @@
+from test.fixtures.asset.test_asset_fixture import (  # noqa: F401 test fixture 사용
+    setup_asset,
+    setup_exchange_rate,
+    setup_stock,
+    setup_stock_daily,
+    setup_user,
+)
@@ -0,0 +1,131 @@
+from datetime import date
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.common.constant import PORTFOLIO_DAILY_CHECKPOINT_EXPIRE_SECOND, PORTFOLIO_DAILY_CHECKPOINT_KEY_PREFIX
+from app.data.portfolio import portfolio_daily
+from app.data.portfolio.portfolio_daily import insert_portfolio_daily
+from app.module.auth.constant import DUMMY_USER_ID
+from app.module.auth.enum import ProviderEnum, UserRoleEnum
+from app.module.auth.model import User
+from app.module.chart.model import UserPortfolioDaily
+from app.module.chart.redis_repository import RedisPortfolioDailyCheckpointRepository
+
+TARGET_DATE = date(2024, 8, 14)
+SECOND_USER_ID = DUMMY_USER_ID + 1
+
+
+@pytest.fixture
+async def setup_second_user(session: AsyncSession, setup_user):
+    user = User(
+        id=SECOND_USER_ID,
+        social_id="test_social_id_2",
+        provider=ProviderEnum.GOOGLE,
+        role=UserRoleEnum.USER,
+        nickname="second_user",
+    )
+    session.add(user)
+    await session.commit()
+
+
+class TestInsertPortfolioDaily:
+    async def test_insert_portfolio_daily(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_second_user,
+    ):
+        # When
+        await insert_portfolio_daily(session, redis_client, TARGET_DATE, chunk_size=1)
+
+        # Then
+        portfolio_dailies = (await session.execute(select(UserPortfolioDaily))).scalars().all()
+        portfolio_daily_map = {portfolio_daily.user_id: portfolio_daily for portfolio_daily in portfolio_dailies}
+        assert set(portfolio_daily_map) == {DUMMY_USER_ID, SECOND_USER_ID}
+        assert all(portfolio_daily.date == TARGET_DATE for portfolio_daily in portfolio_dailies)
+        assert portfolio_daily_map[DUMMY_USER_ID].total_asset_amount > 0
+        assert portfolio_daily_map[SECOND_USER_ID].total_asset_amount == 0
+
+    async def test_insert_portfolio_daily_skip_checkpointed_users(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        mocker,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_second_user,
+    ):
+        # Given
+        await insert_portfolio_daily(session, redis_client, TARGET_DATE, chunk_size=1)
+        process_user_chunk = mocker.spy(portfolio_daily, "process_user_chunk")
+
+        # When
+        await insert_portfolio_daily(session, redis_client, TARGET_DATE, chunk_size=1)
+
+        # Then
+        process_user_chunk.assert_not_called()
+        assert len((await session.execute(select(UserPortfolioDaily))).scalars().all()) == 2
+
+    async def test_insert_portfolio_daily_resume(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        mocker,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_second_user,
+    ):
+        # Given
+        await RedisPortfolioDailyCheckpointRepository.save(
+            redis_client,
+            f"{PORTFOLIO_DAILY_CHECKPOINT_KEY_PREFIX}:{TARGET_DATE}",
+            DUMMY_USER_ID,
+            PORTFOLIO_DAILY_CHECKPOINT_EXPIRE_SECOND,
+        )
+        process_user_chunk = mocker.spy(portfolio_daily, "process_user_chunk")
+
+        # When
+        await insert_portfolio_daily(session, redis_client, TARGET_DATE, chunk_size=10)
+
+        # Then
+        assert process_user_chunk.call_count == 1
+        assert process_user_chunk.call_args.args[1] == [SECOND_USER_ID]
+
+    async def test_insert_portfolio_daily_overwrite_saved_row(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_second_user,
+    ):
+        # Given
+        session.add(
+            UserPortfolioDaily(
+                user_id=DUMMY_USER_ID,
+                date=TARGET_DATE,
+                total_asset_amount=1.0,
+                total_invest_amount=1.0,
+                profit_rate=0.0,
+            )
+        )
+        await session.commit()
+
+        # When
+        await insert_portfolio_daily(session, redis_client, TARGET_DATE, chunk_size=10)
+
+        # Then
+        session.expire_all()
+        portfolio_dailies = (await session.execute(select(UserPortfolioDaily))).scalars().all()
+        portfolio_daily_map = {portfolio_daily.user_id: portfolio_daily for portfolio_daily in portfolio_dailies}
+        assert set(portfolio_daily_map) == {DUMMY_USER_ID, SECOND_USER_ID}
+        assert portfolio_daily_map[DUMMY_USER_ID].total_asset_amount > 1.0
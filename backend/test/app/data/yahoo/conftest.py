@@ -0,0 +1 @@
+from test.fixtures.asset.test_asset_fixture import setup_stock  # noqa: F401 test fixture 사용
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.yahoo.realtime_stock import realtime_stock_collect
+from app.data.yahoo.realtime_stock.realtime_stock_collect import collect_stock_data, run_stock_shard
+
+STOCK_CODE_MAP = {"AAPL": "AAPL", "005930.KS": "005930"}
+
+
+class TestCollectStockData:
+    async def test_collect_stock_data(self, session: AsyncSession, redis_client: Redis, mocker, setup_stock):
+        # Given
+        collector = mocker.AsyncMock()
+        collector.fetch_prices.return_value = {"AAPL": 220.5, "005930.KS": 72000.0}
+
+        # When
+        saved_count = await collect_stock_data(redis_client, session, collector, STOCK_CODE_MAP)
+
+        # Then
+        assert saved_count == 2
+        assert await redis_client.mget(["AAPL", "005930"]) == ["220.5", "72000.0"]
+        await redis_client.flushall()
+
+    async def test_collect_stock_data_all_failed(self, session: AsyncSession, redis_client: Redis, mocker):
+        # Given
+        collector = mocker.AsyncMock()
+        collector.fetch_prices.return_value = {}
+
+        # When
+        saved_count = await collect_stock_data(redis_client, session, collector, STOCK_CODE_MAP)
+
+        # Then
+        assert saved_count == 0
+
+
+class TestRunStockShard:
+    @pytest.mark.parametrize("saved_count, heartbeat_count", [(0, 0), (2, 1)], ids=["all_failed", "saved"])
+    async def test_run_stock_shard_heartbeat(self, mocker, saved_count: int, heartbeat_count: int):
+        # Given
+        mocker.patch.object(realtime_stock_collect, "get_redis_pool")
+        mocker.patch.object(realtime_stock_collect, "mysql_session_factory")
+        mocker.patch.object(realtime_stock_collect, "collect_stock_data", return_value=saved_count)
+        # 한 주기만 실행하도록 대기 시점에 작업을 멈춥니다.
+        mocker.patch.object(realtime_stock_collect.asyncio, "sleep", side_effect=asyncio.CancelledError)
+        heartbeat = mocker.Mock()
+
+        # When
+        with pytest.raises(asyncio.CancelledError):
+            await run_stock_shard(mocker.Mock(), STOCK_CODE_MAP, heartbeat)
+
+        # Then
+        assert heartbeat.call_count == heartbeat_count
@@ -0,0 +1,4 @@
+from test.fixtures.data.test_quote_fixture import (  # noqa: F401 test fixture 사용
+    stub_crumb_quote_server,
+    stub_quote_server,
+)
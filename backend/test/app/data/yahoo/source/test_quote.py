@@ -0,0 +1,48 @@
+from app.data.yahoo.source.quote import QuoteCollector, YahooQuoteSource
+
+
+class TestQuoteCollector:
+    async def test_fetch_prices(self, stub_quote_server):
+        # Given
+        quote_url, requested_symbols = stub_quote_server
+        symbols = ["AAPL", "TSLA", "005930.KS", "UNKNOWN"]
+
+        # When
+        async with QuoteCollector(
+            YahooQuoteSource(quote_url=quote_url, crumb_url=None), batch_size=2, concurrency=1, backoff_second=0
+        ) as collector:
+            prices = await collector.fetch_prices(symbols)
+
+        # Then
+        assert prices == {"AAPL": 220.5, "TSLA": 250.0, "005930.KS": 72000.0}
+        assert sorted(requested_symbols) == [["005930.KS", "UNKNOWN"], ["AAPL", "TSLA"]]
+
+    async def test_fetch_prices_retry_exhausted(self, stub_quote_server):
+        # Given
+        quote_url, requested_symbols = stub_quote_server
+
+        # When
+        async with QuoteCollector(
+            YahooQuoteSource(quote_url=quote_url, crumb_url=None), retry_count=1, backoff_second=0
+        ) as collector:
+            prices = await collector.fetch_prices(["AAPL"])
+
+        # Then
+        assert prices == {}
+        assert requested_symbols == []
+
+    async def test_fetch_prices_refresh_crumb_on_401(self, stub_crumb_quote_server):
+        # Given
+        quote_url, crumb_url, cookie_url, crumb_request_count = stub_crumb_quote_server
+        source = YahooQuoteSource(quote_url=quote_url, crumb_url=crumb_url, cookie_url=cookie_url)
+
+        # When
+        async with QuoteCollector(
+            source, batch_size=1, concurrency=3, request_per_second=1000, backoff_second=0
+        ) as collector:
+            prices = await collector.fetch_prices(["AAPL", "TSLA", "005930.KS"])
+
+        # Then
+        assert prices == {"AAPL": 220.5, "TSLA": 250.0, "005930.KS": 72000.0}
+        assert crumb_request_count["count"] == 2
+        assert source.crumb == "crumb-2"
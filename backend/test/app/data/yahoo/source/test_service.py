@@ -0,0 +1,281 @@
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.data.yahoo.source.service import (
+    get_cross_exchange_rates,
+    get_dividend_fetch_start_date,
+    get_exchange_rate_symbol,
+    get_fetch_start_date,
+    get_new_dividend_records,
+    get_stock_records,
+    get_valid_ohlcv,
+    resample_daily_history,
+)
+from app.module.asset.enum import CurrencyType, TimeInterval
+
+
+def get_daily_history(start: str, end: str) -> pd.DataFrame:
+    index = pd.bdate_range(start, end)
+    return pd.DataFrame(
+        {
+            "Open": [100.0 + i for i in range(len(index))],
+            "High": [110.0 + i for i in range(len(index))],
+            "Low": [90.0 + i for i in range(len(index))],
+            "Close": [105.0 + i for i in range(len(index))],
+            "Volume": [1000] * len(index),
+        },
+        index=index,
+    )
+
+
+class TestGetCrossExchangeRates:
+    def test_get_cross_exchange_rates(self):
+        # Given
+        usd_rates = {CurrencyType.KOREA: 1300.0, CurrencyType.JAPAN: 150.0}
+        currency_pairs = [
+            (CurrencyType.USA, CurrencyType.KOREA),
+            (CurrencyType.JAPAN, CurrencyType.KOREA),
+            (CurrencyType.KOREA, CurrencyType.USA),
+            (CurrencyType.JAPAN, CurrencyType.USA),
+        ]
+
+        # When
+        exchange_rates = get_cross_exchange_rates(usd_rates, currency_pairs)
+
+        # Then
+        assert exchange_rates == {
+            "USD_KRW": 1300.0,
+            "JPY_KRW": pytest.approx(1300.0 / 150.0),
+            "KRW_USD": pytest.approx(1 / 1300.0),
+            "JPY_USD": pytest.approx(1 / 150.0),
+        }
+
+    def test_get_cross_exchange_rates_missing_leg(self):
+        # Given
+        usd_rates = {CurrencyType.KOREA: 1300.0}
+        currency_pairs = [(CurrencyType.EUROPE, CurrencyType.KOREA), (CurrencyType.USA, CurrencyType.KOREA)]
+
+        # When
+        exchange_rates = get_cross_exchange_rates(usd_rates, currency_pairs)
+
+        # Then
+        assert exchange_rates == {"USD_KRW": 1300.0}
+
+    def test_get_exchange_rate_symbol(self):
+        assert get_exchange_rate_symbol(CurrencyType.KOREA) == "USDKRW=X"
+
+
+class TestGetNewDividendRecords:
+    def test_get_new_dividend_records(self):
+        # Given
+        dividends = pd.Series(
+            [0.24, 0.25, 0.0, 0.25],
+            index=pd.DatetimeIndex(["2024-05-10", "2024-08-12", "2024-09-02", "2024-11-08"]).tz_localize(
+                "America/New_York"
+            ),
+        )
+
+        # When
+        records = get_new_dividend_records(dividends, "AAPL", date(2024, 5, 10))
+
+        # Then
+        assert records == [
+            {"dividend": 0.25, "stock_code": "AAPL", "date": date(2024, 8, 12)},
+            {"dividend": 0.25, "stock_code": "AAPL", "date": date(2024, 11, 8)},
+        ]
+
+    def test_get_new_dividend_records_without_last_date(self):
+        # Given
+        dividends = pd.Series([361.0], index=pd.DatetimeIndex(["2024-03-28"]).tz_localize("Asia/Seoul"))
+
+        # When
+        records = get_new_dividend_records(dividends, "005930", None)
+
+        # Then
+        assert records == [{"dividend": 361.0, "stock_code": "005930", "date": date(2024, 3, 28)}]
+
+    def test_get_new_dividend_records_empty(self):
+        assert get_new_dividend_records(pd.Series(dtype="float64"), "AAPL", date(2024, 5, 10)) == []
+
+
+class TestGetFetchStartDate:
+    def test_get_fetch_start_date(self):
+        # Given
+        last_dates = [date(2024, 7, 10), date(2024, 7, 8), date(2024, 7, 1)]
+
+        # When
+        start_date = get_fetch_start_date(last_dates, date(2024, 7, 5))
+
+        # Then
+        assert start_date == date(2024, 7, 1)
+
+    def test_get_fetch_start_date_with_missing_watermark(self):
+        # Given
+        last_dates = [date(2024, 7, 10), None, date(2024, 7, 1)]
+
+        # When
+        start_date = get_fetch_start_date(last_dates, date(2024, 7, 5))
+
+        # Then
+        assert start_date == date(2024, 7, 5)
+
+
+class TestGetDividendFetchStartDate:
+    def test_get_dividend_fetch_start_date_from_checked_at(self):
+        assert get_dividend_fetch_start_date(datetime(2024, 8, 20, 8, 0), date(2024, 5, 10)) == date(2024, 8, 20)
+
+    def test_get_dividend_fetch_start_date_from_last_date(self):
+        assert get_dividend_fetch_start_date(None, date(2024, 5, 10)) == date(2024, 5, 11)
+
+    def test_get_dividend_fetch_start_date_full_history(self):
+        assert get_dividend_fetch_start_date(None, None) is None
+
+
+class TestResampleDailyHistory:
+    def test_resample_daily_history_week(self):
+        # Given
+        df = get_daily_history("2024-07-01", "2024-07-12")
+
+        # When
+        weekly_df = resample_daily_history(df, TimeInterval.WEEK, int(datetime(2024, 7, 1).timestamp()))
+
+        # Then
+        assert weekly_df.index.date.tolist() == [date(2024, 7, 1), date(2024, 7, 8)]
+        assert weekly_df.loc["2024-07-01"].to_dict() == {
+            "Open": 100.0,
+            "High": 114.0,
+            "Low": 90.0,
+            "Close": 109.0,
+            "Volume": 5000,
+        }
+
+    def test_resample_daily_history_month(self):
+        # Given
+        df = get_daily_history("2024-07-01", "2024-08-09")
+
+        # When
+        monthly_df = resample_daily_history(df, TimeInterval.MONTH, int(datetime(2024, 7, 1).timestamp()))
+
+        # Then
+        assert monthly_df.index.date.tolist() == [date(2024, 7, 1), date(2024, 8, 1)]
+        assert monthly_df.loc["2024-08-01", "Open"] == df.loc["2024-08-01", "Open"]
+        assert monthly_df.loc["2024-08-01", "Close"] == df.loc["2024-08-09", "Close"]
+        assert monthly_df.loc["2024-07-01", "Volume"] == 23 * 1000
+
+    def test_resample_daily_history_drop_partial_leading_bucket(self):
+        # Given
+        df = get_daily_history("2024-07-01", "2024-07-12")
+
+        # When
+        weekly_df = resample_daily_history(df, TimeInterval.WEEK, int(datetime(2024, 7, 3).timestamp()))
+        monthly_df = resample_daily_history(df, TimeInterval.MONTH, int(datetime(2024, 7, 3).timestamp()))
+
+        # Then
+        assert weekly_df.index.date.tolist() == [date(2024, 7, 8)]
+        assert monthly_df.empty
+
+    def test_resample_daily_history_day(self):
+        # Given
+        df = get_daily_history("2024-07-01", "2024-07-12")
+
+        # When
+        daily_df = resample_daily_history(df, TimeInterval.DAY, int(datetime(2024, 7, 3).timestamp()))
+
+        # Then
+        assert daily_df is df
+
+    @pytest.mark.parametrize("interval", [TimeInterval.WEEK, TimeInterval.MONTH])
+    def test_resample_daily_history_empty(self, interval: TimeInterval):
+        # Given
+        df = pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"], index=pd.DatetimeIndex([]))
+
+        # When
+        resampled_df = resample_daily_history(df, interval, int(datetime(2024, 7, 1).timestamp()))
+
+        # Then
+        assert resampled_df.empty
+
+
+class TestGetValidOhlcv:
+    def test_get_valid_ohlcv_filter_invalid_price(self):
+        # Given
+        df = pd.DataFrame(
+            {
+                "Open": [100.0, np.nan, 102.0, 103.0],
+                "High": [110.0, 111.0, np.inf, 113.0],
+                "Low": [90.0, 91.0, 92.0, -np.inf],
+                "Close": [105.0, 106.0, 107.0, 108.0],
+                "Volume": [1000, 1000, 1000, 1000],
+            },
+            index=pd.bdate_range("2024-07-01", periods=4),
+        )
+
+        # When
+        ohlcv_df = get_valid_ohlcv(df)
+
+        # Then
+        assert ohlcv_df.index.date.tolist() == [date(2024, 7, 1)]
+
+    def test_get_valid_ohlcv_coerce_volume(self):
+        # Given
+        df = pd.DataFrame(
+            {
+                "Open": ["100", 101.0, 102.0],
+                "High": [110.0, 111.0, 112.0],
+                "Low": [90.0, 91.0, 92.0],
+                "Close": [105.0, 106.0, 107.0],
+                "Volume": [1000.0, np.nan, "invalid"],
+            },
+            index=pd.bdate_range("2024-07-01", periods=3),
+        )
+
+        # When
+        ohlcv_df = get_valid_ohlcv(df)
+
+        # Then
+        assert ohlcv_df["Open"].dtype == np.float64
+        assert ohlcv_df["Volume"].dtype == np.int64
+        assert ohlcv_df["Volume"].tolist() == [1000, 0, 0]
+
+    def test_get_valid_ohlcv_empty(self):
+        # Given
+        df = pd.DataFrame()
+
+        # When
+        ohlcv_df = get_valid_ohlcv(df)
+
+        # Then
+        assert ohlcv_df.empty
+        assert list(ohlcv_df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+
+class TestGetStockRecords:
+    def test_get_stock_records(self):
+        # Given
+        df = get_daily_history("2024-07-01", "2024-07-02")
+        df.loc["2024-07-02", "Close"] = np.nan
+
+        # When
+        stock_records = get_stock_records(df, "AAPL")
+
+        # Then
+        assert stock_records == [
+            {
+                "code": "AAPL",
+                "date": date(2024, 7, 1),
+                "opening_price": 100.0,
+                "highest_price": 110.0,
+                "lowest_price": 90.0,
+                "close_price": 105.0,
+                "adj_close_price": 105.0,
+                "trade_volume": 1000,
+            }
+        ]
+        assert type(stock_records[0]["trade_volume"]) is int
+        assert type(stock_records[0]["opening_price"]) is float
+
+    def test_get_stock_records_empty(self):
+        assert get_stock_records(pd.DataFrame(), "AAPL") == []
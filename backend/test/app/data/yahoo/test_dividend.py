@@ -0,0 +1,61 @@
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.yahoo.dividend import insert_dividend_data
+from app.module.asset.model import Dividend, DividendIngestionWatermark
+from app.module.asset.repository.dividend_ingestion_watermark_repository import DividendIngestionWatermarkRepository
+from app.module.asset.schema import StockInfo
+
+STOCK_LIST = [
+    StockInfo(code="AAPL", name="Apple Inc.", country="USA", market_index="NASDAQ"),
+    StockInfo(code="TSLA", name="Tesla Inc.", country="USA", market_index="NASDAQ"),
+]
+
+
+class TestInsertDividendData:
+    async def test_insert_dividend_data(self, session: AsyncSession, mocker, setup_stock):
+        # Given
+        ticker = mocker.patch("app.data.yahoo.dividend.yfinance.Ticker")
+        ticker.side_effect = lambda code: mocker.Mock(
+            dividends=pd.Series([0.24, 0.25], index=pd.DatetimeIndex(["2024-05-10", "2024-08-12"]))
+            if code == "AAPL"
+            else pd.Series(dtype="float64")
+        )
+
+        # When
+        await insert_dividend_data(session, STOCK_LIST, 10)
+        await insert_dividend_data(session, STOCK_LIST, 10)
+
+        # Then
+        dividends = (await session.execute(select(Dividend))).scalars().all()
+        watermarks = (await session.execute(select(DividendIngestionWatermark))).scalars().all()
+        assert sorted((dividend.stock_code, dividend.date) for dividend in dividends) == [
+            ("AAPL", date(2024, 5, 10)),
+            ("AAPL", date(2024, 8, 12)),
+        ]
+        assert {watermark.code for watermark in watermarks} == {"AAPL", "TSLA"}
+        assert ticker.call_count == 2
+
+    async def test_insert_dividend_data_from_checked_at(self, session: AsyncSession, mocker, setup_stock):
+        # Given
+        checked_at = datetime.now() - timedelta(days=1)
+        await DividendIngestionWatermarkRepository.bulk_upsert_records(
+            session, [{"code": "AAPL", "checked_at": checked_at}, {"code": "TSLA", "checked_at": datetime.now()}]
+        )
+        ticker = mocker.patch("app.data.yahoo.dividend.yfinance.Ticker")
+        ticker.return_value.history.return_value = pd.DataFrame(
+            {"Dividends": [0.0]}, index=pd.DatetimeIndex([checked_at.date()])
+        )
+
+        # When
+        await insert_dividend_data(session, STOCK_LIST, 10)
+
+        # Then
+        ticker.assert_called_once_with("AAPL")
+        assert ticker.return_value.history.call_args.kwargs["start"] == checked_at.date()
+        assert (await DividendIngestionWatermarkRepository.get_checked_at_map(session))[
+            "AAPL"
+        ].date() == datetime.now().date()
@@ -0,0 +1,78 @@
+from datetime import date, datetime
+
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.yahoo.stock import process_stock_data
+from app.module.asset.enum import TimeInterval
+from app.module.asset.model import StockDaily, StockIngestionWatermark, StockMonthly
+from app.module.asset.repository.stock_weekly_repository import StockWeeklyRepository
+from app.module.asset.schema import StockInfo
+
+START_PERIOD = int(datetime(2024, 7, 1).timestamp())
+
+
+def get_daily_history() -> pd.DataFrame:
+    index = pd.bdate_range("2024-07-01", "2024-08-30")
+    return pd.DataFrame(
+        {
+            "Open": [100.0] * len(index),
+            "High": [110.0] * len(index),
+            "Low": [90.0] * len(index),
+            "Close": [105.0] * len(index),
+            "Volume": [1000] * len(index),
+        },
+        index=index,
+    )
+
+
+class TestProcessStockData:
+    async def test_process_stock_data(self, session: AsyncSession, mocker):
+        # Given
+        ticker = mocker.patch("app.data.yahoo.stock.yfinance.Ticker")
+        ticker.return_value.history.return_value = get_daily_history()
+        stock_list = [StockInfo(code="AAPL", name="Apple Inc.", country="USA", market_index="NASDAQ")]
+
+        # When
+        await process_stock_data(session, stock_list, START_PERIOD)
+
+        # Then
+        stock_dailies = (await session.execute(select(StockDaily))).scalars().all()
+        stock_monthlies = (await session.execute(select(StockMonthly))).scalars().all()
+        watermarks = (await session.execute(select(StockIngestionWatermark))).scalars().all()
+        assert len(stock_dailies) == len(get_daily_history())
+        assert sorted(stock_monthly.date for stock_monthly in stock_monthlies) == [date(2024, 7, 1), date(2024, 8, 1)]
+        assert {watermark.interval for watermark in watermarks} == {interval.value for interval in TimeInterval}
+        assert {watermark.interval: watermark.last_date for watermark in watermarks}[TimeInterval.DAY.value] == date(
+            2024, 8, 30
+        )
+
+    async def test_process_stock_data_skip_checked_stock(self, session: AsyncSession, mocker):
+        # Given
+        ticker = mocker.patch("app.data.yahoo.stock.yfinance.Ticker")
+        ticker.return_value.history.return_value = get_daily_history()
+        stock_list = [StockInfo(code="AAPL", name="Apple Inc.", country="USA", market_index="NASDAQ")]
+        await process_stock_data(session, stock_list, START_PERIOD)
+
+        # When
+        await process_stock_data(session, stock_list, START_PERIOD)
+
+        # Then
+        assert ticker.call_count == 1
+
+    async def test_process_stock_data_keep_watermark_on_partial_save(self, session: AsyncSession, mocker):
+        # Given
+        ticker = mocker.patch("app.data.yahoo.stock.yfinance.Ticker")
+        ticker.return_value.history.return_value = get_daily_history()
+        mocker.patch.object(StockWeeklyRepository, "bulk_upsert_records", mocker.AsyncMock(return_value=0))
+        stock_list = [StockInfo(code="AAPL", name="Apple Inc.", country="USA", market_index="NASDAQ")]
+
+        # When
+        await process_stock_data(session, stock_list, START_PERIOD)
+        await process_stock_data(session, stock_list, START_PERIOD)
+
+        # Then
+        watermarks = (await session.execute(select(StockIngestionWatermark))).scalars().all()
+        assert {watermark.interval for watermark in watermarks} == {TimeInterval.DAY.value, TimeInterval.MONTH.value}
+        assert ticker.call_count == 2
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.yahoo.stock_all import process_stock_data
+from app.module.asset.model import StockDaily
+from app.module.asset.repository.stock_daily_repository import StockDailyRepository
+from app.module.asset.schema import StockInfo
+
+START_PERIOD = int(datetime(2024, 7, 1).timestamp())
+END_PERIOD = int(datetime(2024, 7, 6).timestamp())
+STOCK_LIST = [
+    StockInfo(code="AAPL", name="Apple Inc.", country="USA", market_index="NASDAQ"),
+    StockInfo(code="TSLA", name="Tesla Inc.", country="USA", market_index="NASDAQ"),
+]
+
+
+def get_daily_history() -> pd.DataFrame:
+    index = pd.bdate_range("2024-07-01", "2024-07-05")
+    return pd.DataFrame(
+        {"Open": 100.0, "High": 110.0, "Low": 90.0, "Close": 105.0, "Volume": 1000},
+        index=index,
+    )
+
+
+def download_stock_history(yahoo_stock_codes: list[str], start_period: int, end_period: int) -> dict[str, pd.DataFrame]:
+    return {yahoo_stock_code: get_daily_history() for yahoo_stock_code in yahoo_stock_codes}
+
+
+class TestProcessStockData:
+    async def test_process_stock_data_skip_failed_batch(self, session: AsyncSession, mocker):
+        # Given
+        mocker.patch("app.data.yahoo.stock_all.STOCK_ALL_DOWNLOAD_BATCH_SIZE", 1)
+        mocker.patch("app.data.yahoo.stock_all.download_stock_history", download_stock_history)
+        bulk_upsert_records = StockDailyRepository.bulk_upsert_records
+
+        async def fail_aapl(session, stock_records):
+            if stock_records[0]["code"] == "AAPL":
+                raise RuntimeError("write failed")
+            return await bulk_upsert_records(session, stock_records)
+
+        mocker.patch.object(StockDailyRepository, "bulk_upsert_records", fail_aapl)
+
+        # When
+        await process_stock_data(session, STOCK_LIST, START_PERIOD, END_PERIOD)
+
+        # Then
+        stock_dailies = (await session.execute(select(StockDaily))).scalars().all()
+        assert {stock_daily.code for stock_daily in stock_dailies} == {"TSLA"}
+        assert len(stock_dailies) == 5
+
+    async def test_process_stock_data_writer_failure(self, session: AsyncSession, mocker):
+        # Given
+        mocker.patch("app.data.yahoo.stock_all.STOCK_ALL_DOWNLOAD_BATCH_SIZE", 1)
+        mocker.patch("app.data.yahoo.stock_all.STOCK_ALL_QUEUE_SIZE", 1)
+        mocker.patch("app.data.yahoo.stock_all.download_stock_history", download_stock_history)
+        mocker.patch("app.data.yahoo.stock_all.write_stock_batches", side_effect=RuntimeError("writer failed"))
+
+        # When, Then
+        with pytest.raises(RuntimeError, match="writer failed"):
+            await asyncio.wait_for(process_stock_data(session, STOCK_LIST, START_PERIOD, END_PERIOD), timeout=5)
+
+    async def test_process_stock_data_concurrent_batches(self, session: AsyncSession, mocker):
+        # Given
+        mocker.patch("app.data.yahoo.stock_all.STOCK_ALL_DOWNLOAD_BATCH_SIZE", 2)
+        stock_list = [*STOCK_LIST, StockInfo(code="MSFT", name="Microsoft", country="USA", market_index="NASDAQ")]
+        # 두 배치의 조회가 스레드 풀에서 실제로 겹치도록, 모든 배치가 첫 종목을 조회할 때까지 기다립니다.
+        barrier = threading.Barrier(2, timeout=5)
+        ticker = mocker.patch("app.data.yahoo.stock_all.yfinance.Ticker")
+
+        def history(**kwargs):
+            if threading.current_thread().name not in waited_threads:
+                waited_threads.add(threading.current_thread().name)
+                barrier.wait()
+            return get_daily_history()
+
+        waited_threads: set[str] = set()
+        ticker.return_value.history.side_effect = history
+
+        # When
+        await process_stock_data(session, stock_list, START_PERIOD, END_PERIOD)
+
+        # Then
+        stock_dailies = (await session.execute(select(StockDaily))).scalars().all()
+        assert {stock_daily.code for stock_daily in stock_dailies} == {"AAPL", "TSLA", "MSFT"}
+        assert len(stock_dailies) == 15
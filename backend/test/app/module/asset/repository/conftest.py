@@ -3,5 +3,6 @@ from test.fixtures.asset.test_asset_fixture import (  # noqa: F401 test fixture
     setup_dividend,
     setup_stock,
     setup_stock_daily,
+    setup_stock_minutely,
     setup_user,
 )
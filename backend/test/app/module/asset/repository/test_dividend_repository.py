@@ -23,3 +23,10 @@ class TestDividendRepository:
         dividend_tsla = next(dividend for dividend in recent_dividends if dividend.stock_code == "TSLA")
         assert dividend_tsla.stock_code == "TSLA"
         assert dividend_tsla.date == date(2024, 8, 14)
+
+    async def test_get_last_dates(self, session: AsyncSession, setup_dividend):
+        # When
+        last_dates = await DividendRepository.get_last_dates(session)
+
+        # Then
+        assert last_dates == {"AAPL": date(2024, 8, 14), "TSLA": date(2024, 8, 14), "005930": date(2024, 8, 14)}
@@ -2,6 +2,7 @@ from datetime import date
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.module.asset.model import StockDaily
 from app.module.asset.repository.stock_daily_repository import StockDailyRepository
 
 
@@ -58,3 +59,53 @@ class TestStockDailyRepository:
         assert stock_dailies[3].date == date(2024, 8, 14)
         assert stock_dailies[3].adj_close_price == 725.0
         assert stock_dailies[3].close_price == 720.0
+
+    async def test_bulk_upsert_records(self, session: AsyncSession, setup_stock_daily):
+        # Given
+        stock_records = [
+            {
+                "code": "AAPL",
+                "date": date(2024, 8, 14),
+                "opening_price": 150.0,
+                "highest_price": 155.0,
+                "lowest_price": 149.0,
+                "close_price": 154.0,
+                "adj_close_price": 154.0,
+                "trade_volume": 2000000,
+            },
+            {
+                "code": "AAPL",
+                "date": date(2024, 8, 15),
+                "opening_price": 154.0,
+                "highest_price": 156.0,
+                "lowest_price": 153.0,
+                "close_price": 155.0,
+                "adj_close_price": 155.0,
+                "trade_volume": 1800000,
+            },
+        ]
+
+        # When
+        await StockDailyRepository.bulk_upsert_records(session, stock_records)
+
+        # Then
+        updated_stock_daily: StockDaily = await StockDailyRepository.get_stock_daily(session, "AAPL", date(2024, 8, 14))
+        inserted_stock_daily: StockDaily = await StockDailyRepository.get_stock_daily(
+            session, "AAPL", date(2024, 8, 15)
+        )
+        await session.refresh(updated_stock_daily)
+
+        assert updated_stock_daily.adj_close_price == 154.0
+        assert inserted_stock_daily.adj_close_price == 155.0
+
+    async def test_bulk_upsert_records_empty(self, session: AsyncSession, setup_stock_daily):
+        # Given
+        stock_dailies = await StockDailyRepository.get_stock_dailies(session, ["AAPL", "TSLA", "005930"])
+
+        # When
+        await StockDailyRepository.bulk_upsert_records(session, [])
+
+        # Then
+        assert len(await StockDailyRepository.get_stock_dailies(session, ["AAPL", "TSLA", "005930"])) == len(
+            stock_dailies
+        )
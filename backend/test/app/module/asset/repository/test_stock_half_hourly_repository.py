@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.model import StockHalfHourly
+from app.module.asset.repository.stock_half_hourly_repository import StockHalfHourlyRepository
+
+
+class TestStockHalfHourlyRepository:
+    async def test_rollup_minutely(self, session: AsyncSession, setup_stock_minutely):
+        # Given
+        date_range = (datetime(2024, 8, 13), datetime(2024, 8, 14))
+
+        # When
+        await StockHalfHourlyRepository.rollup_minutely(session, date_range)
+
+        # Then
+        stock_half_hourlies = (await session.execute(select(StockHalfHourly))).scalars().all()
+        rollup_map = {
+            (stock_half_hourly.code, stock_half_hourly.datetime): stock_half_hourly.current_price
+            for stock_half_hourly in stock_half_hourlies
+        }
+
+        assert rollup_map == {
+            ("AAPL", datetime(2024, 8, 13, 9, 0)): 151.0,
+            ("AAPL", datetime(2024, 8, 13, 9, 30)): 152.0,
+            ("TSLA", datetime(2024, 8, 13, 9, 0)): 230.0,
+        }
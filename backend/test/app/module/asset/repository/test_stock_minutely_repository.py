@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.model import StockMinutely
+from app.module.asset.repository.stock_minutely_repository import StockMinutelyRepository
+
+
+class TestStockMinutelyRepository:
+    async def test_get_by_range_interval_minute(self, session: AsyncSession, setup_stock_minutely):
+        # Given
+        date_range = (datetime(2024, 8, 13), datetime(2024, 8, 14, 23, 59))
+
+        # When
+        stock_minutelies = await StockMinutelyRepository.get_by_range_interval_minute(
+            session, date_range, ["AAPL", "TSLA"], 30
+        )
+
+        # Then
+        assert sorted((stock_minutely.code, stock_minutely.datetime) for stock_minutely in stock_minutelies) == [
+            ("AAPL", datetime(2024, 8, 13, 9, 0)),
+            ("AAPL", datetime(2024, 8, 14, 9, 0)),
+        ]
+
+    async def test_bulk_upsert_bucket(self, session: AsyncSession, setup_stock):
+        # Given
+        stocks = [
+            StockMinutely(code="AAPL", datetime=datetime(2024, 8, 13, 10, 0), current_price=150.0),
+            StockMinutely(code="AAPL", datetime=datetime(2024, 8, 13, 10, 30), current_price=151.0),
+            StockMinutely(code="AAPL", datetime=datetime(2024, 8, 13, 10, 45), current_price=152.0),
+        ]
+
+        # When
+        await StockMinutelyRepository.bulk_upsert(session, stocks)
+
+        # Then
+        date_range = (datetime(2024, 8, 13), datetime(2024, 8, 13, 23, 59))
+        half_hour_stocks = await StockMinutelyRepository.get_by_range_interval_minute(session, date_range, ["AAPL"], 30)
+        hour_stocks = await StockMinutelyRepository.get_by_range_interval_minute(session, date_range, ["AAPL"], 60)
+
+        assert sorted(stock.datetime for stock in half_hour_stocks) == [
+            datetime(2024, 8, 13, 10, 0),
+            datetime(2024, 8, 13, 10, 30),
+        ]
+        assert [stock.datetime for stock in hour_stocks] == [datetime(2024, 8, 13, 10, 0)]
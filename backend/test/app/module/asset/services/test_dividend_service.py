@@ -1,11 +1,18 @@
+from datetime import date
+
+import numpy as np
 import pytest
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.module.asset.constant import DIVIDEND_CALENDAR_KEY
+from app.module.asset.dataclass import DividendCalendar
 from app.module.asset.enum import AssetType
-from app.module.asset.model import Asset
+from app.module.asset.model import Asset, AssetStock, Dividend, Stock
+from app.module.asset.redis_repository import RedisDividendCalendarRepository
 from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.repository.dividend_repository import DividendRepository
 from app.module.asset.services.dividend_service import DividendService
 from app.module.asset.services.exchange_rate_service import ExchangeRateService
 from app.module.auth.constant import DUMMY_USER_ID
@@ -47,3 +54,130 @@ class TestDividendService:
             expected_total_dividend += dividend_per_stock * asset.asset_stock.quantity * exchange_rate
 
         assert total_dividend == pytest.approx(expected_total_dividend)
+
+    def test_get_dividend_index(self):
+        # Given
+        dividends = [
+            Dividend(stock_code="AAPL", date=date(2024, 8, 14), dividend=1.6),
+            Dividend(stock_code="TSLA", date=date(2024, 8, 13), dividend=0.8),
+            Dividend(stock_code="AAPL", date=date(2024, 8, 13), dividend=1.5),
+        ]
+
+        # When
+        dividend_index = DividendService.get_dividend_index(dividends)
+
+        # Then
+        assert dividend_index.ordinals["AAPL"].tolist() == [
+            date(2024, 8, 13).toordinal(),
+            date(2024, 8, 14).toordinal(),
+        ]
+        assert dividend_index.amounts["AAPL"].tolist() == [1.5, 1.6]
+        assert dividend_index.amounts["TSLA"].tolist() == [0.8]
+
+    async def test_get_total_estimate_dividend(
+        self, session: AsyncSession, redis_client: Redis, setup_exchange_rate, setup_asset, setup_dividend
+    ):
+        # Given
+        assets: list[Asset] = await AssetRepository.get_eager(session, DUMMY_USER_ID, AssetType.STOCK)
+        stock_codes = [asset.asset_stock.stock.code for asset in assets]
+        dividends = await DividendRepository.get_dividends(session, stock_codes)
+        exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
+
+        # When
+        total_dividends = DividendService.get_total_estimate_dividend(
+            assets, exchange_rate_map, DividendService.get_dividend_index(dividends), {}
+        )
+
+        # Then
+        assert list(total_dividends) == [2024]
+        assert total_dividends[2024][7] == pytest.approx(1.5 * 1300.0 + 1.6 * 1300.0 + 0.9 * 1300.0 * 2 + 105.0)
+        assert total_dividends[2024].sum() == pytest.approx(total_dividends[2024][7])
+
+    def test_get_total_estimate_dividend_with_calendar(self):
+        # Given
+        stock = Stock(code="005930", name="삼성전자", country="KOREA", market_index="KOSPI")
+        assets = [Asset(asset_stock=AssetStock(purchase_date=date(2024, 1, 1), quantity=2, stock=stock))]
+        dividends = [
+            Dividend(stock_code="005930", date=date(2023, 12, 15), dividend=330.0),
+            Dividend(stock_code="005930", date=date(2024, 3, 15), dividend=350.0),
+        ]
+        dividend_calendar_map = {
+            "005930": DividendCalendar(
+                frequency=4,
+                ordinals=np.array([date(2024, 12, 15).toordinal(), date(2025, 3, 15).toordinal()]),
+                amounts=np.array([330.0, 350.0]),
+            )
+        }
+
+        # When
+        total_dividends = DividendService.get_total_estimate_dividend(
+            assets, {}, DividendService.get_dividend_index(dividends), dividend_calendar_map
+        )
+
+        # Then
+        assert total_dividends.keys() == {2024, 2025}
+        assert total_dividends[2024].tolist() == [0, 0, 700.0, 0, 0, 0, 0, 0, 0, 0, 0, 660.0]
+        assert total_dividends[2025].tolist() == [0, 0, 700.0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+    def test_get_dividend_calendar(self):
+        # Given
+        dividend_index = DividendService.get_dividend_index(
+            [
+                Dividend(stock_code="AAPL", date=date(2023, 3, 15), dividend=300.0),
+                Dividend(stock_code="AAPL", date=date(2023, 6, 15), dividend=310.0),
+                Dividend(stock_code="AAPL", date=date(2023, 9, 15), dividend=320.0),
+                Dividend(stock_code="AAPL", date=date(2023, 12, 15), dividend=330.0),
+                Dividend(stock_code="AAPL", date=date(2024, 3, 15), dividend=350.0),
+                Dividend(stock_code="AAPL", date=date(2024, 6, 15), dividend=360.0),
+            ]
+        )
+
+        # When
+        calendar = DividendService.get_dividend_calendar(
+            dividend_index.ordinals["AAPL"], dividend_index.amounts["AAPL"], date(2024, 7, 1)
+        )
+
+        # Then
+        assert calendar.frequency == 4
+        assert [date.fromordinal(int(ordinal)) for ordinal in calendar.ordinals] == [
+            date(2024, 9, 15),
+            date(2024, 12, 15),
+            date(2025, 3, 15),
+            date(2025, 6, 15),
+        ]
+        assert calendar.amounts.tolist() == [320.0, 330.0, 350.0, 360.0]
+
+    def test_get_dividend_calendar_inactive(self):
+        # Given
+        dividend_index = DividendService.get_dividend_index(
+            [Dividend(stock_code="AAPL", date=date(2020, 3, 15), dividend=300.0)]
+        )
+
+        # When
+        calendar = DividendService.get_dividend_calendar(
+            dividend_index.ordinals["AAPL"], dividend_index.amounts["AAPL"], date(2024, 7, 1)
+        )
+
+        # Then
+        assert calendar is None
+
+    async def test_get_dividend_calendar_map(self, redis_client: Redis):
+        # Given
+        calendar = DividendCalendar(
+            frequency=1, ordinals=np.array([date(2025, 4, 1).toordinal()]), amounts=np.array([361.0])
+        )
+        await RedisDividendCalendarRepository.replace(
+            redis_client,
+            DIVIDEND_CALENDAR_KEY,
+            {"005930": DividendService.dump_dividend_calendar(calendar)},
+            expire_time=60,
+        )
+
+        # When
+        dividend_calendar_map = await DividendService.get_dividend_calendar_map(redis_client, ["005930", "AAPL"])
+
+        # Then
+        assert list(dividend_calendar_map) == ["005930"]
+        assert dividend_calendar_map["005930"].frequency == 1
+        assert dividend_calendar_map["005930"].ordinals.tolist() == [date(2025, 4, 1).toordinal()]
+        assert dividend_calendar_map["005930"].amounts.tolist() == [361.0]
@@ -0,0 +1,99 @@
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.constant import PORTFOLIO_SNAPSHOT_KEY, PRICE_EPOCH_KEY
+from app.module.asset.enum import AssetType
+from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.services.portfolio_snapshot_service import PortfolioSnapshotService
+from app.module.auth.constant import DUMMY_USER_ID
+
+
+class TestPortfolioSnapshotService:
+    async def test_get_snapshot_from_cache(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_user,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_dividend,
+        setup_asset,
+    ):
+        # Given
+        expected_snapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # When
+        cached_snapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # Then
+        assert len(await redis_client.keys(f"{PORTFOLIO_SNAPSHOT_KEY}_{DUMMY_USER_ID}_*")) == 1
+        assert [asset.id for asset in cached_snapshot.assets] == [asset.id for asset in expected_snapshot.assets]
+        assert [asset.asset_stock.stock.code for asset in cached_snapshot.assets] == [
+            asset.asset_stock.stock.code for asset in expected_snapshot.assets
+        ]
+        assert cached_snapshot.current_stock_price_map == expected_snapshot.current_stock_price_map
+        assert cached_snapshot.exchange_rate_map == expected_snapshot.exchange_rate_map
+        assert cached_snapshot.dividend_map == expected_snapshot.dividend_map
+        assert cached_snapshot.stock_daily_map.keys() == expected_snapshot.stock_daily_map.keys()
+
+    async def test_invalidate(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_user,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_asset,
+    ):
+        # Given
+        snapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+        assets = await AssetRepository.get_eager(session, DUMMY_USER_ID, AssetType.STOCK)
+        await AssetRepository.delete_asset(session, assets[0].id)
+
+        # When
+        await PortfolioSnapshotService.invalidate(redis_client, DUMMY_USER_ID)
+        invalidated_snapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # Then
+        assert len(invalidated_snapshot.assets) == len(snapshot.assets) - 1
+
+    async def test_invalidate_prices(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_user,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_asset,
+    ):
+        # Given
+        await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # When
+        await PortfolioSnapshotService.invalidate_prices(redis_client)
+        await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # Then
+        assert len(await redis_client.keys(f"{PORTFOLIO_SNAPSHOT_KEY}_{DUMMY_USER_ID}_*")) == 2
+
+    async def test_invalidate_prices_throttled(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_user,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_asset,
+    ):
+        # Given
+        await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+        await PortfolioSnapshotService.invalidate_prices(redis_client)
+        await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # When
+        await PortfolioSnapshotService.invalidate_prices(redis_client)
+        await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # Then
+        assert await redis_client.get(PRICE_EPOCH_KEY) == "1"
+        assert len(await redis_client.keys(f"{PORTFOLIO_SNAPSHOT_KEY}_{DUMMY_USER_ID}_*")) == 2
@@ -0,0 +1,107 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.enum import AssetType, CurrencyType
+from app.module.asset.model import Asset
+from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.asset.services.stock_daily_service import StockDailyService
+from app.module.asset.services.stock_service import StockService
+from app.module.asset.services.valuation_service import ValuationService
+from app.module.auth.constant import DUMMY_USER_ID
+from app.module.chart.service.composition_service import CompositionService
+
+
+class TestValuationService:
+    async def test_get_holdings(self, session: AsyncSession, setup_asset):
+        # Given
+        assets: list[Asset] = await AssetRepository.get_eager(session, DUMMY_USER_ID, AssetType.STOCK)
+
+        # When
+        holdings = ValuationService.get_holdings(assets)
+
+        # Then
+        assert [holdings.codes[position] for position in holdings.code_index] == [
+            asset.asset_stock.stock.code for asset in assets
+        ]
+        assert [holdings.currencies[position] for position in holdings.currency_index] == [
+            CurrencyType[asset.asset_stock.stock.country] for asset in assets
+        ]
+        assert holdings.quantity.tolist() == [asset.asset_stock.quantity for asset in assets]
+        assert np.isnan(holdings.purchase_price).tolist() == [
+            asset.asset_stock.purchase_price is None for asset in assets
+        ]
+
+    async def test_get_total_asset_amount_purchased_before(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_realtime_stock_price,
+        setup_exchange_rate,
+    ):
+        # Given
+        assets: list[Asset] = await AssetRepository.get_eager(session, DUMMY_USER_ID, AssetType.STOCK)
+        lastest_stock_daily_map = await StockDailyService.get_latest_map(session, assets)
+        current_stock_price_map = await StockService.get_current_stock_price(
+            redis_client, lastest_stock_daily_map, assets
+        )
+        exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
+        purchased_before = date(2024, 8, 13)
+
+        # When
+        total_asset_amount = ValuationService.get_total_asset_amount(
+            ValuationService.get_holdings(assets), current_stock_price_map, exchange_rate_map, purchased_before
+        )
+
+        # Then
+        expected_total_asset_amount = sum(
+            current_stock_price_map[asset.asset_stock.stock.code]
+            * asset.asset_stock.quantity
+            * ExchangeRateService.get_won_exchange_rate(asset, exchange_rate_map)
+            for asset in assets
+            if asset.asset_stock.purchase_date <= purchased_before
+        )
+        assert total_asset_amount == pytest.approx(expected_total_asset_amount)
+
+    async def test_get_asset_stock_composition(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_realtime_stock_price,
+        setup_exchange_rate,
+    ):
+        # Given
+        assets: list[Asset] = await AssetRepository.get_eager(session, DUMMY_USER_ID, AssetType.STOCK)
+        lastest_stock_daily_map = await StockDailyService.get_latest_map(session, assets)
+        current_stock_price_map = await StockService.get_current_stock_price(
+            redis_client, lastest_stock_daily_map, assets
+        )
+        exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
+
+        # When
+        stock_composition = CompositionService.get_asset_stock_composition(
+            ValuationService.get_holdings(assets), current_stock_price_map, exchange_rate_map
+        )
+
+        # Then
+        stock_values: dict[str, float] = {}
+        for asset in assets:
+            stock_values[asset.asset_stock.stock.name] = stock_values.get(asset.asset_stock.stock.name, 0.0) + (
+                current_stock_price_map[asset.asset_stock.stock.code]
+                * asset.asset_stock.quantity
+                * ExchangeRateService.get_won_exchange_rate(asset, exchange_rate_map)
+            )
+        total_value = sum(stock_values.values())
+
+        assert [item["name"] for item in stock_composition] == list(stock_values)
+        for item in stock_composition:
+            assert item["current_amount"] == pytest.approx(stock_values[item["name"]])
+            assert item["percent_rate"] == pytest.approx(stock_values[item["name"]] / total_value * 100)
@@ -1,6 +1,11 @@
 from redis.asyncio import Redis
 
-from app.module.asset.redis_repository import RedisExchangeRateRepository, RedisRealTimeStockRepository
+from app.module.asset.constant import MARKET_INDEX_UPDATED_AT_KEY
+from app.module.asset.redis_repository import (
+    RedisExchangeRateRepository,
+    RedisMarketIndexUpdatedAtRepository,
+    RedisRealTimeStockRepository,
+)
 
 
 class TestRedisRealTimeStockRepository:
@@ -25,3 +30,19 @@ class TestRedisExchangeRateRepository:
 
         # Then
         assert result == expected_values
+
+
+class TestRedisMarketIndexUpdatedAtRepository:
+    async def test_bulk_get(self, redis_client: Redis):
+        # Given
+        await RedisMarketIndexUpdatedAtRepository.bulk_save(
+            redis_client, MARKET_INDEX_UPDATED_AT_KEY, {"KS11": "2024-08-13T10:00:00+09:00"}
+        )
+
+        # When
+        result = await RedisMarketIndexUpdatedAtRepository.bulk_get(
+            redis_client, MARKET_INDEX_UPDATED_AT_KEY, ["KS11", "KQ11"]
+        )
+
+        # Then
+        assert result == ["2024-08-13T10:00:00+09:00", None]
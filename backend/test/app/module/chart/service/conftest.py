@@ -0,0 +1,11 @@
+from test.fixtures.asset.test_asset_fixture import (  # noqa: F401 test fixture 사용
+    setup_asset,
+    setup_asset_field,
+    setup_dividend,
+    setup_exchange_rate,
+    setup_realtime_market_index,
+    setup_realtime_stock_price,
+    setup_stock,
+    setup_stock_daily,
+    setup_user,
+)
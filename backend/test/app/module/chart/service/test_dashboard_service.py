@@ -0,0 +1,135 @@
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.dataclass import PortfolioSnapshot
+from app.module.asset.services.portfolio_snapshot_service import PortfolioSnapshotService
+from app.module.auth.constant import DUMMY_USER_ID
+from app.module.chart.enum import DashboardSection, EstimateDividendType, IntervalType
+from app.module.chart.schema import DashboardResponse, EstimateDividendEveryResponse, EstimateDividendTypeResponse
+from app.module.chart.service.dashboard_service import DashboardService
+
+
+class TestDashboardService:
+    async def test_get_dashboard_all_sections(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_asset_field,
+        setup_stock_daily,
+        setup_dividend,
+        setup_exchange_rate,
+        setup_realtime_stock_price,
+        setup_realtime_market_index,
+    ):
+        # Given
+        # fixture가 넣은 문자열 account_type 대신 DB에서 읽은 Enum 값을 사용하도록 세션 캐시를 비웁니다.
+        session.expire_all()
+        sections = list(DashboardSection)
+
+        # When
+        response: DashboardResponse = await DashboardService.get_dashboard(
+            session, redis_client, DUMMY_USER_ID, sections, EstimateDividendType.EVERY, IntervalType.ONEMONTH
+        )
+
+        # Then
+        assert response.summary is not None
+        assert response.summary.total_asset_amount > 0
+        assert response.composition is not None
+        assert response.account is not None
+        assert response.my_stock is not None
+        assert len(response.my_stock.my_stock_list) == 3
+        assert isinstance(response.estimate_dividend, EstimateDividendEveryResponse)
+        assert "2024" in response.estimate_dividend.root
+        assert response.performance_analysis is not None
+
+    async def test_get_dashboard_selected_sections(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+        setup_realtime_stock_price,
+    ):
+        # Given
+        sections = [DashboardSection.COMPOSITION]
+
+        # When
+        response: DashboardResponse = await DashboardService.get_dashboard(
+            session, redis_client, DUMMY_USER_ID, sections, EstimateDividendType.EVERY, IntervalType.ONEMONTH
+        )
+
+        # Then
+        assert response.composition is not None
+        assert response.summary is None
+        assert response.estimate_dividend is None
+        assert response.performance_analysis is None
+
+
+class TestGetEstimateDividend:
+    async def test_get_estimate_dividend_every(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_dividend,
+        setup_exchange_rate,
+    ):
+        # Given
+        snapshot: PortfolioSnapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # When
+        response = await DashboardService.get_estimate_dividend(
+            session, redis_client, snapshot, EstimateDividendType.EVERY
+        )
+
+        # Then
+        # AAPL 1주는 8/13, 8/14 배당을, TSLA 2주와 삼성전자 1주는 매수일인 8/14 배당만 받습니다.
+        assert isinstance(response, EstimateDividendEveryResponse)
+        august_dividend = response.root["2024"].data[7]
+        assert august_dividend == pytest.approx((1.5 + 1.6) * 1300.0 + 0.9 * 1300.0 * 2 + 105.0)
+
+    async def test_get_estimate_dividend_type(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_dividend,
+        setup_exchange_rate,
+    ):
+        # Given
+        snapshot: PortfolioSnapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # When
+        response = await DashboardService.get_estimate_dividend(
+            session, redis_client, snapshot, EstimateDividendType.TYPE
+        )
+
+        # Then
+        assert isinstance(response, EstimateDividendTypeResponse)
+        assert {value.code for value in response.root} == {"AAPL", "TSLA", "005930"}
+        assert sum(value.composition_rate for value in response.root) == pytest.approx(100.0)
+
+    @pytest.mark.parametrize(
+        "category, expected_type",
+        [
+            (EstimateDividendType.EVERY, EstimateDividendEveryResponse),
+            (EstimateDividendType.TYPE, EstimateDividendTypeResponse),
+        ],
+    )
+    async def test_get_estimate_dividend_no_asset(
+        self, session: AsyncSession, redis_client: Redis, setup_user, category, expected_type
+    ):
+        # Given
+        snapshot: PortfolioSnapshot = await PortfolioSnapshotService.get(session, redis_client, DUMMY_USER_ID)
+
+        # When
+        response = await DashboardService.get_estimate_dividend(session, redis_client, snapshot, category)
+
+        # Then
+        assert isinstance(response, expected_type)
+        assert len(response.root) == 0
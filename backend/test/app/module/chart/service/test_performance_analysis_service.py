@@ -0,0 +1,142 @@
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.enum import AssetType
+from app.module.asset.model import Asset, StockDaily, StockMinutely
+from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.repository.stock_daily_repository import StockDailyRepository
+from app.module.asset.services.asset_stock_service import AssetStockService
+from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.auth.constant import DUMMY_USER_ID
+from app.module.chart.enum import IntervalType
+from app.module.chart.model import UserPortfolioDaily
+from app.module.chart.service.performance_analysis_service import PerformanceAnalysis
+from app.module.chart.service.portfolio_history_service import PortfolioHistoryService
+
+
+class TestPerformanceAnalysis:
+    async def test_get_user_analysis(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+    ):
+        # Given
+        interval_start, interval_end = date(2024, 8, 12), date(2024, 8, 16)
+        market_analysis_result = {market_date: 0.0 for market_date in [date(2024, 8, 13), date(2024, 8, 16)]}
+
+        portfolio_dailies: list[UserPortfolioDaily] = await PortfolioHistoryService.calculate(
+            session, redis_client, DUMMY_USER_ID, interval_start, interval_end
+        )
+        profit_rate_map = {portfolio_daily.date: portfolio_daily.profit_rate for portfolio_daily in portfolio_dailies}
+
+        # When
+        user_analysis_result = await PerformanceAnalysis.get_user_analysis(
+            session, redis_client, interval_start, interval_end, DUMMY_USER_ID, market_analysis_result
+        )
+
+        # Then
+        for market_date in market_analysis_result:
+            assert user_analysis_result[market_date] == pytest.approx(profit_rate_map[market_date])
+
+    async def test_get_user_analysis_short(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+    ):
+        # Given
+        interval_start, interval_end = datetime(2024, 8, 12), datetime(2024, 8, 16)
+        # 30분 봉 시각만 사용하며, 첫 시각은 첫 매입일(8/13) 이전입니다.
+        market_datetimes = [
+            datetime(2024, 8, 12, 15, 0),
+            datetime(2024, 8, 13, 9, 0),
+            datetime(2024, 8, 13, 9, 30),
+            datetime(2024, 8, 14, 9, 0),
+            datetime(2024, 8, 14, 9, 30),
+            datetime(2024, 8, 15, 9, 0),
+        ]
+        market_analysis_result = {market_datetime: 0.0 for market_datetime in market_datetimes}
+        stock_prices = [("AAPL", 220.0), ("TSLA", 230.0), ("005930", 70000.0)]
+
+        session.add_all(
+            [
+                StockMinutely(
+                    code=code,
+                    datetime=market_datetime,
+                    current_price=price + i,
+                    bucket_30m=market_datetime,
+                    bucket_1h=None,
+                )
+                for i, market_datetime in enumerate(market_datetimes)
+                for code, price in stock_prices
+            ]
+        )
+        await session.commit()
+
+        assets: list[Asset] = await AssetRepository.get_eager_by_range(
+            session, DUMMY_USER_ID, AssetType.STOCK, (interval_start, interval_end)
+        )
+        stock_dailies: list[StockDaily] = await StockDailyRepository.get_stock_dailies_by_code_and_date(
+            session, [(asset.asset_stock.stock.code, asset.asset_stock.purchase_date) for asset in assets]
+        )
+        stock_daily_map = {(daily.code, daily.date): daily for daily in stock_dailies}
+        exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
+        stock_interval_date_price_map = {
+            f"{code}_{market_datetime}": price + i
+            for i, market_datetime in enumerate(market_datetimes)
+            for code, price in stock_prices
+        }
+
+        # When
+        user_analysis_result = await PerformanceAnalysis.get_user_analysis_short(
+            session,
+            redis_client,
+            interval_start,
+            interval_end,
+            DUMMY_USER_ID,
+            IntervalType.FIVEDAY,
+            market_analysis_result,
+        )
+
+        # Then
+        for market_datetime in sorted(market_analysis_result):
+            cumulative_assets = [asset for asset in assets if asset.asset_stock.purchase_date <= market_datetime.date()]
+
+            total_asset_amount = AssetStockService.get_total_asset_amount_minute(
+                assets, stock_interval_date_price_map, exchange_rate_map, market_datetime
+            )
+            total_invest_amount = AssetStockService.get_total_investment_amount(
+                cumulative_assets, stock_daily_map, exchange_rate_map
+            )
+            expected_profit_rate = (
+                ((total_asset_amount - total_invest_amount) / total_invest_amount) * 100
+                if total_invest_amount > 0
+                else 0.0
+            )
+
+            assert user_analysis_result[market_datetime] == pytest.approx(expected_profit_rate)
+
+        # 첫 매입일 이전에는 투자금이 없어 0이고, 매입일의 첫 봉부터 매입분이 반영된 수익률이 나옵니다.
+        assert user_analysis_result[market_datetimes[0]] == 0.0
+        assert all(user_analysis_result[market_datetime] != 0.0 for market_datetime in market_datetimes[1:])
+
+    def test_get_cumulative_amounts(self):
+        # Given
+        market_keys = [datetime(2024, 8, 13, hour) for hour in (9, 10, 11)] + [datetime(2024, 8, 14, 9)]
+        purchase_keys = [datetime(2024, 8, 1), datetime(2024, 8, 13), datetime(2024, 8, 14), datetime(2024, 8, 15)]
+        amounts = np.array([1.0, 10.0, 100.0, 1000.0])
+
+        # When
+        cumulative_amounts = PerformanceAnalysis._get_cumulative_amounts(market_keys, purchase_keys, amounts)
+
+        # Then
+        assert cumulative_amounts.tolist() == [11.0, 11.0, 11.0, 111.0]
@@ -0,0 +1,205 @@
+from datetime import date, timedelta
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.asset.enum import AssetType
+from app.module.asset.model import Asset, StockDaily
+from app.module.asset.repository.asset_repository import AssetRepository
+from app.module.asset.repository.stock_daily_repository import StockDailyRepository
+from app.module.asset.services.asset_stock_service import AssetStockService
+from app.module.asset.services.exchange_rate_service import ExchangeRateService
+from app.module.auth.constant import DUMMY_USER_ID
+from app.module.chart.model import UserPortfolioDaily
+from app.module.chart.repository import UserPortfolioDailyRepository
+from app.module.chart.service.portfolio_history_service import PortfolioHistoryService
+
+
+class TestPortfolioHistoryService:
+    async def test_get_series(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+    ):
+        # Given
+        start_date, end_date = date(2024, 8, 12), date(2024, 8, 16)
+        assets: list[Asset] = await AssetRepository.get_eager(session, DUMMY_USER_ID, AssetType.STOCK)
+        stock_dailies: list[StockDaily] = await StockDailyRepository.get_by_range(
+            session, [asset.asset_stock.stock.code for asset in assets], (start_date, end_date)
+        )
+        stock_daily_map = {(daily.code, daily.date): daily for daily in stock_dailies}
+        exchange_rate_map = await ExchangeRateService.get_exchange_rate_map(redis_client)
+
+        # When
+        portfolio_dailies: list[UserPortfolioDaily] = await PortfolioHistoryService.get_series(
+            session, redis_client, DUMMY_USER_ID, start_date, end_date
+        )
+
+        # Then
+        saved_portfolio_dailies = await UserPortfolioDailyRepository.get_by_range(
+            session, DUMMY_USER_ID, (start_date, end_date)
+        )
+        assert [portfolio_daily.date for portfolio_daily in portfolio_dailies] == [
+            start_date + timedelta(days=offset) for offset in range(5)
+        ]
+        assert [portfolio_daily.date for portfolio_daily in saved_portfolio_dailies] == [
+            start_date + timedelta(days=offset) for offset in range(3)
+        ]
+
+        for portfolio_daily in portfolio_dailies:
+            held_assets = [asset for asset in assets if asset.asset_stock.purchase_date <= portfolio_daily.date]
+            close_price_map = {
+                daily.code: daily.adj_close_price for daily in stock_dailies if daily.date <= portfolio_daily.date
+            }
+
+            expected_asset_amount = sum(
+                close_price_map.get(asset.asset_stock.stock.code, 0.0)
+                * asset.asset_stock.quantity
+                * ExchangeRateService.get_won_exchange_rate(asset, exchange_rate_map)
+                for asset in held_assets
+            )
+            expected_invest_amount = AssetStockService.get_total_investment_amount(
+                held_assets, stock_daily_map, exchange_rate_map
+            )
+
+            assert portfolio_daily.total_asset_amount == pytest.approx(expected_asset_amount)
+            assert portfolio_daily.total_invest_amount == pytest.approx(expected_invest_amount)
+
+    async def test_get_series_missing_dates(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        mocker,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+    ):
+        # Given
+        start_date, end_date = date(2024, 8, 12), date(2024, 8, 16)
+        expected_portfolio_dailies = await PortfolioHistoryService.calculate(
+            session, redis_client, DUMMY_USER_ID, start_date, end_date
+        )
+        await UserPortfolioDailyRepository.bulk_upsert(
+            session,
+            [
+                portfolio_daily
+                for portfolio_daily in expected_portfolio_dailies
+                if portfolio_daily.date not in (date(2024, 8, 13), date(2024, 8, 14))
+            ],
+        )
+        calculate_by_assets = mocker.spy(PortfolioHistoryService, "calculate_by_assets")
+        bulk_upsert = mocker.spy(UserPortfolioDailyRepository, "bulk_upsert")
+
+        # When
+        portfolio_dailies: list[UserPortfolioDaily] = await PortfolioHistoryService.get_series(
+            session, redis_client, DUMMY_USER_ID, start_date, end_date
+        )
+
+        # Then
+        assert calculate_by_assets.call_args.args[4:] == (date(2024, 8, 13), date(2024, 8, 14))
+        assert [portfolio_daily.date for portfolio_daily in bulk_upsert.call_args.args[1]] == [
+            date(2024, 8, 13),
+            date(2024, 8, 14),
+        ]
+        assert [portfolio_daily.date for portfolio_daily in portfolio_dailies] == [
+            portfolio_daily.date for portfolio_daily in expected_portfolio_dailies
+        ]
+        assert [portfolio_daily.total_asset_amount for portfolio_daily in portfolio_dailies] == pytest.approx(
+            [portfolio_daily.total_asset_amount for portfolio_daily in expected_portfolio_dailies]
+        )
+
+    async def test_get_series_saved(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        mocker,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+    ):
+        # Given
+        start_date, end_date = date(2024, 8, 12), date(2024, 8, 14)
+        await PortfolioHistoryService.get_series(session, redis_client, DUMMY_USER_ID, start_date, end_date)
+        calculate_by_assets = mocker.spy(PortfolioHistoryService, "calculate_by_assets")
+
+        # When
+        portfolio_dailies = await PortfolioHistoryService.get_series(
+            session, redis_client, DUMMY_USER_ID, start_date, end_date
+        )
+
+        # Then
+        assert len(portfolio_dailies) == 3
+        calculate_by_assets.assert_not_called()
+
+    async def test_get_series_recalculate_not_ingested_dates(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+    ):
+        # Given
+        start_date, end_date = date(2024, 8, 12), date(2024, 8, 15)
+        portfolio_dailies_before = await PortfolioHistoryService.get_series(
+            session, redis_client, DUMMY_USER_ID, start_date, end_date
+        )
+        session.add_all(
+            [
+                StockDaily(
+                    code=code,
+                    date=date(2024, 8, 15),
+                    opening_price=price,
+                    highest_price=price,
+                    lowest_price=price,
+                    close_price=price,
+                    adj_close_price=price,
+                    trade_volume=1000,
+                )
+                for code, price in [("AAPL", 160.0), ("TSLA", 740.0), ("005930", 75000.0)]
+            ]
+        )
+        await session.commit()
+
+        # When
+        portfolio_dailies_after = await PortfolioHistoryService.get_series(
+            session, redis_client, DUMMY_USER_ID, start_date, end_date
+        )
+
+        # Then
+        saved_portfolio_dailies = await UserPortfolioDailyRepository.get_by_range(
+            session, DUMMY_USER_ID, (start_date, end_date)
+        )
+        assert portfolio_dailies_before[-1].date == date(2024, 8, 15)
+        assert [portfolio_daily.date for portfolio_daily in saved_portfolio_dailies] == [
+            start_date + timedelta(days=offset) for offset in range(4)
+        ]
+        assert portfolio_dailies_after[-1].total_asset_amount > portfolio_dailies_before[-1].total_asset_amount
+        assert saved_portfolio_dailies[-1].total_asset_amount == pytest.approx(
+            portfolio_dailies_after[-1].total_asset_amount
+        )
+
+    async def test_invalidate(
+        self,
+        session: AsyncSession,
+        redis_client: Redis,
+        setup_asset,
+        setup_stock_daily,
+        setup_exchange_rate,
+    ):
+        # Given
+        start_date, end_date = date(2024, 8, 12), date(2024, 8, 14)
+        await PortfolioHistoryService.get_series(session, redis_client, DUMMY_USER_ID, start_date, end_date)
+
+        # When
+        await PortfolioHistoryService.invalidate(session, DUMMY_USER_ID, date(2024, 8, 13))
+
+        # Then
+        saved_portfolio_dailies = await UserPortfolioDailyRepository.get_by_range(
+            session, DUMMY_USER_ID, (start_date, end_date)
+        )
+        assert [portfolio_daily.date for portfolio_daily in saved_portfolio_dailies] == [date(2024, 8, 12)]
@@ -0,0 +1,106 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from app.module.asset.model import StockDaily
+from database.bulk_write import chunked_upsert, split_records
+from database.constant import BULK_UPSERT_RETRY_COUNT
+
+
+def get_stock_records(count: int) -> list[dict]:
+    return [{"code": f"{index:06d}", "date": date(2024, 8, 13), "close_price": 100.0} for index in range(count)]
+
+
+def get_mysql_error(error_code: int) -> DBAPIError:
+    return DBAPIError("INSERT ...", {}, Exception(error_code, "mysql error"))
+
+
+@pytest.fixture
+def mock_session(mocker):
+    mocker.patch("database.bulk_write.BULK_UPSERT_RETRY_SECOND", 0)
+    return mocker.AsyncMock()
+
+
+class TestSplitRecords:
+    def test_split_records_by_rows(self):
+        # Given
+        records = get_stock_records(5)
+
+        # When
+        batches = list(split_records(records, max_rows=2, max_bytes=1024 * 1024))
+
+        # Then
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [record for batch in batches for record in batch] == records
+
+    def test_split_records_by_bytes(self):
+        # Given
+        records = get_stock_records(3)
+        record_bytes = sum(len(str(value)) + 4 for value in records[0].values())
+
+        # When
+        batches = list(split_records(records, max_rows=100, max_bytes=record_bytes * 2))
+
+        # Then
+        assert [len(batch) for batch in batches] == [2, 1]
+
+    def test_split_records_oversized_record(self):
+        # Given
+        records = [{"code": "x" * 100}, {"code": "y"}]
+
+        # When
+        batches = list(split_records(records, max_rows=100, max_bytes=10))
+
+        # Then
+        assert batches == [[{"code": "x" * 100}], [{"code": "y"}]]
+
+    def test_split_records_empty(self):
+        assert list(split_records([], max_rows=100, max_bytes=1024)) == []
+
+
+class TestChunkedUpsert:
+    async def test_chunked_upsert_empty(self, mock_session):
+        # When
+        saved_count = await chunked_upsert(mock_session, StockDaily, [], ["close_price"])
+
+        # Then
+        assert saved_count == 0
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.parametrize("error_code", [1213, 1205])
+    async def test_chunked_upsert_retry(self, mock_session, error_code: int):
+        # Given
+        mock_session.execute.side_effect = [get_mysql_error(error_code), None]
+
+        # When
+        saved_count = await chunked_upsert(mock_session, StockDaily, get_stock_records(3), ["close_price"])
+
+        # Then
+        assert saved_count == 3
+        assert mock_session.execute.call_count == 2
+        assert mock_session.rollback.call_count == 1
+        assert mock_session.commit.call_count == 1
+
+    async def test_chunked_upsert_give_up_after_retry(self, mock_session):
+        # Given
+        mock_session.execute.side_effect = get_mysql_error(1213)
+
+        # When
+        saved_count = await chunked_upsert(mock_session, StockDaily, get_stock_records(3), ["close_price"])
+
+        # Then
+        assert saved_count == 0
+        assert mock_session.execute.call_count == BULK_UPSERT_RETRY_COUNT
+        mock_session.commit.assert_not_called()
+
+    async def test_chunked_upsert_skip_failed_batch(self, mock_session):
+        # Given
+        mock_session.execute.side_effect = [get_mysql_error(1062), None]
+
+        # When
+        saved_count = await chunked_upsert(mock_session, StockDaily, get_stock_records(5), ["close_price"], max_rows=3)
+
+        # Then
+        assert saved_count == 2
+        assert mock_session.execute.call_count == 2
@@ -1,11 +1,19 @@
-from datetime import date
+from datetime import date, datetime
 
 import pytest
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.module.asset.enum import AccountType, AssetType, InvestmentBankType, PurchaseCurrencyType, StockAsset
-from app.module.asset.model import Asset, AssetField, AssetStock, Dividend, Stock, StockDaily
+from app.module.asset.enum import (
+    AccountType,
+    AssetType,
+    InvestmentBankType,
+    MarketIndex,
+    PurchaseCurrencyType,
+    StockAsset,
+)
+from app.module.asset.model import Asset, AssetField, AssetStock, Dividend, Stock, StockDaily, StockMinutely
+from app.module.asset.schema import MarketIndexData
 from app.module.auth.constant import DUMMY_NAME, DUMMY_USER_ID
 from app.module.auth.enum import ProviderEnum, UserRoleEnum
 from app.module.auth.model import User  # noqa: F401 > relationship 설정시 필요합니다.
@@ -39,6 +47,21 @@ async def setup_exchange_rate(redis_client: Redis):
     await redis_client.flushall()
 
 
+@pytest.fixture(scope="function")
+async def setup_realtime_market_index(redis_client: Redis):
+    market_index = MarketIndexData(
+        country="South Korea",
+        name=MarketIndex.KOSPI,
+        current_value="2700.0",
+        change_value="10.0",
+        change_percent="0.37",
+        update_time="",
+    )
+    await redis_client.set(MarketIndex.KOSPI, market_index.model_dump_json())
+    yield market_index
+    await redis_client.flushall()
+
+
 @pytest.fixture(scope="function")
 async def setup_dividend(session: AsyncSession, setup_stock):
     dividend1 = Dividend(dividend=1.5, stock_code="AAPL", date=date(2024, 8, 13))
@@ -151,6 +174,48 @@ async def setup_stock_daily(session: AsyncSession, setup_user, setup_stock):
     await session.commit()
 
 
+@pytest.fixture(scope="function")
+async def setup_stock_minutely(session: AsyncSession, setup_stock):
+    stock_minutely_1 = StockMinutely(
+        code="AAPL",
+        datetime=datetime(2024, 8, 13, 9, 0),
+        current_price=150.0,
+        bucket_30m=datetime(2024, 8, 13, 9, 0),
+        bucket_1h=datetime(2024, 8, 13, 9, 0),
+    )
+    stock_minutely_2 = StockMinutely(
+        code="AAPL",
+        datetime=datetime(2024, 8, 13, 9, 20),
+        current_price=151.0,
+        bucket_30m=None,
+        bucket_1h=None,
+    )
+    stock_minutely_3 = StockMinutely(
+        code="AAPL",
+        datetime=datetime(2024, 8, 13, 9, 40),
+        current_price=152.0,
+        bucket_30m=None,
+        bucket_1h=None,
+    )
+    stock_minutely_4 = StockMinutely(
+        code="TSLA",
+        datetime=datetime(2024, 8, 13, 9, 10),
+        current_price=230.0,
+        bucket_30m=None,
+        bucket_1h=None,
+    )
+    stock_minutely_5 = StockMinutely(
+        code="AAPL",
+        datetime=datetime(2024, 8, 14, 9, 0),
+        current_price=153.0,
+        bucket_30m=datetime(2024, 8, 14, 9, 0),
+        bucket_1h=datetime(2024, 8, 14, 9, 0),
+    )
+
+    session.add_all([stock_minutely_1, stock_minutely_2, stock_minutely_3, stock_minutely_4, stock_minutely_5])
+    await session.commit()
+
+
 @pytest.fixture(scope="function")
 async def setup_asset(session: AsyncSession, setup_user, setup_stock):
     asset_stock1 = AssetStock(
@@ -0,0 +1,94 @@
+"""
+네이버 종목/메인/해외증시 페이지를 받아 파서가 읽는 영역만 남겨 저장하고, golden.json 을 다시 만듭니다.
+golden.json 의 기대값은 기준 구현인 SoupNaverHtmlParser 의 결과입니다.
+
+현재 커밋된 HTML 은 실제 페이지를 저장한 것이 아니라, 파서가 읽는 구조를 본떠 직접 작성한 합성 픽스처입니다.
+따라서 지금의 테스트는 두 파서가 같은 결과를 내는지만 확인합니다. 네트워크가 되는 환경에서 이 스크립트를 실행해
+실제 페이지로 교체해야 합니다.
+
+python -m test.fixtures.data.naver.capture            # 페이지를 새로 받은 뒤 golden.json 생성
+python -m test.fixtures.data.naver.capture --golden   # 저장된 HTML 로 golden.json 만 다시 생성
+"""
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from aiohttp import ClientSession
+from lxml import html as lxml_html
+
+from app.data.naver.sources.parser import SoupNaverHtmlParser
+from app.data.naver.sources.service import NAVER_MAIN_URL, NAVER_STOCK_URL, NAVER_WORLD_URL
+
+NAVER_FIXTURE_DIR = Path(__file__).parent
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# 파일명: (URL, 남길 영역의 xpath)
+CAPTURE_PAGES = {
+    "stock_up.html": (NAVER_STOCK_URL.format(code="005930"), '//*[@id="chart_area"]'),
+    "stock_down.html": (NAVER_STOCK_URL.format(code="000660"), '//*[@id="chart_area"]'),
+    "stock_missing.html": (NAVER_STOCK_URL.format(code="999999"), '//*[@id="chart_area"]'),
+    "main.html": (
+        NAVER_MAIN_URL,
+        '//div[contains(@class, "kospi_area") or contains(@class, "kosdaq_area")]',
+    ),
+    "world.html": (NAVER_WORLD_URL, '//*[@id="americaIndex"]'),
+}
+STOCK_PRICE_FILES = ["stock_up.html", "stock_down.html", "stock_missing.html"]
+MARKET_INDEX_FILES = ["main.html"]
+WORLD_INDEX_FILES = ["world.html", "main.html"]
+
+
+def trim_page(html: str, xpath: str) -> str:
+    # 파서가 읽는 영역만 남기고 나머지 마크업과 스크립트는 버립니다.
+    document = lxml_html.fromstring(html)
+    title = document.findtext(".//title") or ""
+    body = "\n".join(lxml_html.tostring(element, encoding="unicode") for element in document.xpath(xpath))
+    return (
+        f'<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n</head>\n'
+        f"<body>\n{body}\n</body>\n</html>\n"
+    )
+
+
+async def capture() -> None:
+    async with ClientSession(headers={"User-Agent": USER_AGENT}) as session:
+        for file_name, (url, xpath) in CAPTURE_PAGES.items():
+            async with session.get(url) as response:
+                response.raise_for_status()
+                # 네이버 증권은 euc-kr 로 응답하므로 응답 헤더의 인코딩으로 읽습니다.
+                html = await response.text()
+            (NAVER_FIXTURE_DIR / file_name).write_text(trim_page(html, xpath), encoding="utf-8")
+            print(f"{file_name} <- {url}")
+
+
+def make_golden() -> None:
+    parser = SoupNaverHtmlParser()
+
+    def read(file_name: str) -> str:
+        return (NAVER_FIXTURE_DIR / file_name).read_text(encoding="utf-8")
+
+    golden = {
+        "stock_price": {file_name: parser.parse_stock_price(read(file_name)) for file_name in STOCK_PRICE_FILES},
+        "market_indexes": {
+            file_name: {
+                market_index: asdict(market_index_value)
+                for market_index, market_index_value in parser.parse_market_indexes(read(file_name)).items()
+            }
+            for file_name in MARKET_INDEX_FILES
+        },
+        "world_index_rows": {
+            file_name: parser.parse_world_index_rows(read(file_name)) for file_name in WORLD_INDEX_FILES
+        },
+    }
+    (NAVER_FIXTURE_DIR / "golden.json").write_text(
+        json.dumps(golden, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+if __name__ == "__main__":
+    if "--golden" not in sys.argv:
+        asyncio.run(capture())
+    make_golden()
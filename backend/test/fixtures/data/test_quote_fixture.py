@@ -0,0 +1,86 @@
+import pytest
+from aiohttp import web
+
+STUB_QUOTE_PRICE_MAP = {"AAPL": 220.5, "TSLA": 250.0, "005930.KS": 72000.0}
+
+
+@pytest.fixture(scope="function")
+async def stub_quote_server():
+    requested_symbols: list[list[str]] = []
+    # 첫 요청은 429를 돌려주어 재시도 동작을 확인합니다.
+    rate_limited = {"remaining": 1}
+
+    async def quote_handler(request: web.Request) -> web.Response:
+        if rate_limited["remaining"] > 0:
+            rate_limited["remaining"] -= 1
+            return web.Response(status=429)
+
+        symbols = request.query["symbols"].split(",")
+        requested_symbols.append(symbols)
+        return web.json_response(
+            {
+                "quoteResponse": {
+                    "result": [
+                        {"symbol": symbol, "bid": 0, "regularMarketPrice": STUB_QUOTE_PRICE_MAP[symbol]}
+                        for symbol in symbols
+                        if symbol in STUB_QUOTE_PRICE_MAP
+                    ]
+                }
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/v7/finance/quote", quote_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}/v7/finance/quote", requested_symbols
+
+    await runner.cleanup()
+
+
+@pytest.fixture(scope="function")
+async def stub_crumb_quote_server():
+    crumb_request_count = {"count": 0}
+
+    async def cookie_handler(request: web.Request) -> web.Response:
+        return web.Response(text="")
+
+    async def crumb_handler(request: web.Request) -> web.Response:
+        crumb_request_count["count"] += 1
+        return web.Response(text=f"crumb-{crumb_request_count['count']}")
+
+    async def quote_handler(request: web.Request) -> web.Response:
+        # 처음 발급한 crumb는 만료된 것으로 보고 401을 돌려줍니다.
+        if request.query.get("crumb") != f"crumb-{crumb_request_count['count']}" or crumb_request_count["count"] == 1:
+            return web.Response(status=401)
+
+        symbols = request.query["symbols"].split(",")
+        return web.json_response(
+            {
+                "quoteResponse": {
+                    "result": [
+                        {"symbol": symbol, "bid": 0, "regularMarketPrice": STUB_QUOTE_PRICE_MAP[symbol]}
+                        for symbol in symbols
+                        if symbol in STUB_QUOTE_PRICE_MAP
+                    ]
+                }
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/cookie", cookie_handler)
+    app.router.add_get("/crumb", crumb_handler)
+    app.router.add_get("/v7/finance/quote", quote_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    base_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+    yield f"{base_url}/v7/finance/quote", f"{base_url}/crumb", f"{base_url}/cookie", crumb_request_count
+
+    await runner.cleanup()